@@ -36,6 +36,12 @@ def main():
     output_dir.mkdir()
     print(f"📁 Creata directory: {output_dir}")
     
+    # Genera le varianti pre-ridimensionate degli sprite
+    if Path("sprites").exists():
+        from src.asset_pipeline import build_variants
+        build_variants("sprites")
+        print("🖼️  Generate varianti pre-ridimensionate")
+    
     # Copia assets necessari
     if Path("sprites").exists():
         shutil.copytree("sprites", output_dir / "sprites")
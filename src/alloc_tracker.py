@@ -0,0 +1,274 @@
+"""
+Tracciamento delle allocazioni e delle pause del GC, e taratura del GC
+
+Il tracciamento si attiva con la variabile d'ambiente KQ_ALLOC_TRACK
+(KQ_ALLOC_TRACK=1): tracemalloc registra le allocazioni per riga di codice
+e ogni ALLOC_REPORT_TICKS tick viene stampato un report con le righe che
+allocano di più (anche oggetti temporanei), quelle che trattengono memoria,
+le raccolte e le pause del GC, normalizzati per tick.
+Da disattivato tick() ritorna subito.
+"""
+from typing import Dict, List, Optional, Tuple
+import atexit
+import gc
+import os
+import sys
+import tracemalloc
+from src.config import ALLOC_TRACK_ENV_VAR, ALLOC_REPORT_TICKS, GC_THRESHOLDS
+from src.hitch import gc_monitor
+
+# File esclusi dal report (il tracciamento stesso)
+_IGNORED_FILES = (tracemalloc.__file__, __file__)
+
+
+def freeze_long_lived_objects() -> None:
+    """
+    Sposta gli oggetti esistenti nella generazione permanente del GC
+
+    Da chiamare dopo il caricamento di un livello: gli oggetti del livello
+    (piattaforme, nemici, sprite, configurazioni) vivono fino al prossimo
+    caricamento, quindi non ha senso riesaminarli a ogni raccolta. Gli
+    oggetti congelati al livello precedente vengono prima scongelati e
+    raccolti, altrimenti resterebbero in memoria per sempre.
+    """
+    gc.unfreeze()
+    gc.collect()
+    gc.freeze()
+
+
+def apply_gc_thresholds() -> Tuple[int, int, int]:
+    """
+    Applica le soglie GC_THRESHOLDS al GC (una volta, all'avvio del gioco)
+
+    Returns:
+        Soglie precedenti, da passare a gc.set_threshold per ripristinarle
+    """
+    previous = gc.get_threshold()
+    if GC_THRESHOLDS is not None:
+        gc.set_threshold(*GC_THRESHOLDS)
+    return previous
+
+
+class AllocationTracker:
+    """
+    Misura le allocazioni per riga di codice e le pause del GC per tick
+
+    Gli oggetti temporanei (copie di liste, Rect, dizionari creati e liberati
+    nello stesso tick) non compaiono negli snapshot di tracemalloc: per
+    vederli il tracker segue l'esecuzione riga per riga (sys.settrace) e a
+    ogni riga attribuisce alla riga precedente il picco di memoria allocata
+    mentre girava, poi azzera il picco. Le righe eseguite fuori da un frame
+    già attivo all'avvio (es. dentro Game._update) vengono così misurate
+    anche se liberano tutto prima della fine del tick. Il report riporta
+    anche la crescita netta tra due report (cache e oggetti dimenticati).
+    """
+
+    def __init__(self, enabled: bool = False, report_interval: int = ALLOC_REPORT_TICKS,
+                 top: int = 10, trace_lines: bool = True):
+        """
+        Inizializza il tracker
+
+        Args:
+            enabled: True per avviare subito tracemalloc
+            report_interval: Tick tra un report e l'altro (0 = solo su richiesta)
+            top: Righe di codice mostrate nel report
+            trace_lines: True per attribuire le allocazioni temporanee alle righe
+                (molto più lento; False misura solo il picco per tick)
+        """
+        self.enabled = False
+        self.report_interval = report_interval
+        self.top = top
+        self.trace_lines = trace_lines
+        self.ticks = 0
+        self.max_tick_peak = 0
+        self.last_report: Optional[Dict[str, object]] = None
+
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+        self._started_tracemalloc = False
+        self._previous_trace = None
+        self._tick_start_memory = 0
+        self._tick_peak_memory = 0
+        self._gc_collections = [0, 0, 0]
+        self._gc_pause = 0.0
+
+        # Allocazioni temporanee per riga: (file, riga) -> [byte, allocazioni]
+        self._line_allocations: Dict[Tuple[str, int], List[int]] = {}
+        self._line_site: Optional[Tuple[str, int]] = None
+        self._line_memory = 0
+
+        if enabled:
+            self.start()
+
+    def start(self) -> None:
+        """Avvia tracemalloc (e il tracciamento delle righe) e azzera la finestra di misura"""
+        if self.enabled:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        gc_monitor.install()
+        self.enabled = True
+        self._reset_window()
+        if self.trace_lines:
+            self._previous_trace = sys.gettrace()
+            self._line_site = None
+            self._line_memory = tracemalloc.get_traced_memory()[0]
+            sys.settrace(self._trace)
+            atexit.register(self.stop)  # Nessun tracciamento durante la chiusura dell'interprete
+
+    def stop(self) -> None:
+        """Ferma il tracciamento (e tracemalloc, se l'ha avviato il tracker)"""
+        if self.enabled and self.trace_lines:
+            sys.settrace(self._previous_trace)
+            self._previous_trace = None
+            atexit.unregister(self.stop)
+        if self.enabled:
+            gc_monitor.uninstall()
+        self.enabled = False
+        self._snapshot = None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def _reset_window(self) -> None:
+        """Inizia una nuova finestra di misura"""
+        self.ticks = 0
+        self.max_tick_peak = 0
+        self._line_allocations.clear()
+        self._snapshot = self._take_snapshot()
+        self._gc_collections[:] = gc_monitor.collections
+        self._gc_pause = gc_monitor.pause_seconds
+        tracemalloc.reset_peak()
+        self._tick_start_memory = self._tick_peak_memory = tracemalloc.get_traced_memory()[0]
+        self._line_memory = self._tick_start_memory
+
+    def _take_snapshot(self) -> tracemalloc.Snapshot:
+        """Scatta uno snapshot senza le allocazioni del tracciamento stesso"""
+        return tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, filename) for filename in _IGNORED_FILES]
+        )
+
+    def _trace(self, frame, event: str, arg):
+        """
+        Callback di sys.settrace: chiude la misura della riga precedente
+
+        Il picco dall'ultimo evento, meno la memoria di allora, è quanto ha
+        allocato la riga precedente (anche se l'ha già liberato). Il codice
+        del tracker non viene seguito: tick() e report() azzerano il picco.
+        """
+        code = frame.f_code
+        if code.co_filename in _IGNORED_FILES:
+            return None
+        current, peak = tracemalloc.get_traced_memory()
+        if peak > self._tick_peak_memory:
+            self._tick_peak_memory = peak
+        allocated = peak - self._line_memory
+        site = self._line_site
+        if allocated > 0 and site is not None:
+            entry = self._line_allocations.get(site)
+            if entry is None:
+                self._line_allocations[site] = [allocated, 1]
+            else:
+                entry[0] += allocated
+                entry[1] += 1
+
+        self._line_site = (code.co_filename, frame.f_lineno)
+        tracemalloc.reset_peak()
+        self._line_memory = tracemalloc.get_traced_memory()[0]
+        return self._trace
+
+    def tick(self) -> None:
+        """Chiude la misura di un tick; ogni report_interval tick stampa il report"""
+        if not self.enabled:
+            return
+        current, peak = tracemalloc.get_traced_memory()
+        peak = max(peak, self._tick_peak_memory)
+        self.max_tick_peak = max(self.max_tick_peak, peak - self._tick_start_memory)
+        tracemalloc.reset_peak()
+        self._tick_start_memory = self._tick_peak_memory = current
+        self._line_memory = current
+        self.ticks += 1
+
+        if self.report_interval and self.ticks >= self.report_interval:
+            self.print_report(self.report())
+
+    def report(self) -> Dict[str, object]:
+        """
+        Calcola il report della finestra corrente e ne inizia una nuova
+
+        Returns:
+            Dizionario con tick, allocazioni temporanee e trattenute per riga
+            di codice e statistiche del GC
+        """
+        ticks = max(1, self.ticks)
+        tracing = self.enabled and self.trace_lines
+        if tracing:
+            sys.settrace(None)  # Nessuna riga registrata durante il report (es. callback del GC)
+
+        lines = sorted(self._line_allocations.items(), key=lambda item: item[1][0], reverse=True)
+        sites: List[Dict[str, object]] = [{
+            'site': f"{filename}:{lineno}",
+            'bytes_per_tick': size / ticks,
+            'allocs_per_tick': count / ticks,
+        } for (filename, lineno), (size, count) in lines[:self.top]]
+
+        snapshot = self._take_snapshot()
+        stats = snapshot.compare_to(self._snapshot, 'lineno')
+        retained_sites: List[Dict[str, object]] = []
+        for stat in stats[:self.top]:
+            frame = stat.traceback[0]
+            retained_sites.append({
+                'site': f"{frame.filename}:{frame.lineno}",
+                'blocks_per_tick': stat.count_diff / ticks,
+                'bytes_per_tick': stat.size_diff / ticks,
+                'blocks_total': stat.count,
+            })
+
+        collections = [now - before for now, before
+                       in zip(gc_monitor.collections, self._gc_collections)]
+        pause_ms = (gc_monitor.pause_seconds - self._gc_pause) * 1000
+
+        report = {
+            'ticks': self.ticks,
+            'sites': sites,
+            'retained_sites': retained_sites,
+            'max_tick_peak_bytes': self.max_tick_peak,
+            'gc_collections': collections,
+            'gc_collections_per_tick': sum(collections) / ticks,
+            'gc_pause_ms_per_tick': pause_ms / ticks,
+            'gc_pause_ms_total': pause_ms,
+            'gc_frozen_objects': gc.get_freeze_count(),
+        }
+        self.last_report = report
+        self._reset_window()
+        if tracing:
+            sys.settrace(self._trace)
+        return report
+
+    @staticmethod
+    def print_report(report: Dict[str, object]) -> None:
+        """
+        Stampa un report in forma leggibile
+
+        Args:
+            report: Report restituito da report()
+        """
+        print(f"🧮 Allocazioni su {report['ticks']} tick "
+              f"(picco temporaneo per tick: {report['max_tick_peak_bytes'] / 1024:.1f} KiB)")
+        for site in report['sites']:
+            print(f"   {site['allocs_per_tick']:8.2f} alloc/tick "
+                  f"{site['bytes_per_tick']:10.1f} B/tick  {site['site']}")
+        if report['retained_sites']:
+            print("   Crescita netta:")
+        for site in report['retained_sites']:
+            print(f"   {site['blocks_per_tick']:+8.2f} blocchi/tick "
+                  f"{site['bytes_per_tick']:+10.1f} B/tick  {site['site']}")
+        print(f"   GC: raccolte {report['gc_collections']} "
+              f"({report['gc_collections_per_tick']:.3f}/tick), "
+              f"pausa {report['gc_pause_ms_per_tick']:.3f} ms/tick "
+              f"({report['gc_pause_ms_total']:.1f} ms totali), "
+              f"oggetti congelati {report['gc_frozen_objects']}")
+
+
+# Istanza globale del tracker (attivo solo con la variabile d'ambiente)
+alloc_tracker = AllocationTracker(enabled=os.environ.get(ALLOC_TRACK_ENV_VAR, "") not in ("", "0"))
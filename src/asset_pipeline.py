@@ -0,0 +1,211 @@
+"""
+Pipeline offline degli asset: genera varianti pre-ridimensionate degli sprite
+
+Gli sprite in sprites/ sono PNG da diversi megabyte, ma il gioco li usa solo
+a poche dimensioni fisse. Questo script produce una variante per ogni
+dimensione richiesta in sprites/generated/, insieme a un manifest che lo
+SpriteManager consulta prima di decodificare l'immagine originale.
+
+Uso:
+    python -m src.asset_pipeline [cartella_sprite]
+"""
+from typing import Dict, List, Optional, Tuple
+import hashlib
+import json
+import os
+import sys
+import pygame
+
+GENERATED_DIR = "generated"
+MANIFEST_FILE = "manifest.json"
+MANIFEST_VERSION = 2
+
+
+def get_sprite_variants() -> List[Tuple[str, Tuple[int, int]]]:
+    """
+    Restituisce tutte le coppie (sprite, dimensione) richieste dal gioco
+
+    Returns:
+        Lista di tuple (nome sprite, (width, height))
+    """
+    from src.level import LevelManager
+
+    # Unione dei manifest di tutti i livelli
+    variants: List[Tuple[str, Tuple[int, int]]] = []
+    for config in LevelManager().levels_config.values():
+        for asset in config.get_asset_manifest():
+            if asset not in variants:
+                variants.append(asset)
+
+    return variants
+
+
+def get_variant_key(name: str, size: Tuple[int, int]) -> str:
+    """
+    Restituisce la chiave del manifest per una variante
+
+    Args:
+        name: Nome dello sprite (senza estensione)
+        size: Dimensione (width, height)
+
+    Returns:
+        Chiave nel formato "nome@WxH"
+    """
+    return f"{name}@{size[0]}x{size[1]}"
+
+
+def get_file_digest(path: str) -> Optional[str]:
+    """
+    Restituisce l'hash del contenuto di un file
+
+    Args:
+        path: Percorso del file
+
+    Returns:
+        Hash esadecimale, None se il file non è leggibile
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        with open(path, "rb") as source_file:
+            for chunk in iter(lambda: source_file.read(1 << 20), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def load_manifest(sprite_path: str) -> Dict[str, dict]:
+    """
+    Carica il manifest delle varianti generate
+
+    Args:
+        sprite_path: Cartella degli sprite originali
+
+    Returns:
+        Dizionario chiave -> voce del manifest (vuoto se assente o non valido)
+    """
+    manifest_path = os.path.join(sprite_path, GENERATED_DIR, MANIFEST_FILE)
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as manifest_file:
+            manifest = json.load(manifest_file)
+    except (OSError, ValueError):
+        return {}
+
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest.get("variants", {})
+
+
+def find_variant(manifest: Dict[str, dict], sprite_path: str, name: str,
+                 size: Tuple[int, int]) -> Optional[str]:
+    """
+    Cerca la variante pre-ridimensionata ancora valida per uno sprite
+
+    La variante è valida se l'originale ha la stessa dimensione e lo stesso
+    hash registrati nel manifest. L'hash viene ricalcolato solo se l'mtime
+    è cambiato (checkout, copia o pacchetto web): l'mtime da solo non basta
+    a dire che l'immagine è diversa.
+
+    Args:
+        manifest: Voci del manifest (da load_manifest)
+        sprite_path: Cartella degli sprite originali
+        name: Nome dello sprite (senza estensione)
+        size: Dimensione (width, height) richiesta
+
+    Returns:
+        Percorso del file della variante, None se assente o non aggiornata
+    """
+    entry = manifest.get(get_variant_key(name, size))
+    if entry is None:
+        return None
+
+    source_path = os.path.join(sprite_path, f"{name}.png")
+    variant_path = os.path.join(sprite_path, GENERATED_DIR, entry["file"])
+    try:
+        stat = os.stat(source_path)
+    except OSError:
+        stat = None  # Originale non distribuito: la variante basta da sola
+
+    if stat is not None:
+        if stat.st_size != entry["source_size"]:
+            return None  # L'originale è cambiato: variante da rigenerare
+        if (stat.st_mtime != entry["source_mtime"] and
+                get_file_digest(source_path) != entry["source_hash"]):
+            return None
+
+    return variant_path if os.path.exists(variant_path) else None
+
+
+def build_variants(sprite_path: str = "sprites",
+                   variants_list: Optional[List[Tuple[str, Tuple[int, int]]]] = None
+                   ) -> Dict[str, dict]:
+    """
+    Genera le varianti pre-ridimensionate e scrive il manifest
+
+    Args:
+        sprite_path: Cartella degli sprite originali
+        variants_list: Varianti da generare, None per tutte quelle del gioco
+
+    Returns:
+        Voci del manifest scritto
+    """
+    output_dir = os.path.join(sprite_path, GENERATED_DIR)
+    os.makedirs(output_dir, exist_ok=True)
+
+    previous = load_manifest(sprite_path)
+    variants: Dict[str, dict] = {}
+
+    if variants_list is None:
+        variants_list = get_sprite_variants()
+
+    for name, size in variants_list:
+        source_path = os.path.join(sprite_path, f"{name}.png")
+        if not os.path.exists(source_path):
+            print(f"⚠️ Sprite non trovato: {source_path}")
+            continue
+
+        key = get_variant_key(name, size)
+        file_name = f"{name.replace(' ', '_')}_{size[0]}x{size[1]}.png"
+        entry = {
+            "file": file_name,
+            "source_size": os.path.getsize(source_path),
+            "source_hash": get_file_digest(source_path),
+            "source_mtime": os.path.getmtime(source_path),
+        }
+        variants[key] = entry
+
+        previous_entry = previous.get(key, {})
+        if (previous_entry.get("file") == file_name and
+                previous_entry.get("source_hash") == entry["source_hash"] and
+                os.path.exists(os.path.join(output_dir, file_name))):
+            print(f"⏭️  Variante aggiornata: {key}")
+            continue
+
+        # smoothscale offline: qualità migliore dello scale usato a runtime
+        image = pygame.image.load(source_path)
+        if image.get_bitsize() not in (24, 32):
+            # smoothscale accetta solo superfici a 24/32 bit
+            converted = pygame.Surface(image.get_size(), pygame.SRCALPHA, 32)
+            converted.blit(image, (0, 0))
+            image = converted
+        scaled = pygame.transform.smoothscale(image, size)
+        pygame.image.save(scaled, os.path.join(output_dir, file_name))
+        print(f"✅ Variante generata: {key} -> {file_name}")
+
+    manifest = {"version": MANIFEST_VERSION, "variants": variants}
+    with open(os.path.join(output_dir, MANIFEST_FILE), "w", encoding="utf-8") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+
+    return variants
+
+
+def main() -> None:
+    """Entry point da riga di comando"""
+    sprite_path = sys.argv[1] if len(sys.argv) > 1 else "sprites"
+    print("🎨 Knight's Quest - Pipeline asset")
+    variants = build_variants(sprite_path)
+    print(f"📁 {len(variants)} varianti in {os.path.join(sprite_path, GENERATED_DIR)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,447 @@
+"""
+Benchmark headless del game loop
+
+Ogni scenario costruisce un Game headless, esegue N tick chiamando a mano
+le fasi del loop (eventi, aggiornamento, collisioni, disegno) e ne misura i
+tempi. I risultati possono essere salvati in JSON e confrontati con una
+baseline salvata in precedenza, per intercettare le regressioni prima del
+deploy web.
+
+Uso:
+    python -m src.bench [--ticks N] [--scenario NOME ...] [--output risultati.json]
+                        [--baseline baseline.json] [--threshold 0.10]
+"""
+from array import array
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import pygame
+from src.config import (
+    SCREEN_WIDTH, GROUND_Y, PLAYER_MAX_HEALTH, COLLECTIBLE_SIZE,
+    KEY_LEFT, KEY_RIGHT, KEY_JUMP, KEY_ATTACK,
+    GAME_STATE_MENU, GAME_STATE_PLAYING
+)
+from src.game import Game
+from src.physics import PhysicsWorld
+from src.alloc_tracker import AllocationTracker
+from src.enemy import DemonArmed
+from src.collectible import Gold
+
+PHASES = ("events", "update", "collisions", "draw", "frame")
+DEFAULT_TICKS = 600
+DEFAULT_WARMUP_TICKS = 60
+DEFAULT_THRESHOLD = 0.10
+ALLOC_SAMPLE_TICKS = 60  # Tick extra sotto tracemalloc per le allocazioni temporanee
+
+
+@dataclass
+class Scenario:
+    """Scenario di benchmark"""
+    name: str
+    description: str
+    setup: Callable[[], Game]
+    scripted_input: bool = True  # Il player si muove, salta e attacca
+
+
+def _create_level_game(level_number: int) -> Game:
+    """
+    Crea un gioco headless già in PLAYING sul livello indicato
+
+    Args:
+        level_number: Livello da avviare
+
+    Returns:
+        Game pronto per il benchmark
+    """
+    game = Game(headless=True)
+    game._start_level(level_number)
+    game._complete_preload()
+    game.state = GAME_STATE_PLAYING
+    return game
+
+
+def _create_demon_arena() -> Game:
+    """500 demoni sparsi sul terreno del livello 1"""
+    game = _create_level_game(1)
+    game.enemies = [
+        DemonArmed(random.randint(0, SCREEN_WIDTH - 56), GROUND_Y - 74)
+        for _ in range(500)
+    ]
+    return game
+
+
+def _create_coin_field() -> Game:
+    """1000 monete d'oro sparse sopra il terreno, nessun nemico"""
+    game = _create_level_game(1)
+    game.enemies.clear()
+    game.collectibles = [
+        Gold(random.randint(0, SCREEN_WIDTH - COLLECTIBLE_SIZE),
+             random.randint(100, GROUND_Y - COLLECTIBLE_SIZE))
+        for _ in range(1000)
+    ]
+    return game
+
+
+def _create_menu_idle() -> Game:
+    """Menu principale senza input"""
+    game = Game(headless=True)
+    game._complete_preload()
+    game.state = GAME_STATE_MENU
+    return game
+
+
+SCENARIOS: Dict[str, Scenario] = {}
+for _level in range(1, 6):
+    SCENARIOS[f"level{_level}"] = Scenario(
+        f"level{_level}", f"Livello {_level} con nemici e tesori di default",
+        lambda level=_level: _create_level_game(level)
+    )
+SCENARIOS["demon_arena"] = Scenario("demon_arena", "Arena con 500 demoni", _create_demon_arena)
+SCENARIOS["coin_field"] = Scenario("coin_field", "Campo con 1000 monete", _create_coin_field,
+                                   scripted_input=False)
+SCENARIOS["menu_idle"] = Scenario("menu_idle", "Menu principale inattivo", _create_menu_idle,
+                                  scripted_input=False)
+
+
+def get_scripted_keys(tick: int) -> Dict[int, bool]:
+    """
+    Restituisce l'input deterministico del player per un tick
+
+    Args:
+        tick: Numero del tick
+
+    Returns:
+        Dizionario dei tasti premuti
+    """
+    return {
+        KEY_RIGHT: tick % 200 < 100,
+        KEY_LEFT: tick % 200 >= 100,
+        KEY_JUMP: tick % 50 == 0,
+        KEY_ATTACK: tick % 20 == 0,
+    }
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """
+    Calcola un percentile (nearest-rank) su valori già ordinati
+
+    Args:
+        sorted_values: Valori in ordine crescente
+        pct: Percentile tra 0 e 100
+
+    Returns:
+        Valore del percentile, 0.0 se non ci sono valori
+    """
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def summarize(samples: Sequence[float]) -> Dict[str, float]:
+    """
+    Riassume i tempi di una fase in millisecondi
+
+    Args:
+        samples: Durate in secondi
+
+    Returns:
+        Dizionario con media, p50, p95 e p99 in millisecondi
+    """
+    ordered = sorted(samples)
+    mean = sum(ordered) / len(ordered) if ordered else 0.0
+    return {
+        'mean_ms': mean * 1000,
+        'p50_ms': percentile(ordered, 50) * 1000,
+        'p95_ms': percentile(ordered, 95) * 1000,
+        'p99_ms': percentile(ordered, 99) * 1000,
+    }
+
+
+def run_scenario(scenario: Scenario, ticks: int = DEFAULT_TICKS,
+                 warmup_ticks: int = DEFAULT_WARMUP_TICKS) -> Dict[str, object]:
+    """
+    Esegue uno scenario e ne misura le fasi
+
+    Il player viene curato e lo stato ripristinato a ogni tick, così lo
+    scenario resta sotto carico anche se il player muore o il livello finisce.
+    Oltre ai tempi misura il picco di memoria temporanea allocata in un tick
+    (tracemalloc) e la crescita netta dei blocchi trattenuti.
+
+    Args:
+        scenario: Scenario da eseguire
+        ticks: Tick misurati
+        warmup_ticks: Tick eseguiti prima della misura (cache, sprite, testo)
+
+    Returns:
+        Risultati dello scenario
+    """
+    random.seed(0)
+    game = scenario.setup()
+    expected_state = game.state
+
+    # Buffer preallocati: la misura non deve allocare oggetti durante i tick
+    samples = {phase: array('d', bytes(8 * ticks)) for phase in PHASES}
+    slot = [0]  # Indice del tick misurato (il riscaldamento riscrive lo slot 0)
+
+    # Le collisioni sono chiamate da _update: le misuriamo a parte
+    handle_collisions = game._handle_collisions
+
+    def timed_collisions() -> None:
+        start = time.perf_counter()
+        handle_collisions()
+        samples["collisions"][slot[0]] = time.perf_counter() - start
+
+    game._handle_collisions = timed_collisions
+
+    def step(tick: int) -> None:
+        if scenario.scripted_input:
+            game.keys_pressed = get_scripted_keys(tick)
+
+        frame_start = time.perf_counter()
+        game._handle_events()
+        events_end = time.perf_counter()
+        game._update()
+        update_end = time.perf_counter()
+        game._draw()
+        draw_end = time.perf_counter()
+
+        index = slot[0]
+        samples["events"][index] = events_end - frame_start
+        samples["update"][index] = update_end - events_end
+        samples["draw"][index] = draw_end - update_end
+        samples["frame"][index] = draw_end - frame_start
+
+        if game.state != expected_state:
+            game.state = expected_state
+        game.player.health = PLAYER_MAX_HEALTH
+
+    for tick in range(warmup_ticks):
+        step(tick)
+    samples["collisions"][0] = 0.0
+
+    gc_before = [stats['collections'] for stats in gc.get_stats()]
+    blocks_before = sys.getallocatedblocks()
+    start = time.perf_counter()
+    for tick in range(warmup_ticks, warmup_ticks + ticks):
+        slot[0] = tick - warmup_ticks
+        step(tick)
+    elapsed = time.perf_counter() - start
+    blocks_after = sys.getallocatedblocks()
+    gc_after = [stats['collections'] for stats in gc.get_stats()]
+    phases = {phase: summarize(samples[phase]) for phase in PHASES}
+
+    # Allocazioni temporanee per tick: qualche tick in più sotto tracemalloc,
+    # fuori dalla misura dei tempi (tracemalloc rallenta molto il loop).
+    # I tick riscrivono i campioni, già riassunti sopra.
+    tracker = AllocationTracker(enabled=True, report_interval=0, trace_lines=False)
+    first_tick = warmup_ticks + ticks
+    for tick in range(first_tick, first_tick + min(ticks, ALLOC_SAMPLE_TICKS)):
+        slot[0] = tick - first_tick
+        step(tick)
+        tracker.tick()
+    tick_alloc_peak = tracker.max_tick_peak
+    tracker.stop()
+
+    pygame.quit()
+
+    return {
+        'description': scenario.description,
+        'ticks': ticks,
+        'ticks_per_sec': ticks / elapsed if elapsed > 0 else 0.0,
+        'phases': phases,
+        'tick_alloc_peak_bytes': tick_alloc_peak,
+        'retained_blocks_per_tick': (blocks_after - blocks_before) / ticks,
+        'gc_collections': [after - before for before, after in zip(gc_before, gc_after)],
+    }
+
+
+def run_physics_comparison(bodies: int = 500, ticks: int = DEFAULT_TICKS) -> Dict[str, float]:
+    """
+    Confronta il passo del PhysicsWorld con la fisica per entità (Enemy.update)
+
+    Entrambi i percorsi simulano gli stessi demoni sul livello 1, con un
+    quarto che cammina e qualcuno che salta a ogni tick; si misura solo la
+    fisica (gravità, piattaforme, terreno), non l'IA.
+
+    Args:
+        bodies: Numero di demoni
+        ticks: Tick misurati
+
+    Returns:
+        Microsecondi per tick dei due percorsi e rapporto tra i due
+    """
+    game = _create_level_game(1)
+    platforms = game.get_platform_index()
+    terrain = game.get_terrain()
+
+    def spawn() -> List[DemonArmed]:
+        rng = random.Random(0)
+        return [DemonArmed(rng.randint(0, SCREEN_WIDTH - 56), GROUND_Y - 74)
+                for _ in range(bodies)]
+
+    def drive(demons: List[DemonArmed], tick: int) -> None:
+        for index in range(tick % 4, len(demons), 4):
+            demons[index].x += 1 if tick % 200 < 100 else -1
+        jumper = demons[tick % len(demons)]
+        if jumper.on_ground:
+            jumper.vel_y = -12
+            jumper.on_ground = False
+
+    def per_entity(demons: List[DemonArmed]) -> None:
+        for demon in demons:
+            demon._apply_gravity()
+            demon._update_position(platforms, terrain)
+
+    world = PhysicsWorld()
+    world_demons = spawn()
+    world.sync(game.player, world_demons)
+
+    def batched(demons: List[DemonArmed]) -> None:
+        world.step(platforms, terrain)
+
+    timings = {}
+    for name, step, demons in (("per_entity", per_entity, spawn()),
+                               ("physics_world", batched, world_demons)):
+        elapsed = 0.0
+        for tick in range(ticks):
+            drive(demons, tick)
+            start = time.perf_counter()
+            step(demons)
+            elapsed += time.perf_counter() - start
+        timings[f"{name}_us_per_tick"] = elapsed / ticks * 1e6
+
+    pygame.quit()
+    timings['speedup'] = (timings['per_entity_us_per_tick'] /
+                          timings['physics_world_us_per_tick'])
+    return timings
+
+
+def compare_results(results: Dict[str, dict], baseline: Dict[str, dict],
+                    threshold: float = DEFAULT_THRESHOLD) -> List[str]:
+    """
+    Confronta i risultati con una baseline
+
+    Args:
+        results: Scenari appena misurati
+        baseline: Scenari della baseline
+        threshold: Peggioramento relativo tollerato (0.10 = 10%)
+
+    Returns:
+        Descrizioni delle regressioni trovate (vuota se nessuna)
+    """
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+
+        old_rate = reference['ticks_per_sec']
+        new_rate = result['ticks_per_sec']
+        if old_rate > 0 and new_rate < old_rate * (1 - threshold):
+            regressions.append(
+                f"{name}: ticks/s {old_rate:.0f} -> {new_rate:.0f} ({new_rate / old_rate - 1:+.0%})"
+            )
+
+        for phase in PHASES:
+            old_p95 = reference['phases'].get(phase, {}).get('p95_ms', 0.0)
+            new_p95 = result['phases'][phase]['p95_ms']
+            if old_p95 > 0 and new_p95 > old_p95 * (1 + threshold):
+                regressions.append(
+                    f"{name}: {phase} p95 {old_p95:.3f}ms -> {new_p95:.3f}ms "
+                    f"({new_p95 / old_p95 - 1:+.0%})"
+                )
+    return regressions
+
+
+def print_results(results: Dict[str, dict]) -> None:
+    """Stampa una tabella riassuntiva dei risultati"""
+    print(f"{'scenario':<12} {'ticks/s':>9} " +
+          " ".join(f"{phase + ' p50/p95/p99 ms':>28}" for phase in PHASES[1:]) +
+          f" {'alloc peak KB':>13} {'retained/tick':>13}")
+    for name, result in results.items():
+        phases = " ".join(
+            f"{p['p50_ms']:>8.3f}/{p['p95_ms']:>8.3f}/{p['p99_ms']:>8.3f}"
+            for p in (result['phases'][phase] for phase in PHASES[1:])
+        )
+        print(f"{name:<12} {result['ticks_per_sec']:>9.0f} {phases} "
+              f"{result['tick_alloc_peak_bytes'] / 1024:>13.1f} "
+              f"{result['retained_blocks_per_tick']:>13.2f}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Entry point da riga di comando
+
+    Returns:
+        0 se non ci sono regressioni, 1 altrimenti
+    """
+    parser = argparse.ArgumentParser(description="Knight's Quest - Benchmark headless")
+    parser.add_argument("--ticks", type=int, default=DEFAULT_TICKS, help="Tick misurati per scenario")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP_TICKS, help="Tick di riscaldamento")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="Scenario da eseguire (ripetibile, default: tutti)")
+    parser.add_argument("--output", help="File JSON in cui salvare i risultati")
+    parser.add_argument("--baseline", help="File JSON di una baseline da confrontare")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Peggioramento relativo tollerato rispetto alla baseline")
+    parser.add_argument("--list", action="store_true", help="Elenca gli scenari ed esce")
+    parser.add_argument("--physics", action="store_true",
+                        help="Confronta PhysicsWorld con la fisica per entità ed esce")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for scenario in SCENARIOS.values():
+            print(f"{scenario.name:<12} {scenario.description}")
+        return 0
+
+    if args.physics:
+        timings = run_physics_comparison(ticks=args.ticks)
+        print(f"per entità: {timings['per_entity_us_per_tick']:.1f} µs/tick, "
+              f"PhysicsWorld: {timings['physics_world_us_per_tick']:.1f} µs/tick "
+              f"({timings['speedup']:.2f}x)")
+        return 0
+
+    results = {}
+    for name in args.scenario or list(SCENARIOS):
+        print(f"⏱️  {name}...")
+        results[name] = run_scenario(SCENARIOS[name], args.ticks, args.warmup)
+
+    print_results(results)
+
+    if args.output:
+        report = {
+            'meta': {
+                'python': platform.python_version(),
+                'pygame': pygame.version.ver,
+                'platform': platform.platform(),
+                'ticks': args.ticks,
+            },
+            'scenarios': results,
+        }
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(report, output_file, indent=2)
+        print(f"📁 Risultati salvati in {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)['scenarios']
+        regressions = compare_results(results, baseline, args.threshold)
+        if regressions:
+            print("❌ Regressioni rispetto alla baseline:")
+            for regression in regressions:
+                print(f"   {regression}")
+            return 1
+        print("✅ Nessuna regressione rispetto alla baseline")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,7 @@
 """
 Classi per gli oggetti collezionabili del gioco
 """
-from typing import Tuple
+from typing import Dict, Tuple
 import pygame
 import random
 from abc import ABC, abstractmethod
@@ -10,11 +10,19 @@ from src.config import (
     GOLD_HEAL_AMOUNT, SILVER_HEAL_AMOUNT, MYRRH_HEAL_AMOUNT,
     GROUND_Y, SCREEN_WIDTH, GOLD, SILVER, WHITE, BLACK
 )
+from src.font_registry import font_registry
+
+# Ampiezza in pixel dell'oscillazione verticale dei collezionabili
+FLOAT_AMPLITUDE = 5
 
 
 class Collectible(ABC):
     """Classe base astratta per tutti gli oggetti collezionabili"""
     
+    # Sprite condivisi da tutte le istanze di un tipo (flyweight),
+    # con chiave (classe, fase dell'animazione)
+    _sprite_cache: Dict[Tuple[type, int], pygame.Surface] = {}
+    
     def __init__(self, x: int, y: int, value: int, heal_amount: int = 0):
         """
         Inizializza l'oggetto collezionabile
@@ -35,7 +43,7 @@ class Collectible(ABC):
         # Animazione
         self.float_timer = 0
         self.float_speed = 2
-        self.float_amplitude = 5
+        self.float_amplitude = FLOAT_AMPLITUDE
         self.start_y = y
         
         # Rect per collision detection
@@ -92,15 +100,65 @@ class Collectible(ABC):
         """
         pass
         
+    @classmethod
+    def get_sprite(cls, phase: int = 0) -> pygame.Surface:
+        """
+        Restituisce lo sprite condiviso del tipo, disegnandolo solo la prima volta
+        
+        Args:
+            phase: Fase dell'animazione (usata dalla mirra per lo scintillio)
+            
+        Returns:
+            Superficie con trasparenza grande COLLECTIBLE_SIZE x COLLECTIBLE_SIZE
+        """
+        key = (cls, phase)
+        sprite = Collectible._sprite_cache.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((COLLECTIBLE_SIZE, COLLECTIBLE_SIZE), pygame.SRCALPHA)
+            cls._render_artwork(sprite, COLLECTIBLE_SIZE, phase)
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert_alpha()
+            Collectible._sprite_cache[key] = sprite
+        return sprite
+        
+    @classmethod
+    def clear_sprite_cache(cls) -> None:
+        """Svuota la cache degli sprite condivisi"""
+        Collectible._sprite_cache.clear()
+        
+    @classmethod
     @abstractmethod
+    def _render_artwork(cls, surface: pygame.Surface, size: int, phase: int) -> None:
+        """
+        Disegna la grafica del tipo sulla superficie dello sprite
+        
+        Args:
+            surface: Superficie dello sprite (origine in alto a sinistra)
+            size: Lato dello sprite
+            phase: Fase dell'animazione
+        """
+        pass
+        
+    def get_animation_phase(self) -> int:
+        """
+        Restituisce la fase dell'animazione corrente
+        
+        Returns:
+            Indice della fase (0 per gli oggetti senza animazione)
+        """
+        return 0
+        
     def draw(self, screen: pygame.Surface) -> None:
         """
-        Disegna l'oggetto sullo schermo
+        Disegna l'oggetto sullo schermo con un singolo blit dello sprite condiviso
         
         Args:
             screen: Superficie pygame su cui disegnare
         """
-        pass
+        if self.collected:
+            return
+            
+        screen.blit(self.get_sprite(self.get_animation_phase()), (self.x, self.y))
 
 
 class Gold(Collectible):
@@ -121,39 +179,37 @@ class Gold(Collectible):
         """Restituisce il tipo di risorsa oro"""
         return self.resource_type
         
-    def draw(self, screen: pygame.Surface) -> None:
+    @classmethod
+    def _render_artwork(cls, surface: pygame.Surface, size: int, phase: int) -> None:
         """
         Disegna la moneta d'oro (più grande e visibile!)
         
         Args:
-            screen: Superficie pygame su cui disegnare
+            surface: Superficie dello sprite
+            size: Lato dello sprite
+            phase: Fase dell'animazione (non usata)
         """
-        if self.collected:
-            return
-            
-        center_x = self.x + self.size // 2
-        center_y = self.y + self.size // 2
-        radius = self.size // 2
+        center_x = size // 2
+        center_y = size // 2
+        radius = size // 2
             
         # Cerchio dorato più luminoso
-        pygame.draw.circle(screen, (255, 223, 0), (center_x, center_y), radius)
+        pygame.draw.circle(surface, (255, 223, 0), (center_x, center_y), radius)
         
         # Cerchio interno per effetto metallico
-        pygame.draw.circle(screen, (255, 239, 150), (center_x, center_y), radius - 3)
+        pygame.draw.circle(surface, (255, 239, 150), (center_x, center_y), radius - 3)
         
         # Bordo scuro più spesso
-        pygame.draw.circle(screen, BLACK, (center_x, center_y), radius, 3)
+        pygame.draw.circle(surface, BLACK, (center_x, center_y), radius, 3)
         
-        # Simbolo $ al centro più grande e visibile
-        font_size = self.size - 6
-        font = pygame.font.Font(None, font_size)
-        text = font.render("$", True, BLACK)
+        # Simbolo $ al centro più grande e visibile (glifo pre-renderizzato)
+        text = font_registry.get_glyph("$", size - 6, BLACK)
         text_rect = text.get_rect(center=(center_x, center_y))
-        screen.blit(text, text_rect)
+        surface.blit(text, text_rect)
         
         # Piccoli riflessi per effetto lucido
-        pygame.draw.circle(screen, WHITE, (center_x - radius//3, center_y - radius//3), 3)
-        pygame.draw.circle(screen, WHITE, (center_x + radius//4, center_y + radius//4), 2)
+        pygame.draw.circle(surface, WHITE, (center_x - radius//3, center_y - radius//3), 3)
+        pygame.draw.circle(surface, WHITE, (center_x + radius//4, center_y + radius//4), 2)
 
 
 class Silver(Collectible):
@@ -174,40 +230,40 @@ class Silver(Collectible):
         """Restituisce il tipo di risorsa argento"""
         return self.resource_type
         
-    def draw(self, screen: pygame.Surface) -> None:
+    @classmethod
+    def _render_artwork(cls, surface: pygame.Surface, size: int, phase: int) -> None:
         """
         Disegna il lingotto d'argento (più grande e dettagliato!)
         
         Args:
-            screen: Superficie pygame su cui disegnare
+            surface: Superficie dello sprite
+            size: Lato dello sprite
+            phase: Fase dell'animazione (non usata)
         """
-        if self.collected:
-            return
-            
         # Rettangolo argentato principale più grande
-        silver_rect = pygame.Rect(self.x + 3, self.y + 5, self.size - 6, self.size - 10)
+        silver_rect = pygame.Rect(3, 5, size - 6, size - 10)
         
         # Gradiente argentato (simulato con rettangoli sovrapposti)
-        pygame.draw.rect(screen, (192, 192, 192), silver_rect)  # Base argento
+        pygame.draw.rect(surface, (192, 192, 192), silver_rect)  # Base argento
         
         # Effetto metallico con sfumature
-        top_rect = pygame.Rect(self.x + 3, self.y + 5, self.size - 6, (self.size - 10) // 3)
-        pygame.draw.rect(screen, (220, 220, 220), top_rect)  # Parte superiore più chiara
+        top_rect = pygame.Rect(3, 5, size - 6, (size - 10) // 3)
+        pygame.draw.rect(surface, (220, 220, 220), top_rect)  # Parte superiore più chiara
         
         # Bordo scuro più spesso
-        pygame.draw.rect(screen, BLACK, silver_rect, 3)
+        pygame.draw.rect(surface, BLACK, silver_rect, 3)
         
         # Linee decorative più spesse e visibili
         line_thickness = 2
-        line1_y = self.y + self.size // 3
-        line2_y = self.y + 2 * self.size // 3
+        line1_y = size // 3
+        line2_y = 2 * size // 3
         
-        pygame.draw.line(screen, WHITE, (self.x + 5, line1_y), (self.x + self.size - 5, line1_y), line_thickness)
-        pygame.draw.line(screen, WHITE, (self.x + 5, line2_y), (self.x + self.size - 5, line2_y), line_thickness)
+        pygame.draw.line(surface, WHITE, (5, line1_y), (size - 5, line1_y), line_thickness)
+        pygame.draw.line(surface, WHITE, (5, line2_y), (size - 5, line2_y), line_thickness)
         
         # Riflessi sui bordi
-        pygame.draw.line(screen, WHITE, (self.x + 4, self.y + 6), (self.x + 4, self.y + self.size - 6), 1)
-        pygame.draw.line(screen, WHITE, (self.x + self.size - 4, self.y + 6), (self.x + self.size - 4, self.y + self.size - 6), 1)
+        pygame.draw.line(surface, WHITE, (4, 6), (4, size - 6), 1)
+        pygame.draw.line(surface, WHITE, (size - 4, 6), (size - 4, size - 6), 1)
 
 
 class Myrrh(Collectible):
@@ -235,18 +291,28 @@ class Myrrh(Collectible):
         if not self.collected:
             self.sparkle_timer += 1
         
-    def draw(self, screen: pygame.Surface) -> None:
+    def get_animation_phase(self) -> int:
+        """
+        Restituisce la fase dello scintillio
+        
+        Returns:
+            0 mentre scintilla, 1 durante l'alone
+        """
+        # Scintilla ogni mezzo secondo
+        return 0 if self.sparkle_timer % 30 < 15 else 1
+        
+    @classmethod
+    def _render_artwork(cls, surface: pygame.Surface, size: int, phase: int) -> None:
         """
         Disegna la mirra con effetto scintillio (molto più spettacolare!)
         
         Args:
-            screen: Superficie pygame su cui disegnare
+            surface: Superficie dello sprite
+            size: Lato dello sprite
+            phase: 0 per lo scintillio, 1 per l'alone
         """
-        if self.collected:
-            return
-            
-        center_x = self.x + self.size // 2
-        center_y = self.y + self.size // 2
+        center_x = size // 2
+        center_y = size // 2
             
         # Colore base viola/rosso scuro più intenso
         base_color = (138, 43, 226)  # Viola scuro
@@ -254,52 +320,52 @@ class Myrrh(Collectible):
         
         # Forma esagonale (semplificata come rombo) più grande
         points = [
-            (center_x, self.y + 3),  # Top
-            (self.x + self.size - 3, center_y),  # Right
-            (center_x, self.y + self.size - 3),  # Bottom
-            (self.x + 3, center_y)  # Left
+            (center_x, 3),  # Top
+            (size - 3, center_y),  # Right
+            (center_x, size - 3),  # Bottom
+            (3, center_y)  # Left
         ]
         
         # Rombo principale
-        pygame.draw.polygon(screen, base_color, points)
+        pygame.draw.polygon(surface, base_color, points)
         
         # Rombo interno per effetto di profondità
         inner_points = [
-            (center_x, self.y + 6),  # Top
-            (self.x + self.size - 6, center_y),  # Right
-            (center_x, self.y + self.size - 6),  # Bottom
-            (self.x + 6, center_y)  # Left
+            (center_x, 6),  # Top
+            (size - 6, center_y),  # Right
+            (center_x, size - 6),  # Bottom
+            (6, center_y)  # Left
         ]
-        pygame.draw.polygon(screen, highlight_color, inner_points)
+        pygame.draw.polygon(surface, highlight_color, inner_points)
         
         # Bordo dorato più spesso
-        pygame.draw.polygon(screen, GOLD, points, 3)
+        pygame.draw.polygon(surface, GOLD, points, 3)
         
         # Effetto scintillio potenziato
-        if self.sparkle_timer % 30 < 15:  # Scintilla ogni mezzo secondo
+        if phase == 0:  # Fase di scintillio
             sparkle_color = WHITE
             
             # Stella scintillante al centro più grande
             star_size = 5
-            pygame.draw.line(screen, sparkle_color, (center_x - star_size, center_y), (center_x + star_size, center_y), 3)
-            pygame.draw.line(screen, sparkle_color, (center_x, center_y - star_size), (center_x, center_y + star_size), 3)
-            pygame.draw.line(screen, sparkle_color, (center_x - 4, center_y - 4), (center_x + 4, center_y + 4), 2)
-            pygame.draw.line(screen, sparkle_color, (center_x - 4, center_y + 4), (center_x + 4, center_y - 4), 2)
+            pygame.draw.line(surface, sparkle_color, (center_x - star_size, center_y), (center_x + star_size, center_y), 3)
+            pygame.draw.line(surface, sparkle_color, (center_x, center_y - star_size), (center_x, center_y + star_size), 3)
+            pygame.draw.line(surface, sparkle_color, (center_x - 4, center_y - 4), (center_x + 4, center_y + 4), 2)
+            pygame.draw.line(surface, sparkle_color, (center_x - 4, center_y + 4), (center_x + 4, center_y - 4), 2)
             
             # Scintille aggiuntive sui vertici
             for point in points:
-                pygame.draw.circle(screen, sparkle_color, point, 2)
+                pygame.draw.circle(surface, sparkle_color, point, 2)
                 
         # Effetto alone se non sta scintillando
         else:
             # Alone viola intorno al diamante
             glow_points = [
-                (center_x, self.y + 1),  # Top
-                (self.x + self.size - 1, center_y),  # Right
-                (center_x, self.y + self.size - 1),  # Bottom
-                (self.x + 1, center_y)  # Left
+                (center_x, 1),  # Top
+                (size - 1, center_y),  # Right
+                (center_x, size - 1),  # Bottom
+                (1, center_y)  # Left
             ]
-            pygame.draw.polygon(screen, (100, 20, 150), glow_points, 2)
+            pygame.draw.polygon(surface, (100, 20, 150), glow_points, 2)
 
 
 def create_random_collectible(x: int, y: int) -> Collectible:
@@ -1,13 +1,48 @@
 """
 Configurazioni globali per Knight's Quest: Il Santo Graal
 """
-from typing import Tuple
+from typing import Optional, Tuple
+import os
 import pygame
 
+# Cartella del progetto (quella che contiene src/), per i file scritti dal gioco
+PROJECT_DIR: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 # Dimensioni schermo
 SCREEN_WIDTH: int = 1024
 SCREEN_HEIGHT: int = 768
-FPS: int = 60
+FPS: int = 60  # Tick di simulazione al secondo (la fisica è tarata per tick)
+MAX_RENDER_FPS: Optional[int] = 144  # Limite dei frame disegnati, None = nessun limite
+MAX_CATCHUP_TICKS: int = 5  # Tick massimi recuperati in un frame dopo un rallentamento
+HEADLESS_YIELD_TICKS: int = 1000  # Tick tra un asyncio.sleep(0) e l'altro in modalità headless
+
+# Rendering
+DIRTY_RECT_RENDERING: bool = True  # Aggiorna solo le regioni modificate durante il gioco
+
+# Cache su disco dei pixel degli sprite decodificati (None per disabilitarla)
+SPRITE_CACHE_DIR: Optional[str] = os.path.join(PROJECT_DIR, ".sprite_cache")
+
+# Memoria massima degli sprite decodificati in RAM (None = nessun limite)
+SPRITE_MEMORY_BUDGET: Optional[int] = 16 * 1024 * 1024
+
+# Frame oltre questa durata vengono registrati come hitch, con le cause
+HITCH_BUDGET_MS: float = 33.0
+HITCH_LOG_PATH: Optional[str] = os.path.join(PROJECT_DIR, "hitches.jsonl")  # None = nessun log
+HITCH_PRINT: bool = False  # True per stampare anche ogni hitch su stdout
+HITCH_LOG_MAX_BYTES: int = 256 * 1024  # Oltre questa dimensione il log ruota in ".1"
+
+# Soglie delle generazioni del GC applicate all'avvio del gioco
+# (None = quelle di Python); gli oggetti di ogni livello vengono congelati
+GC_THRESHOLDS: Optional[Tuple[int, int, int]] = (5000, 20, 100)
+
+# Tracciamento di allocazioni e pause del GC, attivo con KQ_ALLOC_TRACK=1
+ALLOC_TRACK_ENV_VAR: str = "KQ_ALLOC_TRACK"
+ALLOC_REPORT_TICKS: int = 600  # Tick tra un report e l'altro
+
+# Tracing degli span (chrome://tracing / Perfetto), attivo solo se la
+# variabile d'ambiente è impostata: KQ_TRACE=1 oppure KQ_TRACE=traccia.json
+TRACE_ENV_VAR: str = "KQ_TRACE"
+TRACE_BUFFER_SIZE: int = 65536  # Span mantenuti nel buffer circolare
 
 # Colori (RGB)
 BLACK: Tuple[int, int, int] = (0, 0, 0)
@@ -27,6 +62,12 @@ PLAYER_SPEED: int = 5
 PLAYER_JUMP_SPEED: int = -15
 PLAYER_MAX_HEALTH: int = 100
 
+# Lato delle celle della griglia delle collisioni (ogni entità tocca 1-4 celle)
+SPATIAL_HASH_CELL_SIZE: int = 2 * PLAYER_WIDTH
+
+# Larghezza delle colonne dell'indice delle piattaforme
+PLATFORM_INDEX_BUCKET_WIDTH: int = 2 * PLAYER_WIDTH
+
 # Physics
 GRAVITY: int = 1
 GROUND_Y: int = SCREEN_HEIGHT - 100
@@ -37,6 +78,8 @@ KEY_RIGHT: int = pygame.K_RIGHT
 KEY_JUMP: int = pygame.K_SPACE
 KEY_ATTACK: int = pygame.K_x
 KEY_QUIT: int = pygame.K_ESCAPE
+KEY_PROFILER: int = pygame.K_F3  # Mostra/nasconde il profiler
+KEY_TRACE_DUMP: int = pygame.K_F9  # Salva la traccia degli span (con KQ_TRACE)
 
 # Game states
 GAME_STATE_MENU: str = "menu"
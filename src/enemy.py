@@ -1,13 +1,26 @@
 """Classi per i nemici del gioco"""
-from typing import Tuple
+from typing import Optional, Tuple
+import math
 import pygame
 import random
 from abc import ABC, abstractmethod
 from src.config import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, GROUND_Y, RED, BLACK, GRAY,
+    SCREEN_WIDTH, SCREEN_HEIGHT, GRAVITY, RED, BLACK, GRAY,
     DEMON_HP, DEMON_ATTACK_DAMAGE, BOSS_HP, BOSS_ATTACK_DAMAGE
 )
 from src.sprite_manager import sprite_manager
+from src.surface_pool import overlay_pool
+from src.physics import integrate_body
+from src.platform import PlatformIndex
+from src.terrain import TerrainMap
+
+# Area dell'attacco dei nemici, davanti al corpo
+ENEMY_ATTACK_WIDTH = 35
+ENEMY_ATTACK_HEIGHT = 25
+
+# Distanza orizzontale dal player oltre la quale l'IA pattuglia (la soglia più
+# ampia dell'IA): i nemici più lontani non devono calcolare la distanza
+ENEMY_SENSE_RANGE = 250
 
 
 class Enemy(ABC):
@@ -17,6 +30,9 @@ class Enemy(ABC):
         """Inizializza il nemico base"""
         self.x = x
         self.y = y
+        # Posizione al tick precedente, per interpolare il disegno
+        self.prev_x = x
+        self.prev_y = y
         self.width = width
         self.height = height
         self.max_health = health
@@ -42,19 +58,35 @@ class Enemy(ABC):
         # Rect per collision detection
         self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
         
-    def update(self, player_x: int, player_y: int) -> None:
-        """Aggiorna il nemico"""
+    def update(self, player_x: int, player_y: int, platforms: Optional[PlatformIndex] = None,
+               terrain: Optional[TerrainMap] = None) -> None:
+        """Aggiorna il nemico, fisica compresa (sulle piattaforme e sul terreno passati, se presenti)"""
         if not self.is_alive_flag:
             return
             
-        self._update_ai(player_x, player_y)
+        self.update_behavior(player_x, player_y)
         self._apply_gravity()
+        self._update_position(platforms, terrain)
+        
+    def update_behavior(self, player_x: int, player_y: int, near_player: bool = True) -> None:
+        """
+        Aggiorna IA e attacco senza la fisica (eseguita dal PhysicsWorld)
+        
+        Args:
+            player_x: Posizione x del player
+            player_y: Posizione y del player
+            near_player: False se il nemico è sicuramente oltre ENEMY_SENSE_RANGE
+                dal player (trovato con la griglia delle collisioni)
+        """
+        if not self.is_alive_flag:
+            return
+            
+        self._update_ai(player_x, player_y, near_player)
         self._update_attack()
-        self._update_position()
         
-    def _update_ai(self, player_x: int, player_y: int) -> None:
+    def _update_ai(self, player_x: int, player_y: int, near_player: bool = True) -> None:
         """Aggiorna l'IA del nemico"""
-        distance_to_player = abs(player_x - self.x)
+        distance_to_player = abs(player_x - self.x) if near_player else math.inf
         
         if self.ai_state == "patrol":
             self._patrol_behavior()
@@ -66,7 +98,7 @@ class Enemy(ABC):
             # Distanza di attacco ridotta per evitare sovrapposizioni
             if distance_to_player < 70:  # Era 50, ora 70 per più spazio
                 self.ai_state = "attack"
-            elif distance_to_player > 250:
+            elif distance_to_player > ENEMY_SENSE_RANGE:
                 self.ai_state = "patrol"
                 
         elif self.ai_state == "attack":
@@ -106,7 +138,7 @@ class Enemy(ABC):
     def _apply_gravity(self) -> None:
         """Applica la gravità"""
         if not self.on_ground:
-            self.vel_y += 1
+            self.vel_y += GRAVITY
             
     def _update_attack(self) -> None:
         """Aggiorna lo stato dell'attacco"""
@@ -120,22 +152,14 @@ class Enemy(ABC):
         if self.attack_cooldown_timer > 0:
             self.attack_cooldown_timer -= 1
             
-    def _update_position(self) -> None:
-        """Aggiorna la posizione"""
-        self.y += self.vel_y
+    def _update_position(self, platforms: Optional[PlatformIndex] = None,
+                         terrain: Optional[TerrainMap] = None) -> None:
+        """Aggiorna la posizione (gravità già applicata da _apply_gravity)"""
+        self.x, self.y, self.vel_y, self.on_ground = integrate_body(
+            self.x, self.y, self.vel_y, self.width, self.height, self.on_ground,
+            0, platforms, terrain
+        )
         
-        if self.y >= GROUND_Y - self.height:
-            self.y = GROUND_Y - self.height
-            self.vel_y = 0
-            self.on_ground = True
-        else:
-            self.on_ground = False
-            
-        if self.x < 0:
-            self.x = 0
-        elif self.x > SCREEN_WIDTH - self.width:
-            self.x = SCREEN_WIDTH - self.width
-            
         self.rect.x = self.x
         self.rect.y = self.y
         
@@ -151,8 +175,8 @@ class Enemy(ABC):
         if not self.is_attacking:
             return pygame.Rect(0, 0, 0, 0)
             
-        attack_width = 35
-        attack_height = 25
+        attack_width = ENEMY_ATTACK_WIDTH
+        attack_height = ENEMY_ATTACK_HEIGHT
         
         if self.facing_right:
             attack_x = self.x + self.width
@@ -183,9 +207,27 @@ class Enemy(ABC):
         """Restituisce la posizione del nemico"""
         return (self.x, self.y)
         
+    def store_previous_position(self) -> None:
+        """Memorizza la posizione corrente prima di un tick di simulazione"""
+        self.prev_x = self.x
+        self.prev_y = self.y
+        
+    def get_render_position(self, alpha: float = 1.0) -> Tuple[float, float]:
+        """
+        Restituisce la posizione interpolata tra gli ultimi due tick
+        
+        Args:
+            alpha: Frazione di tick trascorsa dall'ultimo aggiornamento (0.0 - 1.0)
+            
+        Returns:
+            Tupla (x, y) in cui disegnare il nemico
+        """
+        return (self.prev_x + (self.x - self.prev_x) * alpha,
+                self.prev_y + (self.y - self.prev_y) * alpha)
+        
     @abstractmethod
-    def draw(self, screen: pygame.Surface) -> None:
-        """Disegna il nemico sullo schermo"""
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0) -> None:
+        """Disegna il nemico sullo schermo (alpha: frazione di tick per l'interpolazione)"""
         pass
 
 
@@ -209,43 +251,42 @@ class DemonArmed(Enemy):
         """Restituisce il danno del demone armato"""
         return BOSS_ATTACK_DAMAGE if self.is_boss else DEMON_ATTACK_DAMAGE
         
-    def draw(self, screen: pygame.Surface) -> None:
-        """Disegna il demone armato sullo schermo"""
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0) -> None:
+        """Disegna il demone armato sullo schermo (alpha: frazione di tick per l'interpolazione)"""
         if not self.is_alive_flag:
             return
             
+        render_x, render_y = self.get_render_position(alpha)
+        
         # Carica lo sprite appropriato (demone normale o boss)
+        # (variante specchiata in cache se il nemico sta guardando a sinistra)
         sprite = sprite_manager.get_enemy_sprite(
             is_boss=self.is_boss,
-            size=(self.width, self.height)
+            size=(self.width, self.height),
+            flip_x=not self.facing_right
         )
         
-        # Capovolgi l'immagine se il nemico sta guardando a sinistra
-        if not self.facing_right:
-            sprite = pygame.transform.flip(sprite, True, False)
-        
         # Disegna lo sprite
-        screen.blit(sprite, (self.x, self.y))
+        screen.blit(sprite, (render_x, render_y))
         
         # Se sta attaccando, disegna un'area di attacco semi-trasparente
         if self.is_attacking:
-            attack_rect = self.get_attack_rect()
-            attack_surface = pygame.Surface((attack_rect.width, attack_rect.height))
-            attack_surface.set_alpha(120)  # Semi-trasparente
+            attack_rect = self.get_attack_rect().move(render_x - self.x, render_y - self.y)
             attack_color = (255, 0, 0) if self.is_boss else (255, 100, 0)  # Rosso per boss, arancione per demoni
-            attack_surface.fill(attack_color)
+            # Semi-trasparente (superficie dal pool)
+            attack_surface = overlay_pool.get(attack_rect.size, attack_color, 120)
             screen.blit(attack_surface, (attack_rect.x, attack_rect.y))
             
         # Barra della vita (se danneggiato)
         if self.health < self.max_health:
-            self._draw_health_bar(screen)
+            self._draw_health_bar(screen, render_x, render_y)
             
-    def _draw_health_bar(self, screen: pygame.Surface) -> None:
-        """Disegna la barra della vita sopra il nemico"""
+    def _draw_health_bar(self, screen: pygame.Surface, x: float, y: float) -> None:
+        """Disegna la barra della vita sopra il nemico (in x, y)"""
         bar_width = self.width
         bar_height = 4
-        bar_x = self.x
-        bar_y = self.y - 8
+        bar_x = x
+        bar_y = y - 8
         
         # Sfondo barra (rosso)
         bg_rect = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
@@ -0,0 +1,65 @@
+"""
+Registro condiviso dei font e dei glifi pre-renderizzati
+"""
+from typing import Dict, Optional, Tuple
+import pygame
+from src.quit_hook import QuitHook
+
+
+class FontRegistry:
+    """Condivide un'unica istanza di Font per (face, size) in tutto il processo"""
+
+    def __init__(self):
+        """Inizializza il registro dei font"""
+        self.fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+        self.glyphs: Dict[tuple, pygame.Surface] = {}
+        self._quit_hook = QuitHook(self.clear)
+
+    def get_font(self, face: Optional[str], size: int) -> pygame.font.Font:
+        """
+        Restituisce il font richiesto, creandolo solo la prima volta
+
+        Args:
+            face: Percorso del file del font, None per il font di default
+            size: Dimensione del font
+
+        Returns:
+            Istanza di Font condivisa
+        """
+        key = (face, size)
+        font = self.fonts.get(key)
+        if font is None:
+            self._quit_hook.ensure_registered()
+            font = pygame.font.Font(face, size)
+            self.fonts[key] = font
+        return font
+
+    def get_glyph(self, text: str, size: int, color: Tuple[int, int, int],
+                  face: Optional[str] = None) -> pygame.Surface:
+        """
+        Restituisce un simbolo pre-renderizzato (es. il "$" delle monete)
+
+        Args:
+            text: Simbolo da renderizzare
+            size: Dimensione del font
+            color: Colore RGB del simbolo
+            face: Percorso del file del font, None per il font di default
+
+        Returns:
+            Superficie con il simbolo (condivisa: non va modificata)
+        """
+        key = (face, size, text, tuple(color))
+        glyph = self.glyphs.get(key)
+        if glyph is None:
+            glyph = self.get_font(face, size).render(text, True, color)
+            self.glyphs[key] = glyph
+        return glyph
+
+    def clear(self) -> None:
+        """Svuota il registro"""
+        self.fonts.clear()
+        self.glyphs.clear()
+
+
+# Istanza globale del registro dei font
+font_registry = FontRegistry()
@@ -1,43 +1,108 @@
 """
 Classe Game principale per la gestione del gioco
 """
-from typing import Dict, Optional
+from typing import Any, Dict, Optional, Set, Tuple
 import pygame
+import os
 import sys
+import time
 import asyncio
 from src.config import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, BLACK, WHITE, GREEN, RED,
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, MAX_RENDER_FPS, HEADLESS_YIELD_TICKS, BLACK, WHITE, GREEN, RED,
     GAME_STATE_MENU, GAME_STATE_PLAYING, GAME_STATE_PAUSED,
     GAME_STATE_GAME_OVER, GAME_STATE_VICTORY, KEY_QUIT,
     GAME_STATE_LEVEL_INTRO, GAME_STATE_LEVEL_COMPLETE, GAME_STATE_LEVEL_FAILED,
-    GROUND_Y, BROWN, PLAYER_ATTACK_DAMAGE
+    GROUND_Y, BROWN, GOLD, PLAYER_ATTACK_DAMAGE, DIRTY_RECT_RENDERING, KEY_PROFILER,
+    KEY_TRACE_DUMP, HITCH_LOG_PATH
 )
 from src.player import Player
-from src.enemy import DemonArmed
-from src.collectible import Collectible, spawn_collectibles_in_area
-from src.platform import create_default_platforms
+from src.enemy import DemonArmed, ENEMY_ATTACK_WIDTH, ENEMY_SENSE_RANGE
+from src.collectible import Collectible, spawn_collectibles_in_area, FLOAT_AMPLITUDE
+from src.platform import PlatformIndex, create_default_platforms, create_default_ramps
+from src.physics import PhysicsWorld
+from src.terrain import TerrainMap
 from src.level import LevelManager
-from src.sprite_manager import sprite_manager
+from src.spatial_hash import SpatialHash
+from src.sim_clock import SimulationClock
+from src.sprite_manager import sprite_manager, SpritePreloadJob
+from src.surface_pool import overlay_pool
+from src.renderer import DirtyRectRenderer, build_static_layer
+from src.text_cache import text_cache
+from src.font_registry import font_registry
+from src.profiler import profiler
+from src.tracing import tracer, span, traced
+from src.hitch import HitchDetector
+from src.alloc_tracker import alloc_tracker, apply_gc_thresholds, freeze_long_lived_objects
 from typing import List
 
 
 class Game:
     """Classe principale che gestisce il gioco"""
     
-    def __init__(self):
-        """Inizializza il gioco"""
+    def __init__(self, headless: bool = False, render_every: int = 1,
+                 freeze_gc: Optional[bool] = None):
+        """
+        Inizializza il gioco
+        
+        Args:
+            headless: True per girare senza finestra né audio (driver SDL dummy),
+                senza limite di frame: la simulazione va alla massima velocità
+            render_every: In headless, disegna un frame ogni N tick (0 = mai)
+            freeze_gc: True per applicare GC_THRESHOLDS e congelare gli oggetti
+                di ogni livello (None = solo fuori dall'headless: test e
+                benchmark non toccano lo stato del GC del processo)
+        """
+        self.headless = headless
+        self.freeze_gc = not headless if freeze_gc is None else freeze_gc
+        if self.freeze_gc:
+            apply_gc_thresholds()
+        self.render_every = render_every if headless else 1
+        self.ticks_run = 0
+        
+        if headless:
+            # Nessun display né scheda audio (es. macchine di CI)
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+            
         pygame.init()
         pygame.display.set_caption("Knight's Quest: Il Santo Graal")
         
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         self.clock = pygame.time.Clock()
+        
+        # Tempo di simulazione (timer dei livelli, pausa, velocità, turbo)
+        self.sim_clock = SimulationClock()
+        
+        # Frazione di tick trascorsa dall'ultimo aggiornamento, per interpolare il disegno
+        self.render_alpha = 1.0
+        self.renderer = DirtyRectRenderer(self.screen)
+        
+        # Layer di sfondo di fallback (colore + terreno) per livelli senza immagine
+        self._fallback_background: Optional[pygame.Surface] = None
+        self._fallback_background_level = 0
+        
+        # Layer statico (sfondo + piattaforme + rampe), ricostruito solo
+        # quando cambia il livello o la geometria, con sfondo, indice e
+        # mappa del terreno da cui è stato composto
+        self._static_layer: Optional[pygame.Surface] = None
+        self._static_layer_sources: Tuple = ()
+        
+        # Decodifica in background degli sprite del livello (None = tutto pronto)
+        self.preload_job: Optional[SpritePreloadJob] = None
+        self._start_when_ready = False
+        
+        # Prefetch degli sprite del livello successivo e numero del livello
+        self.prefetch_job: Optional[SpritePreloadJob] = None
+        self._prefetch_level = 0
+        
         self.running = True
         self.state = GAME_STATE_MENU
         
         # Font per UI
-        self.font_large = pygame.font.Font(None, 48)
-        self.font_medium = pygame.font.Font(None, 32)
-        self.font_small = pygame.font.Font(None, 24)
+        self.font_large = font_registry.get_font(None, 48)
+        self.font_medium = font_registry.get_font(None, 32)
+        self.font_small = font_registry.get_font(None, 24)
+        self.font_profiler = font_registry.get_font(None, 18)
         
         # Inizializza il player (aggiustata posizione per nuove dimensioni)
         self.player = Player(100, GROUND_Y - 80)
@@ -45,8 +110,16 @@ class Game:
         # Sistema di livelli
         self.level_manager = LevelManager()
         
-        # Piattaforme
+        # Piattaforme e rampe
         self.platforms = create_default_platforms()
+        self.ramps = create_default_ramps()
+        
+        # Indice delle piattaforme per i controlli di atterraggio, costruito
+        # una volta per livello (o quando la lista viene sostituita)
+        self._platform_index: Optional[PlatformIndex] = None
+        
+        # Mappa delle altezze di suolo e rampe, compilata come l'indice
+        self._terrain: Optional[TerrainMap] = None
         
         # Lista dei nemici
         self.enemies: List[DemonArmed] = []
@@ -54,10 +127,37 @@ class Game:
         # Lista dei collezionabili
         self.collectibles: List[Collectible] = []
         
+        # Fisica di player e nemici, in un unico passo per tick: i corpi
+        # restano nel mondo tra un tick e l'altro (sync() e remove())
+        self.physics = PhysicsWorld()
+        
+        # Griglie per le query di collisione: i nemici vengono spostati a ogni
+        # tick, i collezionabili oscillano sul posto entro il padding
+        self.enemy_grid = SpatialHash()
+        
+        # Nemici entro ENEMY_SENSE_RANGE dal player, trovati con la griglia
+        # per l'IA (riusati a ogni tick)
+        self._sense_rect = pygame.Rect(0, 0, 2 * ENEMY_SENSE_RANGE + 3, SCREEN_HEIGHT)
+        self._enemies_near_player: Set[DemonArmed] = set()
+        self.collectible_grid = SpatialHash(padding_y=2 * FLOAT_AMPLITUDE)
+        
+        # Contatori per frame mostrati dal profiler (F3)
+        profiler.add_counter_source("blits", lambda: self.renderer.blit_count)
+        profiler.add_counter_source(
+            "surfaces",
+            lambda: overlay_pool.allocations + text_cache.misses + sprite_manager.allocations
+        )
+        
+        # Frame oltre budget registrati con le cause (in headless solo in memoria)
+        self.hitch_detector = HitchDetector(log_path=None if headless else HITCH_LOG_PATH)
+        
         # Statistiche di gioco
         self.enemies_killed = 0
         self.total_score = 0
         
+        # Statistiche per obiettivi e HUD, aggiornate in place a ogni frame
+        self.game_stats: Dict[str, Any] = {}
+        
         # Inizializza il primo livello
         self._start_level(1)
         
@@ -65,23 +165,105 @@ class Game:
         self.keys_pressed: Dict[int, bool] = {}
         
     async def run(self) -> None:
-        """Loop principale del gioco - compatibile con pygbag"""
+        """
+        Loop principale del gioco - compatibile con pygbag
+        
+        La simulazione avanza a passo fisso (FPS tick al secondo) qualunque sia
+        la frequenza dei frame: è sim_clock a decidere quanti tick eseguire in
+        base al tempo reale trascorso, mentre il disegno interpola le posizioni
+        tra gli ultimi due tick. In modalità turbo i tick vengono eseguiti senza
+        attendere il tempo reale, disegnando un frame ogni tanto.
+        """
+        if self.headless:
+            # Nessun limite di frame: si cede il controllo solo ogni tanto
+            while self.running:
+                self.run_ticks(HEADLESS_YIELD_TICKS)
+                await asyncio.sleep(0)
+            self._dump_diagnostics()
+            self.hitch_detector.close()
+            pygame.quit()
+            return
+            
+        frame_duration = 1.0 / MAX_RENDER_FPS if MAX_RENDER_FPS else 0.0
+        previous_time = time.perf_counter()
+        
         while self.running:
-            self._handle_events()
-            self._update()
-            self._draw()
-            
-            # Per pygbag, usiamo asyncio.sleep invece di clock.tick
-            try:
-                # Calcola il tempo per mantenere 60 FPS
-                await asyncio.sleep(1.0 / FPS)
-            except:
-                # Fallback per esecuzione normale
-                self.clock.tick(FPS)
+            frame_start = time.perf_counter()
+            self.sim_clock.accumulate(frame_start - previous_time)
+            previous_time = frame_start
+            profiler.begin_frame()
+            
+            with profiler.phase("events"), span("events"):
+                self._handle_events()
+            events_end = time.perf_counter()
+                
+            with profiler.phase("update"), span("update"):
+                if self.sim_clock.turbo and not self.sim_clock.paused:
+                    # Tick a raffica finché resta tempo nel frame
+                    turbo_budget = frame_duration or 1.0 / FPS
+                    while self.running and time.perf_counter() - frame_start < turbo_budget:
+                        self._update()
+                else:
+                    for _ in range(self.sim_clock.get_pending_ticks()):
+                        self._update()
+            update_end = time.perf_counter()
+                        
+            # Fuori dal gioco le entità sono ferme: niente interpolazione
+            if self.state == GAME_STATE_PLAYING:
+                self.render_alpha = self.sim_clock.get_alpha()
+            else:
+                self.render_alpha = 1.0
+            with profiler.phase("draw"), span("draw"):
+                self._draw()
+            draw_end = time.perf_counter()
+            profiler.end_frame()
             
+            self.hitch_detector.end_frame(
+                self, events_end - frame_start, update_end - events_end, draw_end - update_end,
+                profiler.last if profiler.enabled else None
+            )
+            
+            # Cede il controllo (al browser sotto pygbag) rispettando il limite di FPS
+            remaining = frame_duration - (time.perf_counter() - frame_start)
+            await asyncio.sleep(max(0.0, remaining))
+            
+        self._dump_diagnostics()
+        self.hitch_detector.close()
         pygame.quit()
         sys.exit()
         
+    def _dump_diagnostics(self) -> None:
+        """Salva la traccia degli span e stampa il report delle allocazioni, se attivi"""
+        tracer.dump()
+        if alloc_tracker.enabled and alloc_tracker.ticks:
+            alloc_tracker.print_report(alloc_tracker.report())
+        
+    def run_ticks(self, ticks: int) -> None:
+        """
+        Esegue un numero di tick di simulazione senza attendere il tempo reale
+        
+        Pensato per la modalità headless (playtest automatici, benchmark):
+        il disegno avviene solo ogni render_every tick.
+        
+        Args:
+            ticks: Tick da eseguire (si interrompe prima se il gioco termina)
+        """
+        for _ in range(ticks):
+            if not self.running:
+                break
+            profiler.begin_frame()
+            with profiler.phase("events"), span("events"):
+                self._handle_events()
+            with profiler.phase("update"), span("update"):
+                self._update()
+            self.ticks_run += 1
+            
+            if self.render_every and self.ticks_run % self.render_every == 0:
+                self.render_alpha = 1.0
+                with profiler.phase("draw"), span("draw"):
+                    self._draw()
+            profiler.end_frame()
+                
     def _handle_events(self) -> None:
         """Gestisce gli eventi pygame"""
         for event in pygame.event.get():
@@ -91,9 +273,16 @@ class Game:
             elif event.type == pygame.KEYDOWN:
                 self.keys_pressed[event.key] = True
                 
+                # Profiler, disponibile in ogni stato
+                if event.key == KEY_PROFILER:
+                    profiler.toggle()
+                elif event.key == KEY_TRACE_DUMP:
+                    tracer.dump()
+                    
                 # Menu principale
                 if self.state == GAME_STATE_MENU:
                     if event.key == pygame.K_RETURN:
+                        self._complete_preload()
                         self.state = GAME_STATE_PLAYING
                     elif event.key == KEY_QUIT:
                         self.running = False
@@ -129,7 +318,11 @@ class Game:
                 # Level Intro
                 elif self.state == GAME_STATE_LEVEL_INTRO:
                     if event.key == pygame.K_RETURN:
-                        self.state = GAME_STATE_PLAYING
+                        if self.preload_job is None:
+                            self.state = GAME_STATE_PLAYING
+                        else:
+                            # Si parte appena gli sprite del livello sono pronti
+                            self._start_when_ready = True
                         
                 # Level Complete
                 elif self.state == GAME_STATE_LEVEL_COMPLETE:
@@ -152,6 +345,7 @@ class Game:
                     elif event.key == pygame.K_RETURN:
                         # Riavvia completamente il gioco
                         self._restart_game()
+                        self._complete_preload()
                         self.state = GAME_STATE_PLAYING
                         
             elif event.type == pygame.KEYUP:
@@ -160,39 +354,58 @@ class Game:
                     
     def _update(self) -> None:
         """Aggiorna la logica del gioco"""
-        if self.state == GAME_STATE_PLAYING:
-            # Aggiorna il timer del livello
-            self.level_manager.update_timer(pygame.time.get_ticks())
+        if self.state == GAME_STATE_LEVEL_INTRO:
+            self._update_preload()
+            if self.preload_job is None:
+                self._update_prefetch()
+                
+        elif self.state == GAME_STATE_LEVEL_COMPLETE:
+            self._update_prefetch()
+            
+        elif self.state == GAME_STATE_PLAYING:
+            # Aggiorna il timer del livello con il tempo di simulazione
+            self.sim_clock.tick()
+            self.level_manager.update_timer(self.sim_clock.get_ticks())
             
             # Aggiorna il player
-            self.player.update(self.keys_pressed, self.platforms)
+            with profiler.phase("update.player"), span("update.player"):
+                self.player.store_previous_position()
+                self.player.update_controls(self.keys_pressed)
             
             # Aggiorna i nemici
-            for enemy in self.enemies[:]:  # Copia la lista per rimozione sicura
-                if enemy.is_alive():
-                    enemy.update(self.player.x, self.player.y)
-                else:
-                    self.enemies.remove(enemy)
-                    self.enemies_killed += 1
+            with profiler.phase("update.enemies"), span("update.enemies"):
+                near_player = self._find_enemies_near_player()
+                for enemy in self.enemies[:]:  # Copia la lista per rimozione sicura
+                    if enemy.is_alive():
+                        enemy.store_previous_position()
+                        enemy.update_behavior(self.player.x, self.player.y,
+                                              enemy in near_player)
+                    else:
+                        self.enemies.remove(enemy)
+                        self.enemy_grid.remove(enemy)
+                        self.physics.remove(enemy)
+                        self.enemies_killed += 1
+            
+            # Gravità, movimento e contatti di player e nemici
+            with profiler.phase("update.physics"), span("update.physics"):
+                self.physics.sync(self.player, self.enemies)
+                self.physics.step(self.get_platform_index(), self.get_terrain())
             
             # Aggiorna i collezionabili
-            for collectible in self.collectibles[:]:  # Copia la lista per rimozione sicura
-                if not collectible.is_collected():
-                    collectible.update()
-                else:
-                    self.collectibles.remove(collectible)
+            with profiler.phase("update.collectibles"), span("update.collectibles"):
+                for collectible in self.collectibles[:]:  # Copia la lista per rimozione sicura
+                    if not collectible.is_collected():
+                        collectible.update()
+                    else:
+                        self.collectibles.remove(collectible)
+                        self.collectible_grid.remove(collectible)
             
             # Gestisci collisioni
-            self._handle_collisions()
+            with profiler.phase("update.collisions"), span("update.collisions"):
+                self._handle_collisions()
             
             # Controlla obiettivi del livello
-            game_stats = {
-                'collectibles_remaining': len(self.collectibles),
-                'enemies_remaining': len(self.enemies),
-                'total_score': self.total_score,
-                'player_alive': self.player.is_alive(),
-                'boss_defeated': False  # TODO: implementare boss
-            }
+            game_stats = self._update_game_stats()
             
             # Controlla se il player è morto (priorità massima)
             if not self.player.is_alive():
@@ -215,8 +428,57 @@ class Game:
             elif self.player.x > SCREEN_WIDTH - self.player.width:
                 self.player.x = SCREEN_WIDTH - self.player.width
                 
+            alloc_tracker.tick()
+                
+    def _find_enemies_near_player(self) -> Set[DemonArmed]:
+        """
+        Trova con la griglia i nemici abbastanza vicini al player per l'IA
+        
+        La query copre una fascia alta quanto lo schermo, larga
+        ENEMY_SENSE_RANGE per lato (più un pixel di margine per gli
+        arrotondamenti): i nemici fuori dalla fascia sono sicuramente oltre
+        la soglia più ampia dell'IA, che per loro non calcola la distanza.
+        
+        Returns:
+            Insieme (riusato) dei nemici vicini al player
+        """
+        self.enemy_grid.update(self.enemies)
+        self._sense_rect.x = int(self.player.x) - ENEMY_SENSE_RANGE - 1
+        near_player = self._enemies_near_player
+        near_player.clear()
+        near_player.update(self.enemy_grid.query_rect(self._sense_rect))
+        return near_player
+        
+    def _update_game_stats(self) -> Dict[str, Any]:
+        """
+        Aggiorna le statistiche usate da obiettivi e HUD
+        
+        Il dizionario è sempre lo stesso, per non crearne due nuovi a ogni frame.
+        
+        Returns:
+            Statistiche di gioco attuali
+        """
+        game_stats = self.game_stats
+        game_stats['collectibles_remaining'] = len(self.collectibles)
+        game_stats['enemies_remaining'] = len(self.enemies)
+        game_stats['total_score'] = self.total_score
+        game_stats['player_alive'] = self.player.is_alive()
+        game_stats['boss_defeated'] = False  # TODO: implementare boss
+        return game_stats
+        
     def _draw(self) -> None:
         """Disegna tutto sullo schermo"""
+        if self.state == GAME_STATE_PLAYING and DIRTY_RECT_RENDERING:
+            # Solo le regioni modificate vengono ripristinate e presentate
+            self._draw_game()
+            self._draw_profiler()
+            with profiler.phase("draw.present"), span("draw.present"):
+                self.renderer.present()
+            return
+            
+        # Le altre schermate ridisegnano tutto: il prossimo frame di gioco
+        # dovrà ripartire da un ridisegno completo
+        self.renderer.invalidate()
         self.screen.fill(BLACK)
         
         if self.state == GAME_STATE_MENU:
@@ -237,69 +499,172 @@ class Game:
         elif self.state == GAME_STATE_VICTORY:
             self._draw_victory()
             
-        pygame.display.flip()
+        self._draw_profiler()
+        with profiler.phase("draw.present"), span("draw.present"):
+            pygame.display.flip()
         
     def _draw_menu(self) -> None:
         """Disegna il menu principale"""
-        title_text = self.font_large.render("Knight's Quest: Il Santo Graal", True, WHITE)
+        title_text = text_cache.render(self.font_large, "Knight's Quest: Il Santo Graal", WHITE)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3))
         self.screen.blit(title_text, title_rect)
         
-        start_text = self.font_medium.render("Premi ENTER per iniziare", True, WHITE)
+        start_text = text_cache.render(self.font_medium, "Premi ENTER per iniziare", WHITE)
         start_rect = start_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
         self.screen.blit(start_text, start_rect)
         
-        cheat_text = self.font_small.render("CHEAT: Premi 4 (boss) o 5 (santo graal) durante il gioco!", True, (255, 255, 0))
+        cheat_text = text_cache.render(self.font_small, "CHEAT: Premi 4 (boss) o 5 (santo graal) durante il gioco!", (255, 255, 0))
         cheat_rect = cheat_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 30))
         self.screen.blit(cheat_text, cheat_rect)
         
-        quit_text = self.font_small.render("Premi ESC per uscire", True, WHITE)
+        quit_text = text_cache.render(self.font_small, "Premi ESC per uscire", WHITE)
         quit_rect = quit_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 60))
         self.screen.blit(quit_text, quit_rect)
         
-    def _draw_game(self) -> None:
-        """Disegna la schermata di gioco"""
-        # Disegna lo sfondo del livello
+    def _get_background_layer(self) -> pygame.Surface:
+        """
+        Restituisce il layer di sfondo del livello corrente
+        
+        Returns:
+            Superficie grande quanto lo schermo con lo sfondo del livello
+        """
         level_config = self.level_manager.get_current_level_config()
         
         if level_config.background_image:
-            # Carica e disegna l'immagine di sfondo
-            background = sprite_manager.load_background(
+            # Immagine di sfondo (in cache nello sprite manager)
+            return sprite_manager.load_background(
                 level_config.background_image,
                 (SCREEN_WIDTH, SCREEN_HEIGHT)
             )
-            self.screen.blit(background, (0, 0))
-        else:
-            # Fallback al colore di sfondo
-            self.screen.fill(level_config.background_color)
             
-            # Disegna il terreno
+        # Fallback al colore di sfondo con il terreno, creato una volta per livello
+        if (self._fallback_background is None or
+                self._fallback_background_level != level_config.level_number):
+            background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            background.fill(level_config.background_color)
             ground_rect = pygame.Rect(0, GROUND_Y, SCREEN_WIDTH, SCREEN_HEIGHT - GROUND_Y)
-            pygame.draw.rect(self.screen, BROWN, ground_rect)
+            pygame.draw.rect(background, BROWN, ground_rect)
+            self._fallback_background = background
+            self._fallback_background_level = level_config.level_number
+            
+        return self._fallback_background
+        
+    def _get_static_layer(self) -> pygame.Surface:
+        """
+        Restituisce il layer statico del livello, componendolo se necessario
+        
+        Il layer viene ricomposto anche quando sfondo, piattaforme o rampe
+        cambiano senza un cambio di livello: indice e mappa del terreno
+        vengono ricostruiti in quel caso, quindi basta confrontarne l'identità.
+        
+        Returns:
+            Superficie con sfondo, terreno, piattaforme e rampe
+        """
+        sources = (self._get_background_layer(), self.get_platform_index(), self.get_terrain())
+        if self._static_layer is None or sources != self._static_layer_sources:
+            self._static_layer = build_static_layer(sources[0], self.platforms, self.ramps)
+            self._static_layer_sources = sources
+        return self._static_layer
+        
+    def _invalidate_static_layer(self) -> None:
+        """
+        Scarta il layer statico dopo un cambio di livello o di geometria
+        
+        Insieme al layer vengono scartati l'indice delle piattaforme e la
+        mappa del terreno, ricostruiti al primo uso.
+        """
+        self._static_layer = None
+        self._static_layer_sources = ()
+        self._platform_index = None
+        self._terrain = None
         
-        # Disegna le piattaforme
-        for platform in self.platforms:
-            platform.draw(self.screen)
+    def get_platform_index(self) -> PlatformIndex:
+        """
+        Restituisce l'indice delle piattaforme, costruendolo se necessario
+        
+        Returns:
+            Indice delle piattaforme correnti
+        """
+        if self._platform_index is None or not self._platform_index.is_built_from(self.platforms):
+            self._platform_index = PlatformIndex(self.platforms)
+        return self._platform_index
+        
+    def get_terrain(self) -> TerrainMap:
+        """
+        Restituisce la mappa del terreno, compilandola se necessario
+        
+        Returns:
+            Mappa del terreno per le rampe correnti
+        """
+        if self._terrain is None or not self._terrain.is_built_from(self.ramps):
+            self._terrain = TerrainMap(self.ramps)
+        return self._terrain
+        
+    def _get_entity_dirty_rect(self, entity) -> pygame.Rect:
+        """
+        Calcola l'area dello schermo occupata da un'entità nel frame corrente
+        
+        Args:
+            entity: Player o nemico da misurare
+            
+        Returns:
+            Rect che copre sprite, area di attacco e barra della vita
+        """
+        rect = pygame.Rect(entity.x, entity.y, entity.width, entity.height)
+        if entity.is_attacking:
+            rect.union_ip(entity.get_attack_rect())
+        if hasattr(entity, "max_health") and entity.health < entity.max_health:
+            # Barra della vita disegnata 8px sopra il nemico
+            rect.union_ip(pygame.Rect(entity.x, entity.y - 8, entity.width, 4))
+            
+        # La posizione interpolata sta tra quella del tick precedente e l'attuale
+        rect.union_ip(rect.move(entity.prev_x - entity.x, entity.prev_y - entity.y))
+        return rect.inflate(2, 2)
+        
+    def _draw_game(self) -> None:
+        """Disegna la schermata di gioco"""
+        profiler.set_count("entities", 1 + len(self.enemies) + len(self.collectibles))
+        profiler.set_count("awake bodies", self.physics.awake_count)
+        
+        # Ripristina sfondo e piattaforme dal layer statico
+        # (intero o solo le regioni sporche)
+        with profiler.phase("draw.background"), span("draw.background"):
+            self.renderer.set_background(self._get_static_layer())
+            self.renderer.begin_frame()
         
         # Disegna il player
-        self.player.draw(self.screen)
+        with profiler.phase("draw.player"), span("draw.player"):
+            self.player.draw(self.screen, self.render_alpha)
+            self.renderer.mark(self._get_entity_dirty_rect(self.player))
         
         # Disegna i nemici
-        for enemy in self.enemies:
-            enemy.draw(self.screen)
+        with profiler.phase("draw.enemies"), span("draw.enemies"):
+            for enemy in self.enemies:
+                enemy.draw(self.screen, self.render_alpha)
+                self.renderer.mark(self._get_entity_dirty_rect(enemy))
         
         # Disegna i collezionabili
-        for collectible in self.collectibles:
-            collectible.draw(self.screen)
+        with profiler.phase("draw.collectibles"), span("draw.collectibles"):
+            for collectible in self.collectibles:
+                collectible.draw(self.screen)
+                self.renderer.mark(pygame.Rect(collectible.x, collectible.y,
+                                               collectible.size, collectible.size).inflate(2, 2))
         
         # Disegna l'HUD
-        self._draw_hud()
-        
+        with profiler.phase("draw.hud"), span("draw.hud"):
+            self._draw_hud()
+        
+    def _draw_profiler(self) -> None:
+        """Disegna l'overlay del profiler, se attivo"""
+        rect = profiler.draw(self.screen, self.font_profiler)
+        if rect is not None:
+            self.renderer.mark(rect)
+            
     def _draw_hud(self) -> None:
         """Disegna l'interfaccia utente (HUD)"""
         # Barra della salute
-        health_text = self.font_small.render(f"Salute: {self.player.health}/100", True, WHITE)
-        self.screen.blit(health_text, (10, 10))
+        health_text = text_cache.render(self.font_small, f"Salute: {self.player.health}/100", WHITE)
+        self.renderer.blit(health_text, (10, 10))
         
         # Barra della salute grafica
         health_bar_width = 200
@@ -308,110 +673,101 @@ class Game:
         
         # Sfondo barra salute
         health_bg_rect = pygame.Rect(10, 35, health_bar_width, health_bar_height)
-        pygame.draw.rect(self.screen, WHITE, health_bg_rect, 2)
+        self.renderer.mark(pygame.draw.rect(self.screen, WHITE, health_bg_rect, 2))
         
         # Barra salute attuale
         if health_percentage > 0:
             health_fill_width = int(health_bar_width * health_percentage)
             health_fill_rect = pygame.Rect(10, 35, health_fill_width, health_bar_height)
             color = GREEN if health_percentage > 0.3 else (255, 165, 0) if health_percentage > 0.1 else (255, 0, 0)
-            pygame.draw.rect(self.screen, color, health_fill_rect)
+            self.renderer.mark(pygame.draw.rect(self.screen, color, health_fill_rect))
             
         # Risorse
         resources_y = 70
         for resource_type, amount in self.player.resources.items():
-            resource_text = self.font_small.render(f"{resource_type.capitalize()}: {amount}", True, WHITE)
-            self.screen.blit(resource_text, (10, resources_y))
+            resource_text = text_cache.render(self.font_small, f"{resource_type.capitalize()}: {amount}", WHITE)
+            self.renderer.blit(resource_text, (10, resources_y))
             resources_y += 25
             
         # Statistiche nemici
-        enemies_text = self.font_small.render(f"Demoni uccisi: {self.enemies_killed}", True, WHITE)
-        self.screen.blit(enemies_text, (10, resources_y))
+        enemies_text = text_cache.render(self.font_small, f"Demoni uccisi: {self.enemies_killed}", WHITE)
+        self.renderer.blit(enemies_text, (10, resources_y))
         
-        enemies_remaining_text = self.font_small.render(f"Demoni rimanenti: {len(self.enemies)}", True, WHITE)
-        self.screen.blit(enemies_remaining_text, (10, resources_y + 25))
+        enemies_remaining_text = text_cache.render(self.font_small, f"Demoni rimanenti: {len(self.enemies)}", WHITE)
+        self.renderer.blit(enemies_remaining_text, (10, resources_y + 25))
         
         # Statistiche collezionabili
-        collectibles_remaining_text = self.font_small.render(f"Tesori rimanenti: {len(self.collectibles)}", True, WHITE)
-        self.screen.blit(collectibles_remaining_text, (10, resources_y + 50))
+        collectibles_remaining_text = text_cache.render(self.font_small, f"Tesori rimanenti: {len(self.collectibles)}", WHITE)
+        self.renderer.blit(collectibles_remaining_text, (10, resources_y + 50))
         
-        score_text = self.font_small.render(f"Punteggio: {self.total_score}", True, WHITE)
-        self.screen.blit(score_text, (10, resources_y + 75))
+        score_text = text_cache.render(self.font_small, f"Punteggio: {self.total_score}", WHITE)
+        self.renderer.blit(score_text, (10, resources_y + 75))
         
         # Informazioni livello e obiettivi
         level_config = self.level_manager.get_current_level_config()
-        level_text = self.font_small.render(f"Livello {level_config.level_number}: {level_config.name}", True, WHITE)
-        self.screen.blit(level_text, (SCREEN_WIDTH - 300, 10))
+        level_text = text_cache.render(self.font_small, f"Livello {level_config.level_number}: {level_config.name}", WHITE)
+        self.renderer.blit(level_text, (SCREEN_WIDTH - 300, 10))
         
         # Timer se necessario
         time_text = self.level_manager.get_time_remaining_text()
         if time_text:
             timer_color = (255, 0, 0) if "00:" in time_text and int(time_text.split(":")[1]) <= 10 else WHITE
-            timer_render = self.font_small.render(time_text, True, timer_color)
-            self.screen.blit(timer_render, (SCREEN_WIDTH - 300, 35))
+            timer_render = text_cache.render(self.font_small, time_text, timer_color)
+            self.renderer.blit(timer_render, (SCREEN_WIDTH - 300, 35))
         
         # Obiettivi
         objectives_y = 60 if time_text else 35
-        game_stats = {
-            'collectibles_remaining': len(self.collectibles),
-            'enemies_remaining': len(self.enemies),
-            'total_score': self.total_score,
-            'boss_defeated': False
-        }
-        
-        progress_list = self.level_manager.get_progress_text(game_stats)
+        progress_list = self.level_manager.get_progress_text(self._update_game_stats())
         for i, progress in enumerate(progress_list):
-            progress_render = self.font_small.render(progress, True, WHITE)
-            self.screen.blit(progress_render, (SCREEN_WIDTH - 300, objectives_y + i * 20))
+            progress_render = text_cache.render(self.font_small, progress, WHITE)
+            self.renderer.blit(progress_render, (SCREEN_WIDTH - 300, objectives_y + i * 20))
             
         # DEBUG: Mostra stato completamento livello finale
         if self.level_manager.current_level >= 4:
             debug_y = objectives_y + len(progress_list) * 20 + 10
             
             # DEBUG più grande e visibile
-            debug_title = self.font_medium.render("🏆 LIVELLO FINALE - DEBUG 🏆", True, (255, 255, 0))
-            self.screen.blit(debug_title, (SCREEN_WIDTH - 400, debug_y))
+            debug_title = text_cache.render(self.font_medium, "🏆 LIVELLO FINALE - DEBUG 🏆", (255, 255, 0))
+            self.renderer.blit(debug_title, (SCREEN_WIDTH - 400, debug_y))
             
             debug_text2 = f"Nemici rimanenti: {len(self.enemies)} (devono essere 0)"
-            debug_render2 = self.font_small.render(debug_text2, True, (255, 100, 100) if len(self.enemies) > 0 else (100, 255, 100))
-            self.screen.blit(debug_render2, (SCREEN_WIDTH - 400, debug_y + 30))
+            debug_render2 = text_cache.render(self.font_small, debug_text2, (255, 100, 100) if len(self.enemies) > 0 else (100, 255, 100))
+            self.renderer.blit(debug_render2, (SCREEN_WIDTH - 400, debug_y + 30))
             
             debug_text3 = f"Tesori rimanenti: {len(self.collectibles)} (devono essere 0)"
-            debug_render3 = self.font_small.render(debug_text3, True, (255, 100, 100) if len(self.collectibles) > 0 else (100, 255, 100))
-            self.screen.blit(debug_render3, (SCREEN_WIDTH - 400, debug_y + 50))
+            debug_render3 = text_cache.render(self.font_small, debug_text3, (255, 100, 100) if len(self.collectibles) > 0 else (100, 255, 100))
+            self.renderer.blit(debug_render3, (SCREEN_WIDTH - 400, debug_y + 50))
             
             debug_text4 = f"Livello completato: {self.level_manager.level_complete}"
-            debug_render4 = self.font_small.render(debug_text4, True, (100, 255, 100) if self.level_manager.level_complete else (255, 100, 100))
-            self.screen.blit(debug_render4, (SCREEN_WIDTH - 400, debug_y + 70))
+            debug_render4 = text_cache.render(self.font_small, debug_text4, (100, 255, 100) if self.level_manager.level_complete else (255, 100, 100))
+            self.renderer.blit(debug_render4, (SCREEN_WIDTH - 400, debug_y + 70))
             
             debug_text5 = f"Tutti livelli completati: {self.level_manager.all_levels_complete}"
-            debug_render5 = self.font_small.render(debug_text5, True, (100, 255, 100) if self.level_manager.all_levels_complete else (255, 100, 100))
-            self.screen.blit(debug_render5, (SCREEN_WIDTH - 400, debug_y + 90))
+            debug_render5 = text_cache.render(self.font_small, debug_text5, (100, 255, 100) if self.level_manager.all_levels_complete else (255, 100, 100))
+            self.renderer.blit(debug_render5, (SCREEN_WIDTH - 400, debug_y + 90))
             
             # Messaggio grande se tutto è pronto
             if len(self.enemies) == 0 and len(self.collectibles) == 0:
-                victory_ready = self.font_large.render("VITTORIA PROSSIMA!", True, (255, 255, 0))
-                self.screen.blit(victory_ready, (50, 200))
+                victory_ready = text_cache.render(self.font_large, "VITTORIA PROSSIMA!", (255, 255, 0))
+                self.renderer.blit(victory_ready, (50, 200))
             
         # Comandi
-        commands_text = self.font_small.render("Frecce: Movimento | SPAZIO: Salto | X: Attacco | P: Pausa | ESC: Menu", True, WHITE)
+        commands_text = text_cache.render(self.font_small, "Frecce: Movimento | SPAZIO: Salto | X: Attacco | P: Pausa | ESC: Menu", WHITE)
         commands_rect = commands_text.get_rect(centerx=SCREEN_WIDTH // 2, bottom=SCREEN_HEIGHT - 10)
-        self.screen.blit(commands_text, commands_rect)
+        self.renderer.blit(commands_text, commands_rect)
         
     def _draw_pause_overlay(self) -> None:
         """Disegna l'overlay di pausa"""
         # Overlay semi-trasparente
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill(BLACK)
+        overlay = overlay_pool.get((SCREEN_WIDTH, SCREEN_HEIGHT), BLACK, 128)
         self.screen.blit(overlay, (0, 0))
         
         # Testo pausa
-        pause_text = self.font_large.render("PAUSA", True, WHITE)
+        pause_text = text_cache.render(self.font_large, "PAUSA", WHITE)
         pause_rect = pause_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
         self.screen.blit(pause_text, pause_rect)
         
-        resume_text = self.font_medium.render("Premi P per continuare", True, WHITE)
+        resume_text = text_cache.render(self.font_medium, "Premi P per continuare", WHITE)
         resume_rect = resume_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
         self.screen.blit(resume_text, resume_rect)
         
@@ -420,25 +776,25 @@ class Game:
         self.screen.fill((20, 0, 0))  # Rosso molto scuro
         
         # Titolo
-        game_over_text = self.font_large.render("GAME OVER", True, (255, 0, 0))
+        game_over_text = text_cache.render(self.font_large, "GAME OVER", (255, 0, 0))
         game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 80))
         self.screen.blit(game_over_text, game_over_rect)
         
         # Messaggio di morte
-        death_text = self.font_medium.render("Il Cavaliere è caduto in battaglia!", True, WHITE)
+        death_text = text_cache.render(self.font_medium, "Il Cavaliere è caduto in battaglia!", WHITE)
         death_rect = death_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 20))
         self.screen.blit(death_text, death_rect)
         
         # Opzioni
-        retry_text = self.font_medium.render("R - Riprova questo livello", True, WHITE)
+        retry_text = text_cache.render(self.font_medium, "R - Riprova questo livello", WHITE)
         retry_rect = retry_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 30))
         self.screen.blit(retry_text, retry_rect)
         
-        restart_text = self.font_medium.render("ENTER - Ricomincia dal Livello 1", True, WHITE)
+        restart_text = text_cache.render(self.font_medium, "ENTER - Ricomincia dal Livello 1", WHITE)
         restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 60))
         self.screen.blit(restart_text, restart_rect)
         
-        menu_text = self.font_small.render("ESC - Torna al Menu", True, WHITE)
+        menu_text = text_cache.render(self.font_small, "ESC - Torna al Menu", WHITE)
         menu_rect = menu_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 100))
         self.screen.blit(menu_text, menu_rect)
         
@@ -460,7 +816,7 @@ class Game:
             pygame.draw.rect(self.screen, sparkle_color, (x, y, size, size))
         
         # Titolo VITTORIA gigante
-        victory_text = self.font_large.render("⚔ VITTORIA! ⚔", True, (255, 215, 0))
+        victory_text = text_cache.render(self.font_large, "⚔ VITTORIA! ⚔", (255, 215, 0))
         victory_rect = victory_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3 - 40))
         self.screen.blit(victory_text, victory_rect)
         
@@ -506,31 +862,31 @@ class Game:
                 pygame.draw.polygon(self.screen, (255, 255, 200), points)
         
         # Testo del Graal
-        grail_text = self.font_medium.render("🏆 IL SANTO GRAAL È TUO! 🏆", True, (255, 215, 0))
+        grail_text = text_cache.render(self.font_medium, "🏆 IL SANTO GRAAL È TUO! 🏆", (255, 215, 0))
         grail_rect = grail_text.get_rect(center=(SCREEN_WIDTH // 2, grail_y + 120))
         self.screen.blit(grail_text, grail_rect)
         
         # Messaggio epico
-        hero_text = self.font_medium.render("Sei diventato il Cavaliere Leggendario!", True, WHITE)
+        hero_text = text_cache.render(self.font_medium, "Sei diventato il Cavaliere Leggendario!", WHITE)
         hero_rect = hero_text.get_rect(center=(SCREEN_WIDTH // 2, grail_y + 150))
         self.screen.blit(hero_text, hero_rect)
         
         # Statistiche finali
         stats_y = grail_y + 190
-        score_text = self.font_small.render(f"Punteggio Finale: {self.total_score}", True, (255, 215, 0))
+        score_text = text_cache.render(self.font_small, f"Punteggio Finale: {self.total_score}", (255, 215, 0))
         score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, stats_y))
         self.screen.blit(score_text, score_rect)
         
-        enemies_text = self.font_small.render(f"Demoni Sconfitti: {self.enemies_killed}", True, (255, 215, 0))
+        enemies_text = text_cache.render(self.font_small, f"Demoni Sconfitti: {self.enemies_killed}", (255, 215, 0))
         enemies_rect = enemies_text.get_rect(center=(SCREEN_WIDTH // 2, stats_y + 25))
         self.screen.blit(enemies_text, enemies_rect)
         
         # Comandi
-        menu_text = self.font_medium.render("Premi ESC per tornare al menu", True, WHITE)
+        menu_text = text_cache.render(self.font_medium, "Premi ESC per tornare al menu", WHITE)
         menu_rect = menu_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 60))
         self.screen.blit(menu_text, menu_rect)
         
-        restart_text = self.font_small.render("Premi ENTER per giocare di nuovo", True, WHITE)
+        restart_text = text_cache.render(self.font_small, "Premi ENTER per giocare di nuovo", WHITE)
         restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 30))
         self.screen.blit(restart_text, restart_rect)
         
@@ -539,8 +895,10 @@ class Game:
         # Reset player
         self.player = Player(100, GROUND_Y - 48)
         
-        # Reset piattaforme
+        # Reset piattaforme e rampe
         self.platforms = create_default_platforms()
+        self.ramps = create_default_ramps()
+        self._invalidate_static_layer()
         
         # Reset statistiche
         self.enemies_killed = 0
@@ -553,20 +911,31 @@ class Game:
 
                 
     def _handle_collisions(self) -> None:
-        """Gestisce tutte le collisioni del gioco"""
+        """
+        Gestisce tutte le collisioni del gioco
+        
+        Nemici e collezionabili sono indicizzati in una griglia uniforme,
+        così ogni controllo esamina solo le entità vicine al player. Le
+        griglie vengono ricostruite solo se le liste sono state sostituite
+        o modificate senza passare dalla griglia; i nemici spostati cambiano
+        cella solo quando escono da quelle in cui sono registrati.
+        """
+        self.enemy_grid.update(self.enemies)
+        self.collectible_grid.sync(self.collectibles)
         
         # Collisioni attacco player -> nemici
         if self.player.is_attacking and not self.player.damage_dealt_this_attack:
             player_attack_rect = self.player.get_attack_rect()
-            for enemy in self.enemies:
-                if (enemy.is_alive() and 
-                    player_attack_rect.colliderect(enemy.rect)):
+            for enemy in self.enemy_grid.query_rect(player_attack_rect):
+                if enemy.is_alive():
                     enemy.take_damage(PLAYER_ATTACK_DAMAGE)
                     self.player.damage_dealt_this_attack = True
                     break  # Solo un nemico per attacco
                     
-        # Collisioni attacco nemici -> player (SOLO quando stanno attaccando)
-        for enemy in self.enemies:
+        # Collisioni attacco nemici -> player (SOLO quando stanno attaccando):
+        # l'attacco sporge di ENEMY_ATTACK_WIDTH dal corpo del nemico
+        attack_reach_rect = self.player.rect.inflate(2 * ENEMY_ATTACK_WIDTH, 0)
+        for enemy in self.enemy_grid.query_rect(attack_reach_rect):
             if (enemy.is_alive() and 
                 enemy.is_attacking and 
                 not enemy.damage_dealt_this_attack):
@@ -579,7 +948,9 @@ class Game:
                     enemy.damage_dealt_this_attack = True
                     
         # Collisioni corpo a corpo (nemico tocca player) - SOLO RESPINGIMENTO
-        for enemy in self.enemies:
+        # (area allargata: ogni respingimento sposta il player)
+        push_rect = self.player.rect.inflate(2 * self.player.width, 0)
+        for enemy in self.enemy_grid.query_rect(push_rect):
             if (enemy.is_alive() and 
                 not enemy.is_attacking and  # Solo se NON sta attaccando
                 enemy.rect.colliderect(self.player.rect)):
@@ -604,10 +975,11 @@ class Game:
                     # Aggiorna i rect
                     self.player.rect.x = self.player.x
                     enemy.rect.x = enemy.x
+                    self.enemy_grid.move(enemy)
                     
         # Collisioni player -> collezionabili
-        for collectible in self.collectibles[:]:
-            if not collectible.is_collected() and collectible.rect.colliderect(self.player.rect):
+        for collectible in self.collectible_grid.query_rect(self.player.rect):
+            if not collectible.is_collected():
                 # Raccogli l'oggetto
                 value, heal_amount = collectible.collect()
                 
@@ -622,6 +994,7 @@ class Game:
                 # Aggiorna punteggio
                 self.total_score += value
                 
+    @traced("Game._start_level")
     def _start_level(self, level_number: int) -> None:
         """
         Inizia un nuovo livello
@@ -630,7 +1003,10 @@ class Game:
             level_number: Numero del livello da iniziare
         """
         # Resetta timer e stato livello
-        self.level_manager.start_level(level_number, pygame.time.get_ticks())
+        self.level_manager.start_level(level_number, self.sim_clock.get_ticks())
+        
+        # Il nuovo livello ha un altro sfondo: il layer statico verrà ricomposto
+        self._invalidate_static_layer()
         
         # Resetta player position e salute (aggiustata per nuove dimensioni)
         self.player.x = 100
@@ -638,10 +1014,13 @@ class Game:
         self.player.vel_y = 0
         self.player.on_ground = True
         self.player.health = 100  # Reset salute completa
+        self.player.store_previous_position()  # Nessuna interpolazione dal livello precedente
         
         # Resetta nemici e collezionabili
         self.enemies.clear()
         self.collectibles.clear()
+        self.enemy_grid.clear()
+        self.collectible_grid.clear()
         self.enemies_killed = 0
         
         # Spawn nemici e collezionabili basati sul livello
@@ -649,6 +1028,32 @@ class Game:
         self._spawn_enemies_for_level(level_config)
         self._spawn_collectibles_for_level(level_config)
         
+        # Gli sprite del livello restano in memoria; quelli dei livelli
+        # precedenti vengono rilasciati
+        level_sprites = level_config.get_asset_manifest()
+        sprite_manager.pin_sprites(level_sprites)
+        sprite_manager.release_unpinned()
+        
+        # Decodifica gli sprite del livello mentre è visibile l'introduzione
+        # (continuando il prefetch, se era già partito per questo livello)
+        if self.preload_job is not None:
+            self.preload_job.cancel()
+        if self.prefetch_job is not None and self._prefetch_level == level_number:
+            self.preload_job = self.prefetch_job
+        else:
+            if self.prefetch_job is not None:
+                self.prefetch_job.cancel()
+            # Senza disegno (headless con render_every=0) gli sprite non servono
+            self.preload_job = sprite_manager.preload(level_sprites) if self.render_every else None
+        self.prefetch_job = None
+        self._prefetch_level = 0
+        self._start_when_ready = False
+        
+        # Gli oggetti del livello vivono fino al prossimo caricamento:
+        # il GC non deve riesaminarli a ogni raccolta
+        if self.freeze_gc:
+            freeze_long_lived_objects()
+        
         # Inizia con schermata introduttiva
         self.state = GAME_STATE_LEVEL_INTRO
         
@@ -703,6 +1108,71 @@ class Game:
         current_level = self.level_manager.current_level
         self._start_level(current_level)
         
+    def _update_preload(self) -> None:
+        """Raccoglie gli sprite decodificati in background durante l'introduzione"""
+        if self.preload_job is not None:
+            self.preload_job.poll()
+            if not self.preload_job.done:
+                return
+            self._prepare_level_surfaces()
+            self.preload_job = None
+            
+        if self._start_when_ready:
+            self._start_when_ready = False
+            self.state = GAME_STATE_PLAYING
+            
+    def _update_prefetch(self) -> None:
+        """Decodifica in background gli sprite del livello successivo"""
+        if not self.render_every:
+            return  # Senza disegno gli sprite non servono
+            
+        if self.prefetch_job is None:
+            next_config = self.level_manager.get_next_level_config()
+            if next_config is None:
+                return
+                
+            # Anche gli sprite del prossimo livello non vanno rimossi dal budget
+            current_config = self.level_manager.get_current_level_config()
+            next_sprites = next_config.get_asset_manifest()
+            sprite_manager.pin_sprites(current_config.get_asset_manifest() + next_sprites)
+            self.prefetch_job = sprite_manager.preload(next_sprites)
+            self._prefetch_level = next_config.level_number
+            
+        self.prefetch_job.poll()
+        
+    def _complete_preload(self) -> None:
+        """Attende la fine del preload prima di entrare direttamente in gioco"""
+        if self.preload_job is not None:
+            self.preload_job.wait()
+            self._update_preload()
+            
+    def _prepare_level_surfaces(self) -> None:
+        """Prepara varianti specchiate e layer statico per il primo frame di gioco"""
+        level_config = self.level_manager.get_current_level_config()
+        for name, size in level_config.get_asset_manifest():
+            if name != level_config.background_image:
+                sprite_manager.load_sprite(name, size, flip_x=True)
+        self._get_static_layer()
+        
+    def _draw_loading_bar(self, progress: float) -> None:
+        """
+        Disegna la barra di caricamento degli sprite del livello
+        
+        Args:
+            progress: Avanzamento (0.0 - 1.0)
+        """
+        bar_width = 300
+        bar_height = 16
+        bar_x = (SCREEN_WIDTH - bar_width) // 2
+        bar_y = SCREEN_HEIGHT - 100
+        
+        loading_text = text_cache.render(self.font_small, f"Caricamento... {int(progress * 100)}%", WHITE)
+        loading_rect = loading_text.get_rect(center=(SCREEN_WIDTH // 2, bar_y - 20))
+        self.screen.blit(loading_text, loading_rect)
+        
+        pygame.draw.rect(self.screen, GOLD, (bar_x, bar_y, int(bar_width * progress), bar_height))
+        pygame.draw.rect(self.screen, WHITE, (bar_x, bar_y, bar_width, bar_height), 2)
+        
     def _draw_level_intro(self) -> None:
         """Disegna la schermata di introduzione del livello"""
         # Sfondo con colore del livello
@@ -710,33 +1180,37 @@ class Game:
         self.screen.fill(level_config.background_color)
         
         # Titolo del livello
-        title_text = self.font_large.render(f"LIVELLO {level_config.level_number}", True, WHITE)
+        title_text = text_cache.render(self.font_large, f"LIVELLO {level_config.level_number}", WHITE)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3 - 50))
         self.screen.blit(title_text, title_rect)
         
         # Nome del livello
-        name_text = self.font_medium.render(level_config.name, True, (255, 215, 0))
+        name_text = text_cache.render(self.font_medium, level_config.name, (255, 215, 0))
         name_rect = name_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3))
         self.screen.blit(name_text, name_rect)
         
         # Descrizione
-        desc_text = self.font_small.render(level_config.description, True, WHITE)
+        desc_text = text_cache.render(self.font_small, level_config.description, WHITE)
         desc_rect = desc_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3 + 40))
         self.screen.blit(desc_text, desc_rect)
         
         # Obiettivi
-        objectives_title = self.font_medium.render("OBIETTIVI:", True, WHITE)
+        objectives_title = text_cache.render(self.font_medium, "OBIETTIVI:", WHITE)
         objectives_rect = objectives_title.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
         self.screen.blit(objectives_title, objectives_rect)
         
         objectives = self.level_manager.get_objectives_text()
         for i, objective in enumerate(objectives):
-            obj_text = self.font_small.render(objective, True, GREEN)
+            obj_text = text_cache.render(self.font_small, objective, GREEN)
             obj_rect = obj_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 40 + i * 25))
             self.screen.blit(obj_text, obj_rect)
         
-        # Istruzioni
-        start_text = self.font_medium.render("Premi ENTER per iniziare", True, WHITE)
+        # Istruzioni (o avanzamento del caricamento degli sprite)
+        if self.preload_job is not None:
+            self._draw_loading_bar(self.preload_job.progress)
+            return
+            
+        start_text = text_cache.render(self.font_medium, "Premi ENTER per iniziare", WHITE)
         start_rect = start_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100))
         self.screen.blit(start_text, start_rect)
         
@@ -745,30 +1219,30 @@ class Game:
         self.screen.fill((0, 50, 0))  # Verde scuro
         
         # Titolo
-        complete_text = self.font_large.render("LIVELLO COMPLETATO!", True, (0, 255, 0))
+        complete_text = text_cache.render(self.font_large, "LIVELLO COMPLETATO!", (0, 255, 0))
         complete_rect = complete_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3))
         self.screen.blit(complete_text, complete_rect)
         
         # Statistiche
         stats_y = SCREEN_HEIGHT // 2
-        score_text = self.font_medium.render(f"Punteggio: {self.total_score}", True, WHITE)
+        score_text = text_cache.render(self.font_medium, f"Punteggio: {self.total_score}", WHITE)
         score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, stats_y))
         self.screen.blit(score_text, score_rect)
         
-        enemies_text = self.font_medium.render(f"Nemici sconfitti: {self.enemies_killed}", True, WHITE)
+        enemies_text = text_cache.render(self.font_medium, f"Nemici sconfitti: {self.enemies_killed}", WHITE)
         enemies_rect = enemies_text.get_rect(center=(SCREEN_WIDTH // 2, stats_y + 30))
         self.screen.blit(enemies_text, enemies_rect)
         
         # Istruzioni
         if self.level_manager.current_level < self.level_manager.max_level:
-            next_text = self.font_medium.render("Premi ENTER per il prossimo livello", True, WHITE)
+            next_text = text_cache.render(self.font_medium, "Premi ENTER per il prossimo livello", WHITE)
         else:
-            next_text = self.font_medium.render("Ultimo livello completato!", True, (255, 215, 0))
+            next_text = text_cache.render(self.font_medium, "Ultimo livello completato!", (255, 215, 0))
             
         next_rect = next_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100))
         self.screen.blit(next_text, next_rect)
         
-        menu_text = self.font_small.render("Premi ESC per il menu", True, WHITE)
+        menu_text = text_cache.render(self.font_small, "Premi ESC per il menu", WHITE)
         menu_rect = menu_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 60))
         self.screen.blit(menu_text, menu_rect)
         
@@ -777,7 +1251,7 @@ class Game:
         self.screen.fill((50, 0, 0))  # Rosso scuro
         
         # Titolo
-        failed_text = self.font_large.render("LIVELLO FALLITO", True, (255, 0, 0))
+        failed_text = text_cache.render(self.font_large, "LIVELLO FALLITO", (255, 0, 0))
         failed_rect = failed_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3))
         self.screen.blit(failed_text, failed_rect)
         
@@ -787,15 +1261,15 @@ class Game:
         else:
             reason = "Tempo scaduto!"
             
-        reason_text = self.font_medium.render(reason, True, WHITE)
+        reason_text = text_cache.render(self.font_medium, reason, WHITE)
         reason_rect = reason_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
         self.screen.blit(reason_text, reason_rect)
         
         # Istruzioni
-        retry_text = self.font_medium.render("Premi R per riprovare", True, WHITE)
+        retry_text = text_cache.render(self.font_medium, "Premi R per riprovare", WHITE)
         retry_rect = retry_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100))
         self.screen.blit(retry_text, retry_rect)
         
-        menu_text = self.font_small.render("Premi ESC per il menu", True, WHITE)
+        menu_text = text_cache.render(self.font_small, "Premi ESC per il menu", WHITE)
         menu_rect = menu_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 60))
         self.screen.blit(menu_text, menu_rect) 
\ No newline at end of file
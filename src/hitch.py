@@ -0,0 +1,224 @@
+"""
+Rilevamento dei frame oltre budget (hitch) con log strutturato in JSONL
+"""
+from typing import Dict, List, Optional
+import gc
+import json
+import os
+import time
+from src.config import HITCH_BUDGET_MS, HITCH_LOG_PATH, HITCH_LOG_MAX_BYTES, HITCH_PRINT
+from src.sprite_manager import sprite_manager
+
+
+class GCMonitor:
+    """
+    Conta le raccolte del garbage collector e la durata delle pause
+
+    I contatori sono cumulativi: chi li usa ne calcola l'incremento tra due
+    letture, come per i contatori del profiler. Il callback del garbage
+    collector è registrato solo mentre qualcuno lo usa (log degli hitch,
+    tracciamento delle allocazioni): ogni install() va chiuso da uninstall().
+    """
+
+    def __init__(self):
+        """Inizializza i contatori"""
+        self.collections = [0, 0, 0]  # Raccolte per generazione
+        self.pause_seconds = 0.0
+        self._start = 0.0
+        self._users = 0
+
+    def install(self) -> None:
+        """Registra il callback del garbage collector (al primo utente)"""
+        self._users += 1
+        if self._users == 1:
+            gc.callbacks.append(self._on_gc)
+
+    def uninstall(self) -> None:
+        """Rimuove il callback del garbage collector (all'ultimo utente)"""
+        if self._users == 0:
+            return
+        self._users -= 1
+        if self._users == 0:
+            gc.callbacks.remove(self._on_gc)
+
+    def _on_gc(self, phase: str, info: Dict[str, int]) -> None:
+        """Callback di gc: misura ogni raccolta dall'inizio alla fine"""
+        if phase == "start":
+            self._start = time.perf_counter()
+        else:
+            self.pause_seconds += time.perf_counter() - self._start
+            self.collections[info['generation']] += 1
+
+
+# Istanza globale del monitor del garbage collector
+gc_monitor = GCMonitor()
+
+
+class HitchDetector:
+    """
+    Segnala i frame che superano il budget e ne registra le possibili cause
+
+    Per ogni hitch scrive una riga JSON con numero del frame, stato del
+    gioco, tempi delle fasi, sprite caricati (miss della cache), raccolte
+    del GC, eventuale cambio di stato o livello e numero di entità. Il log
+    ruota in un file ".1" quando supera la dimensione massima.
+    """
+
+    def __init__(self, budget_ms: float = HITCH_BUDGET_MS,
+                 log_path: Optional[str] = HITCH_LOG_PATH,
+                 max_log_bytes: int = HITCH_LOG_MAX_BYTES,
+                 print_hitches: bool = HITCH_PRINT):
+        """
+        Inizializza il rilevatore
+
+        Args:
+            budget_ms: Durata massima di un frame prima di considerarlo un hitch
+            log_path: File JSONL degli hitch, None per non scrivere su disco
+            max_log_bytes: Dimensione oltre la quale il log viene ruotato
+            print_hitches: True per stampare anche ogni hitch su stdout
+        """
+        self.budget_ms = budget_ms
+        self.log_path = log_path
+        self.max_log_bytes = max_log_bytes
+        self.print_hitches = print_hitches
+
+        # Le raccolte del GC servono solo se gli hitch finiscono da qualche parte
+        self._monitors_gc = bool(log_path) or print_hitches
+        if self._monitors_gc:
+            gc_monitor.install()
+
+        self.frame_number = 0
+        self.hitch_count = 0
+        self.last_hitch: Optional[Dict[str, object]] = None
+
+        # Valori all'inizio del frame, per calcolare cosa è successo durante
+        self._sprite_misses = sprite_manager.sprites.misses
+        self._gc_collections = list(gc_monitor.collections)
+        self._gc_pause = gc_monitor.pause_seconds
+        self._state: Optional[str] = None
+        self._level = 0
+        self._tick_count = 0
+
+    def end_frame(self, game, events_seconds: float, update_seconds: float,
+                  draw_seconds: float,
+                  subphases: Optional[Dict[str, float]] = None) -> Optional[Dict[str, object]]:
+        """
+        Chiude un frame e, se ha superato il budget, ne registra il record
+
+        Args:
+            game: Gioco di cui leggere stato, livello ed entità
+            events_seconds: Durata della gestione eventi
+            update_seconds: Durata degli aggiornamenti (tutti i tick del frame)
+            draw_seconds: Durata del disegno
+            subphases: Tempi delle sotto-fasi, se il profiler è attivo
+
+        Returns:
+            Record dell'hitch, None se il frame è rientrato nel budget
+        """
+        frame_ms = (events_seconds + update_seconds + draw_seconds) * 1000
+        record = None
+
+        if frame_ms > self.budget_ms:
+            record = self._build_record(game, frame_ms, events_seconds, update_seconds,
+                                        draw_seconds, subphases)
+            self.hitch_count += 1
+            self.last_hitch = record
+            if self.print_hitches:
+                print(f"⚠️ Hitch al frame {self.frame_number}: {frame_ms:.1f} ms "
+                      f"({', '.join(record['causes'])})")
+            if self.log_path:
+                self._write(record)
+
+        self._snapshot(game)
+        self.frame_number += 1
+        return record
+
+    def close(self) -> None:
+        """Smette di seguire il garbage collector (alla chiusura del gioco)"""
+        if self._monitors_gc:
+            gc_monitor.uninstall()
+            self._monitors_gc = False
+
+    def _snapshot(self, game) -> None:
+        """Memorizza i contatori all'inizio del prossimo frame"""
+        self._sprite_misses = sprite_manager.sprites.misses
+        self._gc_collections[:] = gc_monitor.collections
+        self._gc_pause = gc_monitor.pause_seconds
+        self._state = game.state
+        self._level = game.level_manager.current_level
+        self._tick_count = game.sim_clock.tick_count
+
+    def _build_record(self, game, frame_ms: float, events_seconds: float,
+                      update_seconds: float, draw_seconds: float,
+                      subphases: Optional[Dict[str, float]]) -> Dict[str, object]:
+        """
+        Compone il record di un hitch
+
+        Returns:
+            Dizionario serializzabile in JSON
+        """
+        phases = {
+            'events': events_seconds * 1000,
+            'update': update_seconds * 1000,
+            'draw': draw_seconds * 1000,
+        }
+        sprite_misses = sprite_manager.sprites.misses - self._sprite_misses
+        gc_collections = [now - before for now, before
+                          in zip(gc_monitor.collections, self._gc_collections)]
+        gc_pause_ms = (gc_monitor.pause_seconds - self._gc_pause) * 1000
+        level = game.level_manager.current_level
+        level_transition = self._state is not None and (
+            game.state != self._state or level != self._level
+        )
+
+        causes: List[str] = []
+        if sprite_misses:
+            causes.append("sprite_load")
+        if any(gc_collections):
+            causes.append("gc")
+        if level_transition:
+            causes.append("level_transition")
+        if not causes:
+            causes.append(f"slow_{max(phases, key=phases.get)}")
+
+        record: Dict[str, object] = {
+            'frame': self.frame_number,
+            'timestamp': time.time(),
+            'frame_ms': round(frame_ms, 3),
+            'budget_ms': self.budget_ms,
+            'state': game.state,
+            'previous_state': self._state,
+            'level': level,
+            'ticks': game.sim_clock.tick_count - self._tick_count,
+            'phases_ms': {name: round(value, 3) for name, value in phases.items()},
+            'sprite_cache_misses': sprite_misses,
+            'gc_collections': gc_collections,
+            'gc_pause_ms': round(gc_pause_ms, 3),
+            'level_transition': level_transition,
+            'entities': {
+                'enemies': len(game.enemies),
+                'collectibles': len(game.collectibles),
+            },
+            'causes': causes,
+        }
+        if subphases:
+            record['subphases_ms'] = {name: round(value * 1000, 3)
+                                      for name, value in subphases.items()}
+        return record
+
+    def _write(self, record: Dict[str, object]) -> None:
+        """
+        Aggiunge un record al log, ruotandolo se supera la dimensione massima
+
+        Args:
+            record: Record da scrivere
+        """
+        line = json.dumps(record) + "\n"
+        try:
+            if (os.path.exists(self.log_path) and
+                    os.path.getsize(self.log_path) + len(line) > self.max_log_bytes):
+                os.replace(self.log_path, self.log_path + ".1")
+            with open(self.log_path, "a", encoding="utf-8") as log_file:
+                log_file.write(line)
+        except OSError as e:
+            print(f"❌ Impossibile scrivere il log degli hitch: {e}")
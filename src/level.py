@@ -1,11 +1,20 @@
 """
 Sistema di gestione dei livelli del gioco
 """
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 import random
-from src.config import SCREEN_WIDTH, GROUND_Y
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, GROUND_Y, PLAYER_WIDTH, PLAYER_HEIGHT
+from src.tracing import traced
+
+# Sprite (nome, dimensione) usati dalle entità, da dichiarare negli asset dei livelli
+PLAYER_ASSETS: List[Tuple[str, Tuple[int, int]]] = [
+    ("cavaliereariposo", (PLAYER_WIDTH, PLAYER_HEIGHT)),
+    ("cavaliereattacco", (PLAYER_WIDTH, PLAYER_HEIGHT)),
+]
+DEMON_ASSET: Tuple[str, Tuple[int, int]] = ("demone", (56, 74))
+BOSS_ASSET: Tuple[str, Tuple[int, int]] = ("boss", (80, 110))
 
 
 class LevelObjective(Enum):
@@ -31,6 +40,22 @@ class LevelConfig:
     boss_type: Optional[str] = None
     background_color: tuple = (20, 20, 40)  # Colore di sfondo
     background_image: Optional[str] = None  # Nome del file di sfondo
+    assets: List[Tuple[str, Tuple[int, int]]] = field(default_factory=list)  # Sprite del livello
+    
+    def get_asset_manifest(self) -> List[Tuple[str, Tuple[int, int]]]:
+        """
+        Restituisce tutti gli sprite che il livello usa, fondale compreso
+        
+        Returns:
+            Lista di tuple (nome sprite, (width, height))
+        """
+        manifest = []
+        if self.background_image:
+            manifest.append((self.background_image, (SCREEN_WIDTH, SCREEN_HEIGHT)))
+        for asset in self.assets:
+            if asset not in manifest:
+                manifest.append(asset)
+        return manifest
     
     
 class LevelManager:
@@ -67,7 +92,8 @@ class LevelManager:
                 enemy_count=3,
                 collectible_count=6,
                 background_color=(25, 25, 50),
-                background_image="fondale1"
+                background_image="fondale1",
+                assets=PLAYER_ASSETS + [DEMON_ASSET]
             ),
             
             2: LevelConfig(
@@ -81,7 +107,8 @@ class LevelManager:
                 collectible_count=8,
                 time_limit=120,  # 2 minuti per raccogliere tutto
                 background_color=(40, 20, 20),
-                background_image="fondale2"
+                background_image="fondale2",
+                assets=PLAYER_ASSETS + [DEMON_ASSET]
             ),
             
             3: LevelConfig(
@@ -96,7 +123,8 @@ class LevelManager:
                 collectible_count=4,  # Pochi tesori per cure
                 time_limit=60,  # Completa QUANDO raggiungi 60 secondi
                 background_color=(50, 25, 25),
-                background_image="fondale3"
+                background_image="fondale3",
+                assets=PLAYER_ASSETS + [DEMON_ASSET]
             ),
             
             4: LevelConfig(
@@ -111,7 +139,8 @@ class LevelManager:
                 target_score=None,  # Nessun punteggio richiesto
                 boss_type="final_boss",
                 background_color=(80, 20, 20),  # Rosso più intenso per il boss
-                background_image="fondale 4"  # Nota: il file ha uno spazio nel nome
+                background_image="fondale 4",  # Nota: il file ha uno spazio nel nome
+                assets=PLAYER_ASSETS + [BOSS_ASSET]
             ),
             
             5: LevelConfig(
@@ -126,7 +155,8 @@ class LevelManager:
                 collectible_count=1,  # Un solo tesoro per testare facilmente
                 boss_type="demon_lord",
                 background_color=(60, 10, 10),  # Rosso scuro per il finale
-                background_image="fondale 4"  # Riusiamo il fondale4 per il finale epico
+                background_image="fondale 4",  # Riusiamo il fondale4 per il finale epico
+                assets=PLAYER_ASSETS + [BOSS_ASSET]
             )
         }
         
@@ -139,13 +169,24 @@ class LevelManager:
         """
         return self.levels_config[self.current_level]
         
+    def get_next_level_config(self) -> Optional[LevelConfig]:
+        """
+        Restituisce la configurazione del livello successivo
+        
+        Returns:
+            Configurazione del prossimo livello, None se quello attuale è l'ultimo
+        """
+        if self.current_level >= self.max_level:
+            return None
+        return self.levels_config.get(self.current_level + 1)
+        
     def start_level(self, level_number: int, current_time: int) -> None:
         """
         Inizia un nuovo livello
         
         Args:
             level_number: Numero del livello da iniziare
-            current_time: Tempo corrente in millisecondi
+            current_time: Tempo di simulazione corrente in millisecondi (SimulationClock)
         """
         self.current_level = level_number
         self.level_complete = False
@@ -157,10 +198,11 @@ class LevelManager:
         Aggiorna il timer del livello
         
         Args:
-            current_time: Tempo corrente in millisecondi
+            current_time: Tempo di simulazione corrente in millisecondi (SimulationClock)
         """
         self.level_time_elapsed = (current_time - self.level_start_time) // 1000
         
+    @traced("LevelManager.check_level_objectives")
     def check_level_objectives(self, game_stats: Dict[str, Any]) -> bool:
         """
         Controlla se gli obiettivi del livello sono stati completati
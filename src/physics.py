@@ -0,0 +1,282 @@
+"""
+Fisica dei corpi dinamici (player e nemici): gravità, integrazione e contatti
+"""
+from array import array
+from typing import List, Optional, Sequence, Tuple
+from src.config import GRAVITY, GROUND_Y, SCREEN_WIDTH
+from src.platform import LANDING_SNAP, LANDING_TOLERANCE, PlatformIndex
+from src.terrain import TerrainMap
+
+
+def integrate_body(x: float, y: float, vel_y: float, width: int, height: int, on_ground: bool,
+                   gravity: float = GRAVITY, platforms: Optional[PlatformIndex] = None,
+                   terrain: Optional[TerrainMap] = None,
+                   world_width: int = SCREEN_WIDTH) -> Tuple[float, float, float, bool]:
+    """
+    Esegue un passo fisico di un corpo
+
+    Applica la gravità (se il corpo non è appoggiato), integra la velocità,
+    tiene il corpo nei limiti orizzontali e risolve i contatti: prima le
+    piattaforme, con il controllo continuo dal fondo di partenza (un corpo
+    fermo su una piattaforma resta appoggiato), poi il terreno della mappa
+    sotto il centro del corpo (GROUND_Y senza mappa).
+
+    Args:
+        x: Posizione x
+        y: Posizione y
+        vel_y: Velocità verticale
+        width: Larghezza del corpo
+        height: Altezza del corpo
+        on_ground: True se il corpo era appoggiato
+        gravity: Accelerazione di gravità (0 se già applicata)
+        platforms: Indice delle piattaforme (None = il corpo le ignora)
+        terrain: Mappa del terreno (None = suolo piatto a GROUND_Y)
+        world_width: Larghezza del livello
+
+    Returns:
+        Tupla (x, y, vel_y, on_ground) dopo il passo
+    """
+    if x < 0:
+        x = 0
+    elif x > world_width - width:
+        x = world_width - width
+
+    ground_y = GROUND_Y if terrain is None else terrain.ground_height(x + width // 2)
+
+    # Fermo sul terreno (il caso comune): resta appoggiato, le piattaforme
+    # sono tutte sopra il terreno
+    if on_ground and vel_y == 0 and y + height == ground_y:
+        return x, y, 0, True
+
+    if not on_ground:
+        vel_y += gravity
+
+    previous_bottom = y + height
+    y += vel_y
+
+    # Piattaforme (solo dall'alto: in salita si attraversano)
+    if vel_y >= 0 and platforms:
+        bottom = y + height
+        left = int(x)
+        platform = platforms.find_surface(left, left + width,
+                                          min(previous_bottom, bottom) - LANDING_TOLERANCE,
+                                          bottom + LANDING_SNAP)
+        if platform is not None:
+            return x, platform.get_top_y() - height, 0, True
+
+    # Terreno (suolo o rampa)
+    if y >= ground_y - height:
+        return x, ground_y - height, 0, True
+    return x, y, vel_y, False
+
+
+class PhysicsWorld:
+    """
+    Passo fisico unico per tutti i corpi dinamici del livello
+
+    Il mondo tiene una lista persistente dei corpi (player e nemici) e il
+    loro stato fisico in array contigui (posizioni, velocità, dimensioni,
+    appoggio) allineati per indice: sync() la ricostruisce solo quando
+    cambia la lista dei nemici, remove() toglie un corpo morto senza
+    ricostruirla. Il passo integra tutti i corpi in un solo ciclo sugli
+    array, senza una chiamata per corpo, e riscrive sulle entità solo gli
+    attributi cambiati. Un corpo fermo e appoggiato si addormenta: finché
+    posizione e velocità restano quelle scritte dal mondo e la geometria
+    del livello non cambia, il passo lo salta con un confronto sugli array.
+
+    I corpi espongono x, y, vel_y, width, height, on_ground e rect; input e
+    IA continuano a modificarne x e vel_y, il mondo aggiorna il resto. La
+    fisica è la stessa di integrate_body, usata dagli update() per entità.
+    """
+
+    def __init__(self, gravity: float = GRAVITY, world_width: int = SCREEN_WIDTH):
+        """
+        Inizializza il mondo
+
+        Args:
+            gravity: Accelerazione di gravità per tick
+            world_width: Larghezza del livello in pixel
+        """
+        self.gravity = gravity
+        self.world_width = world_width
+
+        self.bodies: List[object] = []
+        self.xs = array('d')
+        self.ys = array('d')
+        self.velocities = array('d')
+        self.widths = array('h')
+        self.heights = array('h')
+        self.grounded = array('b')
+        self.sleeping = array('b')
+
+        # Lista dei nemici seguita da sync()
+        self._enemies: Optional[Sequence[object]] = None
+
+        # Geometria dell'ultimo passo: se cambia, tutti i corpi si svegliano
+        self._platforms: Optional[PlatformIndex] = None
+        self._terrain: Optional[TerrainMap] = None
+
+        # Corpi integrati nell'ultimo passo (gli altri dormivano)
+        self.awake_count = 0
+
+    def clear(self) -> None:
+        """Dimentica tutti i corpi"""
+        self.bodies.clear()
+        for values in (self.xs, self.ys, self.velocities, self.widths, self.heights,
+                       self.grounded, self.sleeping):
+            del values[:]
+        self._enemies = None
+        self.awake_count = 0
+
+    def add(self, body: object) -> None:
+        """
+        Aggiunge un corpo in fondo alla lista (parte sveglio)
+
+        Args:
+            body: Corpo dinamico da simulare
+        """
+        self.bodies.append(body)
+        self.xs.append(body.x)
+        self.ys.append(body.y)
+        self.velocities.append(body.vel_y)
+        self.widths.append(body.width)
+        self.heights.append(body.height)
+        self.grounded.append(body.on_ground)
+        self.sleeping.append(False)
+
+    def remove(self, body: object) -> None:
+        """
+        Toglie un corpo (es. un nemico morto), senza ricostruire la lista
+
+        Args:
+            body: Corpo da togliere (ignorato se assente)
+        """
+        for index, known in enumerate(self.bodies):
+            if known is body:
+                break
+        else:
+            return
+        del self.bodies[index]
+        for values in (self.xs, self.ys, self.velocities, self.widths, self.heights,
+                       self.grounded, self.sleeping):
+            del values[index]
+
+    def sync(self, player: object, enemies: Sequence[object]) -> None:
+        """
+        Allinea i corpi a player e nemici, ricaricandoli solo se sono cambiati
+
+        Come SpatialHash.sync(): la lista viene ricostruita quando il player
+        o la lista dei nemici sono stati sostituiti, o quando la lista è
+        stata modificata senza passare da remove().
+
+        Args:
+            player: Corpo del player (sempre il primo)
+            enemies: Lista dei nemici del livello
+        """
+        bodies = self.bodies
+        if (enemies is self._enemies and len(bodies) == len(enemies) + 1 and
+                bodies[0] is player):
+            return
+        self.clear()
+        self.add(player)
+        for enemy in enemies:
+            self.add(enemy)
+        self._enemies = enemies
+
+    def step(self, platforms: Optional[PlatformIndex] = None,
+             terrain: Optional[TerrainMap] = None) -> None:
+        """
+        Esegue un passo fisico per tutti i corpi
+
+        Args:
+            platforms: Indice delle piattaforme del livello
+            terrain: Mappa del terreno del livello
+        """
+        if platforms is not self._platforms or terrain is not self._terrain:
+            self._platforms = platforms
+            self._terrain = terrain
+            for index in range(len(self.sleeping)):
+                self.sleeping[index] = False
+
+        bodies = self.bodies
+        xs = self.xs
+        ys = self.ys
+        velocities = self.velocities
+        widths = self.widths
+        heights = self.heights
+        grounded = self.grounded
+        sleeping = self.sleeping
+        gravity = self.gravity
+        world_width = self.world_width
+        ground_height = None if terrain is None else terrain.ground_height
+        awake = 0
+
+        for index in range(len(bodies)):
+            body = bodies[index]
+            body_x = x = body.x
+            body_y = y = body.y
+            body_vel_y = vel_y = body.vel_y
+            body_on_ground = on_ground = body.on_ground
+
+            # Fermo dove l'ha lasciato il mondo: nulla da integrare
+            if sleeping[index] and x == xs[index] and y == ys[index] and vel_y == 0 and on_ground:
+                continue
+            awake += 1
+
+            width = widths[index]
+            height = heights[index]
+            if x < 0:
+                x = 0
+            elif x > world_width - width:
+                x = world_width - width
+            ground_y = GROUND_Y if ground_height is None else ground_height(x + width // 2)
+
+            # Appoggiato sul terreno (il caso comune) resta appoggiato: le
+            # piattaforme sono tutte sopra il terreno. Altrimenti gravità,
+            # piattaforme (solo dall'alto) e terreno, come integrate_body
+            if not (on_ground and vel_y == 0 and y + height == ground_y):
+                if not on_ground:
+                    vel_y += gravity
+                previous_bottom = y + height
+                y += vel_y
+                platform = None
+                if vel_y >= 0 and platforms:
+                    bottom = y + height
+                    left = int(x)
+                    platform = platforms.find_surface(left, left + width,
+                                                      min(previous_bottom, bottom) - LANDING_TOLERANCE,
+                                                      bottom + LANDING_SNAP)
+                if platform is not None:
+                    y = platform.get_top_y() - height
+                    vel_y = 0
+                    on_ground = True
+                elif y >= ground_y - height:
+                    y = ground_y - height
+                    vel_y = 0
+                    on_ground = True
+                else:
+                    on_ground = False
+
+            # Riscrive sull'entità solo ciò che è cambiato
+            if x != body_x:
+                body.x = x
+            if y != body_y:
+                body.y = y
+            if vel_y != body_vel_y:
+                body.vel_y = vel_y
+            if on_ground != body_on_ground:
+                body.on_ground = on_ground
+            if x != xs[index] or y != ys[index]:
+                rect = body.rect
+                rect.x = x
+                rect.y = y
+                xs[index] = x
+                ys[index] = y
+            velocities[index] = vel_y
+            grounded[index] = on_ground
+            sleeping[index] = on_ground and vel_y == 0
+
+        self.awake_count = awake
+
+    def __len__(self) -> int:
+        return len(self.bodies)
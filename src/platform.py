@@ -1,9 +1,17 @@
 """
 Classi per le piattaforme e rampe del gioco
 """
-from typing import List, Tuple
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Sequence, Tuple
 import pygame
-from src.config import BROWN, BLACK, GRAY, SCREEN_WIDTH, GROUND_Y
+from src.config import BROWN, BLACK, GRAY, SCREEN_WIDTH, GROUND_Y, PLATFORM_INDEX_BUCKET_WIDTH
+
+# Atterraggio su una piattaforma: il fondo del corpo può essere fino a
+# LANDING_SNAP pixel sopra il top o LANDING_TOLERANCE pixel sotto, e il corpo
+# deve sporgere oltre il bordo rientrato di LANDING_EDGE_INSET pixel
+LANDING_SNAP = 3
+LANDING_TOLERANCE = 8
+LANDING_EDGE_INSET = 5
 
 
 class Platform:
@@ -226,14 +234,166 @@ def create_default_ramps() -> List[Ramp]:
     return ramps
 
 
-def check_platform_collision(player_rect: pygame.Rect, player_vel_y: int, platforms: List[Platform]) -> Tuple[bool, int]:
+class PlatformIndex:
+    """
+    Indice statico delle piattaforme di un livello per i controlli di atterraggio
+    
+    Le piattaforme sono divise in colonne larghe bucket_width (ognuna
+    compare in tutte le colonne coperte dal suo bordo calpestabile) e in
+    ogni colonna sono ordinate per top. Un corpo in caduta esamina solo le
+    colonne toccate dal suo intervallo orizzontale e, con una bisezione, solo
+    i top nella sua finestra verticale. Costruito una volta per livello, serve
+    qualunque corpo (player, nemici).
+    """
+    
+    # Ultimo indice costruito da for_platforms(), riusato finché la lista non cambia
+    _last_built: Optional["PlatformIndex"] = None
+    
+    def __init__(self, platforms: Sequence[Platform], bucket_width: int = PLATFORM_INDEX_BUCKET_WIDTH):
+        """
+        Costruisce l'indice
+        
+        Args:
+            platforms: Piattaforme del livello
+            bucket_width: Larghezza di una colonna in pixel
+        """
+        self.platforms = platforms
+        self.bucket_width = bucket_width
+        self._platform_count = len(platforms)
+        
+        # Per colonna: top ordinati e piattaforme nello stesso ordine
+        self._tops: Dict[int, List[int]] = {}
+        self._bucket_platforms: Dict[int, List[Platform]] = {}
+        
+        entries: Dict[int, List[Tuple[int, Platform]]] = {}
+        for platform in platforms:
+            # Bordi rientrati (su una piattaforma stretta possono incrociarsi)
+            inset_left = platform.x + LANDING_EDGE_INSET
+            inset_right = platform.x + platform.width - LANDING_EDGE_INSET
+            first = min(inset_left, inset_right) // bucket_width
+            last = max(inset_left, inset_right) // bucket_width
+            top = platform.get_top_y()
+            for bucket in range(first, last + 1):
+                entries.setdefault(bucket, []).append((top, platform))
+                
+        for bucket, bucket_entries in entries.items():
+            bucket_entries.sort(key=lambda entry: entry[0])
+            self._tops[bucket] = [entry[0] for entry in bucket_entries]
+            self._bucket_platforms[bucket] = [entry[1] for entry in bucket_entries]
+            
+    @classmethod
+    def for_platforms(cls, platforms) -> "PlatformIndex":
+        """
+        Restituisce l'indice di una lista di piattaforme senza ricostruirlo a ogni tick
+        
+        Nel gioco si passa direttamente l'indice del livello; chi passa una
+        lista riusa l'ultimo indice costruito finché is_built_from() lo conferma.
+        
+        Args:
+            platforms: PlatformIndex o lista di piattaforme
+            
+        Returns:
+            Indice delle piattaforme
+        """
+        if isinstance(platforms, PlatformIndex):
+            return platforms
+        if PlatformIndex._last_built is None or not PlatformIndex._last_built.is_built_from(platforms):
+            PlatformIndex._last_built = cls(platforms)
+        return PlatformIndex._last_built
+        
+    def is_built_from(self, platforms: Sequence[Platform]) -> bool:
+        """
+        Controlla se l'indice è aggiornato rispetto a una lista di piattaforme
+        
+        Args:
+            platforms: Lista di piattaforme del livello
+            
+        Returns:
+            True se l'indice è stato costruito da questa lista e la lista non è cambiata
+        """
+        return platforms is self.platforms and len(platforms) == self._platform_count
+        
+    def find_surface(self, left: int, right: int, min_top: int, max_top: int) -> Optional[Platform]:
+        """
+        Cerca la piattaforma più alta sotto un intervallo orizzontale
+        
+        Args:
+            left: Bordo sinistro del corpo
+            right: Bordo destro del corpo
+            min_top: Top minimo accettato
+            max_top: Top massimo accettato
+            
+        Returns:
+            Piattaforma con il top più piccolo in [min_top, max_top] o None
+        """
+        best: Optional[Platform] = None
+        best_top = max_top + 1
+        bucket_width = self.bucket_width
+        for bucket in range(left // bucket_width, (right - 1) // bucket_width + 1):
+            tops = self._tops.get(bucket)
+            if not tops:
+                continue
+            bucket_platforms = self._bucket_platforms[bucket]
+            start = bisect_left(tops, min_top)
+            end = bisect_right(tops, best_top - 1)
+            for index in range(start, end):
+                platform = bucket_platforms[index]
+                if (right > platform.x + LANDING_EDGE_INSET and
+                        left < platform.x + platform.width - LANDING_EDGE_INSET):
+                    best = platform
+                    best_top = tops[index]
+                    break  # Le successive della colonna sono più in basso
+        return best
+        
+    def find_landing(self, body_rect: pygame.Rect, vel_y: float,
+                     previous_bottom: Optional[int] = None) -> Tuple[bool, int]:
+        """
+        Controlla se un corpo in caduta atterra su una piattaforma
+        
+        Il controllo è continuo: vale il tratto percorso dal fondo del corpo
+        tra il tick precedente e quello corrente, quindi un corpo veloce (o un
+        passo di simulazione lungo) non attraversa le piattaforme sottili.
+        Tra quelle attraversate vince la più alta, la prima incontrata.
+        
+        Args:
+            body_rect: Rect del corpo dopo lo spostamento
+            vel_y: Velocità verticale del corpo
+            previous_bottom: Fondo del corpo prima dello spostamento
+                (None = solo la posizione corrente)
+            
+        Returns:
+            Tupla (is_on_platform, platform_y) - True se su piattaforma e Y della piattaforma
+        """
+        if vel_y <= 0:  # Solo se sta cadendo
+            return False, 0
+            
+        bottom = body_rect.bottom
+        if previous_bottom is None or previous_bottom > bottom:
+            previous_bottom = bottom
+        platform = self.find_surface(body_rect.left, body_rect.right,
+                                     previous_bottom - LANDING_TOLERANCE, bottom + LANDING_SNAP)
+        if platform is None:
+            return False, 0
+        return True, platform.get_top_y()
+        
+    def __len__(self) -> int:
+        return self._platform_count
+
+
+def check_platform_collision(player_rect: pygame.Rect, player_vel_y: int, platforms,
+                             previous_bottom: Optional[int] = None) -> Tuple[bool, int]:
     """
     Controlla le collisioni del player con le piattaforme
     
+    Nel gioco si passa l'indice del livello; con una lista viene riusato
+    l'indice di PlatformIndex.for_platforms().
+    
     Args:
         player_rect: Rect del player
         player_vel_y: Velocità verticale del player
-        platforms: Lista di piattaforme
+        platforms: PlatformIndex del livello o lista di piattaforme
+        previous_bottom: Fondo del player al tick precedente, per il
+            controllo continuo (None = solo la posizione corrente)
         
     Returns:
         Tupla (is_on_platform, platform_y) - True se su piattaforma e Y della piattaforma
@@ -241,17 +401,7 @@ def check_platform_collision(player_rect: pygame.Rect, player_vel_y: int, platfo
     if player_vel_y <= 0:  # Solo se sta cadendo
         return False, 0
         
-    # Controlla ogni piattaforma
-    for platform in platforms:
-        # Il player deve essere sopra la piattaforma e in caduta
-        # Collision detection migliorata per precisione
-        if (player_rect.bottom <= platform.get_top_y() + 8 and 
-            player_rect.bottom >= platform.get_top_y() - 3 and
-            player_rect.right > platform.x + 5 and 
-            player_rect.left < platform.x + platform.width - 5):
-            return True, platform.get_top_y()
-            
-    return False, 0
+    return PlatformIndex.for_platforms(platforms).find_landing(player_rect, player_vel_y, previous_bottom)
 
 
 def check_ramp_collision(player_rect: pygame.Rect, ramps: List[Ramp]) -> Tuple[bool, int]:
@@ -1,14 +1,18 @@
 """
 Classe Player per il cavaliere protagonista
 """
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 import pygame
 from src.config import (
     PLAYER_WIDTH, PLAYER_HEIGHT, PLAYER_SPEED, PLAYER_JUMP_SPEED,
-    PLAYER_MAX_HEALTH, GRAVITY, GROUND_Y, WHITE, BROWN, SILVER,
-    KEY_LEFT, KEY_RIGHT, KEY_JUMP, KEY_ATTACK, SCREEN_WIDTH
+    PLAYER_MAX_HEALTH, GRAVITY, WHITE, BROWN, SILVER,
+    KEY_LEFT, KEY_RIGHT, KEY_JUMP, KEY_ATTACK
 )
+from src.physics import integrate_body
+from src.platform import PlatformIndex
+from src.terrain import TerrainMap
 from src.sprite_manager import sprite_manager
+from src.surface_pool import overlay_pool
 
 
 class Player:
@@ -24,6 +28,9 @@ class Player:
         """
         self.x = x
         self.y = y
+        # Posizione al tick precedente, per interpolare il disegno
+        self.prev_x = x
+        self.prev_y = y
         self.width = PLAYER_WIDTH
         self.height = PLAYER_HEIGHT
         self.speed = PLAYER_SPEED
@@ -46,18 +53,29 @@ class Player:
         # Rect per collision detection
         self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
         
-    def update(self, keys_pressed: Dict[int, bool], platforms: list = None) -> None:
+    def update(self, keys_pressed: Dict[int, bool], platforms: list = None,
+               terrain: Optional[TerrainMap] = None) -> None:
         """
-        Aggiorna lo stato del player
+        Aggiorna lo stato del player, fisica compresa
         
         Args:
             keys_pressed: Dizionario dei tasti premuti
-            platforms: Lista di piattaforme (opzionale)
+            platforms: Indice (PlatformIndex) o lista di piattaforme (opzionale)
+            terrain: Mappa del terreno del livello (None = suolo piatto a GROUND_Y)
         """
-        self._handle_input(keys_pressed)
+        self.update_controls(keys_pressed)
         self._apply_gravity()
+        self._update_position(platforms, terrain)
+        
+    def update_controls(self, keys_pressed: Dict[int, bool]) -> None:
+        """
+        Aggiorna input e attacco senza la fisica (eseguita dal PhysicsWorld)
+        
+        Args:
+            keys_pressed: Dizionario dei tasti premuti
+        """
+        self._handle_input(keys_pressed)
         self._update_attack()
-        self._update_position(platforms)
         
     def _handle_input(self, keys_pressed: Dict[int, bool]) -> None:
         """Gestisce l'input del giocatore"""
@@ -92,48 +110,24 @@ class Player:
                 self.is_attacking = False
                 self.attack_timer = 0
                 
-    def _update_position(self, platforms: list = None) -> None:
+    def _update_position(self, platforms: list = None,
+                         terrain: Optional[TerrainMap] = None) -> None:
         """
         Aggiorna la posizione del player
         
         Args:
-            platforms: Lista di piattaforme (opzionale)
+            platforms: Indice (PlatformIndex) o lista di piattaforme (opzionale)
+            terrain: Mappa del terreno del livello (None = suolo piatto a GROUND_Y)
         """
-        if platforms is None:
-            platforms = []
+        if platforms is not None:
+            platforms = PlatformIndex.for_platforms(platforms)
             
-        # Aggiorna posizione Y
-        self.y += self.vel_y
-        
-        # Controlla limiti orizzontali
-        if self.x < 0:
-            self.x = 0
-        elif self.x + self.width > SCREEN_WIDTH:
-            self.x = SCREEN_WIDTH - self.width
-        
-        # Crea rect per collision detection
-        player_rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        # Gravità già applicata da _apply_gravity()
+        self.x, self.y, self.vel_y, self.on_ground = integrate_body(
+            self.x, self.y, self.vel_y, self.width, self.height, self.on_ground,
+            0, platforms, terrain
+        )
         
-        # Controlla collisioni con piattaforme (solo se sta cadendo)
-        if self.vel_y > 0 and platforms:  # Sta cadendo
-            from src.platform import check_platform_collision
-            is_on_platform, platform_y = check_platform_collision(player_rect, self.vel_y, platforms)
-            if is_on_platform:
-                self.y = platform_y - self.height
-                self.vel_y = 0
-                self.on_ground = True
-                self.rect.x = self.x
-                self.rect.y = self.y
-                return
-            
-        # Controlla collisione con il terreno
-        if self.y >= GROUND_Y - self.height:
-            self.y = GROUND_Y - self.height
-            self.vel_y = 0
-            self.on_ground = True
-        else:
-            self.on_ground = False
-            
         # Aggiorna il rect
         self.rect.x = self.x
         self.rect.y = self.y
@@ -208,34 +202,52 @@ class Player:
         """
         return self.health > 0
         
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0) -> None:
         """
         Disegna il player sullo schermo
         
         Args:
             screen: Superficie pygame su cui disegnare
+            alpha: Frazione di tick per interpolare la posizione (1.0 = posizione attuale)
         """
+        render_x, render_y = self.get_render_position(alpha)
+        
         # Carica lo sprite appropriato (cavaliere a riposo o in attacco)
+        # (variante specchiata in cache se il player sta guardando a sinistra)
         sprite = sprite_manager.get_player_sprite(
             attacking=self.is_attacking,
-            size=(self.width, self.height)
+            size=(self.width, self.height),
+            flip_x=not self.facing_right
         )
         
-        # Capovolgi l'immagine se il player sta guardando a sinistra
-        if not self.facing_right:
-            sprite = pygame.transform.flip(sprite, True, False)
-        
         # Disegna lo sprite
-        screen.blit(sprite, (self.x, self.y))
+        screen.blit(sprite, (render_x, render_y))
         
         # Se sta attaccando, disegna un'area di attacco semi-trasparente
         if self.is_attacking:
-            attack_rect = self.get_attack_rect()
-            attack_surface = pygame.Surface((attack_rect.width, attack_rect.height))
-            attack_surface.set_alpha(100)  # Semi-trasparente
-            attack_surface.fill((255, 255, 0))  # Giallo per evidenziare l'attacco
+            attack_rect = self.get_attack_rect().move(render_x - self.x, render_y - self.y)
+            # Giallo semi-trasparente per evidenziare l'attacco (superficie dal pool)
+            attack_surface = overlay_pool.get(attack_rect.size, (255, 255, 0), 100)
             screen.blit(attack_surface, (attack_rect.x, attack_rect.y))
             
+    def store_previous_position(self) -> None:
+        """Memorizza la posizione corrente prima di un tick di simulazione"""
+        self.prev_x = self.x
+        self.prev_y = self.y
+        
+    def get_render_position(self, alpha: float = 1.0) -> Tuple[float, float]:
+        """
+        Restituisce la posizione interpolata tra gli ultimi due tick
+        
+        Args:
+            alpha: Frazione di tick trascorsa dall'ultimo aggiornamento (0.0 - 1.0)
+            
+        Returns:
+            Tupla (x, y) in cui disegnare il player
+        """
+        return (self.prev_x + (self.x - self.prev_x) * alpha,
+                self.prev_y + (self.y - self.prev_y) * alpha)
+        
     def get_position(self) -> Tuple[int, int]:
         """
         Restituisce la posizione del player
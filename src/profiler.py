@@ -0,0 +1,240 @@
+"""
+Profiler in-game: tempi per fase e contatori del frame, con overlay grafico
+"""
+from array import array
+from typing import Callable, Dict, List, Optional
+import time
+import pygame
+
+# Durata di un frame a 60 FPS, riferimento per il grafico
+FRAME_BUDGET_MS = 1000 / 60
+
+
+class _NullPhase:
+    """Fase che non misura nulla, usata quando il profiler è spento"""
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullPhase":
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class _Phase:
+    """Fase misurata: somma la durata di ogni blocco nel frame corrente"""
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: "FrameProfiler", name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> "_Phase":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        timings = self.profiler.current
+        timings[self.name] = timings.get(self.name, 0.0) + time.perf_counter() - self.start
+        return False
+
+
+class FrameProfiler:
+    """
+    Raccoglie i tempi delle fasi del game loop e li mostra in un overlay
+
+    Le fasi si annotano con "with profiler.phase(nome):"; i nomi con il punto
+    (es. "update.enemies") sono sotto-fasi di quella prima del punto. Quando
+    il profiler è spento phase() restituisce un contesto vuoto condiviso e
+    begin_frame/end_frame ritornano subito.
+    """
+
+    def __init__(self, history: int = 120, refresh_interval: int = 10):
+        """
+        Inizializza il profiler
+
+        Args:
+            history: Frame mostrati nel grafico dei tempi
+            refresh_interval: Frame tra un aggiornamento e l'altro del pannello
+        """
+        self.enabled = False
+        self.frame_number = 0
+        self.refresh_interval = refresh_interval
+
+        # Tempi (in secondi) del frame in corso e dell'ultimo completato
+        self.current: Dict[str, float] = {}
+        self.last: Dict[str, float] = {}
+
+        # Contatori del frame (entità, blit, superfici allocate)
+        self.counts: Dict[str, int] = {}
+        self._counter_sources: Dict[str, Callable[[], int]] = {}
+        self._counter_values: Dict[str, int] = {}
+
+        # Tempi dei frame recenti (ms) per il grafico, in un buffer circolare
+        self.frame_times = array('d', bytes(8 * history))
+        self._history_index = 0
+        self._frame_start = 0.0
+
+        self._phases: Dict[str, _Phase] = {}
+        self._panel: Optional[pygame.Surface] = None
+
+    def toggle(self) -> None:
+        """Mostra o nasconde il profiler"""
+        self.enabled = not self.enabled
+        self._panel = None
+        if self.enabled:
+            self._snapshot_counters()
+
+    def phase(self, name: str):
+        """
+        Restituisce il contesto che misura una fase
+
+        Args:
+            name: Nome della fase (es. "update" o "update.enemies")
+
+        Returns:
+            Context manager da usare con "with"
+        """
+        if not self.enabled:
+            return _NULL_PHASE
+        phase = self._phases.get(name)
+        if phase is None:
+            phase = self._phases[name] = _Phase(self, name)
+        return phase
+
+    def add_counter_source(self, name: str, source: Callable[[], int]) -> None:
+        """
+        Registra un contatore crescente di cui mostrare l'incremento per frame
+
+        Args:
+            name: Nome del contatore nell'overlay
+            source: Funzione che restituisce il totale corrente
+        """
+        self._counter_sources[name] = source
+        self._counter_values[name] = source()
+
+    def set_count(self, name: str, value: int) -> None:
+        """
+        Imposta un contatore del frame corrente
+
+        Args:
+            name: Nome del contatore
+            value: Valore nel frame
+        """
+        if self.enabled:
+            self.counts[name] = value
+
+    def begin_frame(self) -> None:
+        """Inizia la misura di un frame"""
+        if not self.enabled:
+            return
+        self._frame_start = time.perf_counter()
+        self.current.clear()
+
+    def end_frame(self) -> None:
+        """Chiude la misura del frame e aggiorna storico e contatori"""
+        if not self.enabled:
+            return
+        elapsed = time.perf_counter() - self._frame_start
+        self.current["frame"] = elapsed
+        self.current, self.last = self.last, self.current
+
+        self.frame_times[self._history_index] = elapsed * 1000
+        self._history_index = (self._history_index + 1) % len(self.frame_times)
+        self._snapshot_counters()
+        self.frame_number += 1
+
+    def get_frame_time_stats(self) -> Dict[str, float]:
+        """
+        Restituisce media e massimo dei tempi di frame recenti
+
+        Returns:
+            Dizionario con 'avg_ms' e 'max_ms'
+        """
+        recorded = [value for value in self.frame_times if value > 0]
+        if not recorded:
+            return {'avg_ms': 0.0, 'max_ms': 0.0}
+        return {'avg_ms': sum(recorded) / len(recorded), 'max_ms': max(recorded)}
+
+    def draw(self, screen: pygame.Surface, font: pygame.font.Font) -> Optional[pygame.Rect]:
+        """
+        Disegna l'overlay nell'angolo in alto a destra
+
+        Il pannello viene ricomposto solo ogni refresh_interval frame, così il
+        testo non viene rasterizzato a ogni frame.
+
+        Args:
+            screen: Superficie su cui disegnare
+            font: Font per i testi del pannello
+
+        Returns:
+            Area disegnata, None se il profiler è spento
+        """
+        if not self.enabled:
+            return None
+        if self._panel is None or self.frame_number % self.refresh_interval == 0:
+            self._panel = self._build_panel(font)
+        return screen.blit(self._panel, (screen.get_width() - self._panel.get_width() - 10, 10))
+
+    def _snapshot_counters(self) -> None:
+        """Calcola l'incremento dei contatori registrati dall'ultimo frame"""
+        for name, source in self._counter_sources.items():
+            value = source()
+            self.counts[name] = value - self._counter_values[name]
+            self._counter_values[name] = value
+
+    def _build_panel(self, font: pygame.font.Font) -> pygame.Surface:
+        """
+        Compone il pannello con grafico, fasi e contatori
+
+        Args:
+            font: Font per i testi
+
+        Returns:
+            Superficie semitrasparente del pannello
+        """
+        lines: List[str] = []
+        stats = self.get_frame_time_stats()
+        lines.append(f"frame {stats['avg_ms']:.2f} ms (max {stats['max_ms']:.2f})")
+        for name in sorted(self.last):
+            if name == "frame":
+                continue
+            indent = "  " if "." in name else ""
+            lines.append(f"{indent}{name}: {self.last[name] * 1000:.3f} ms")
+        for name in sorted(self.counts):
+            lines.append(f"{name}: {self.counts[name]}")
+
+        line_height = font.get_linesize()
+        graph_height = 50
+        width = 260
+        height = graph_height + 15 + line_height * len(lines)
+
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+
+        # Grafico dei tempi di frame, dal più vecchio al più recente
+        history = len(self.frame_times)
+        bar_width = max(1, (width - 10) // history)
+        scale = graph_height / (FRAME_BUDGET_MS * 2)
+        for i in range(history):
+            value = self.frame_times[(self._history_index + i) % history]
+            bar_height = min(graph_height, int(value * scale))
+            color = (0, 200, 0) if value <= FRAME_BUDGET_MS else (220, 50, 50)
+            pygame.draw.rect(panel, color, (5 + i * bar_width, 5 + graph_height - bar_height,
+                                            bar_width, bar_height))
+        budget_y = 5 + graph_height - int(FRAME_BUDGET_MS * scale)
+        pygame.draw.line(panel, (255, 255, 0), (5, budget_y), (width - 5, budget_y))
+
+        y = graph_height + 10
+        for line in lines:
+            panel.blit(font.render(line, True, (255, 255, 255)), (5, y))
+            y += line_height
+        return panel
+
+
+# Istanza globale del profiler
+profiler = FrameProfiler()
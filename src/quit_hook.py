@@ -0,0 +1,31 @@
+"""
+Svuotamento delle cache legate ai font alla chiusura di pygame
+"""
+from typing import Callable
+import pygame
+
+
+class QuitHook:
+    """Registra su pygame.quit() la pulizia di una cache, una volta per sessione"""
+
+    def __init__(self, clear: Callable[[], None]):
+        """
+        Inizializza l'hook
+
+        Args:
+            clear: Funzione che svuota la cache
+        """
+        self._clear = clear
+        self._registered = False
+
+    def ensure_registered(self) -> None:
+        """Registra l'hook se non è già attivo (pygame.quit() lo rimuove)"""
+        if not self._registered:
+            # I font non sono più validi dopo pygame.quit(): la cache va svuotata
+            pygame.register_quit(self._on_quit)
+            self._registered = True
+
+    def _on_quit(self) -> None:
+        """Svuota la cache; l'hook va registrato di nuovo alla prossima sessione"""
+        self._registered = False
+        self._clear()
@@ -0,0 +1,126 @@
+"""
+Renderer a rettangoli sporchi (dirty rects) per la schermata di gioco
+"""
+from typing import Iterable, List, Optional
+import pygame
+
+
+class DirtyRectRenderer:
+    """
+    Aggiorna solo le regioni dello schermo che cambiano tra un frame e l'altro.
+
+    Ad ogni frame le regioni sporche del frame precedente vengono ripristinate
+    dal layer di sfondo in cache, poi le entità vengono ridisegnate e segnate
+    con mark(). present() invia al display solo l'unione delle regioni del
+    frame precedente e di quello corrente tramite pygame.display.update(rects).
+    """
+
+    def __init__(self, screen: pygame.Surface):
+        """
+        Inizializza il renderer
+
+        Args:
+            screen: Superficie del display su cui disegnare
+        """
+        self.screen = screen
+        self.background: Optional[pygame.Surface] = None
+        self.previous_rects: List[pygame.Rect] = []
+        self.current_rects: List[pygame.Rect] = []
+        self.full_redraw = True
+
+        # Totale dei disegni (ripristini, blit e regioni marcate), per il profiler
+        self.blit_count = 0
+
+    def invalidate(self) -> None:
+        """Forza un ridisegno completo al prossimo frame"""
+        self.full_redraw = True
+        self.previous_rects = []
+        self.current_rects = []
+
+    def set_background(self, background: pygame.Surface) -> None:
+        """
+        Imposta il layer di sfondo usato per ripristinare le regioni sporche
+
+        Args:
+            background: Superficie grande quanto lo schermo
+        """
+        if background is not self.background:
+            self.background = background
+            self.invalidate()
+
+    def begin_frame(self) -> None:
+        """Ripristina dallo sfondo le regioni disegnate nel frame precedente"""
+        self.current_rects = []
+        if self.background is None:
+            return
+
+        if self.full_redraw:
+            self.screen.blit(self.background, (0, 0))
+            self.blit_count += 1
+        else:
+            for rect in self.previous_rects:
+                self.screen.blit(self.background, rect, rect)
+            self.blit_count += len(self.previous_rects)
+
+    def mark(self, rect: pygame.Rect) -> None:
+        """
+        Segna una regione dello schermo come modificata in questo frame
+
+        Args:
+            rect: Rettangolo modificato (coordinate schermo)
+        """
+        self.blit_count += 1
+        clipped = rect.clip(self.screen.get_rect())
+        if clipped.width > 0 and clipped.height > 0:
+            self.current_rects.append(clipped)
+
+    def blit(self, surface: pygame.Surface, dest) -> pygame.Rect:
+        """
+        Disegna una superficie e segna l'area come modificata
+
+        Args:
+            surface: Superficie da disegnare
+            dest: Posizione o rect di destinazione
+
+        Returns:
+            Rect dell'area modificata
+        """
+        rect = self.screen.blit(surface, dest)
+        self.mark(rect)
+        return rect
+
+    def present(self) -> None:
+        """Presenta il frame aggiornando solo le regioni sporche"""
+        if self.full_redraw:
+            pygame.display.flip()
+            self.full_redraw = False
+        else:
+            pygame.display.update(self.previous_rects + self.current_rects)
+
+        self.previous_rects = self.current_rects
+        self.current_rects = []
+
+
+def build_static_layer(background: pygame.Surface, platforms: Iterable,
+                       ramps: Iterable = ()) -> pygame.Surface:
+    """
+    Compone sfondo, piattaforme e rampe in un'unica superficie statica
+
+    Args:
+        background: Sfondo del livello (immagine o colore con terreno)
+        platforms: Piattaforme del livello
+        ramps: Rampe del livello
+
+    Returns:
+        Nuova superficie con tutta la geometria statica già disegnata
+    """
+    layer = background.copy()
+    if pygame.display.get_surface() is not None:
+        layer = layer.convert()
+
+    for platform in platforms:
+        platform.draw(layer)
+    for ramp in ramps:
+        ramp.draw(layer)
+
+    return layer
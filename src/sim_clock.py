@@ -0,0 +1,123 @@
+"""
+Orologio di simulazione: il tempo di gioco avanza a tick, non con l'orologio reale
+"""
+from src.config import FPS, MAX_CATCHUP_TICKS
+
+
+class SimulationClock:
+    """
+    Tempo di simulazione del gioco
+
+    Il tempo avanza di una durata fissa a ogni tick(), quindi i timer dei
+    livelli si fermano con la pausa e accelerano insieme alla simulazione.
+    L'orologio decide anche quanti tick eseguire per ogni frame: il tempo
+    reale (moltiplicato per time_scale) si accumula e viene consumato a tick
+    interi. In modalità turbo il loop esegue tick senza attendere il tempo reale.
+    """
+
+    def __init__(self, tick_rate: int = FPS, max_catchup_ticks: int = MAX_CATCHUP_TICKS):
+        """
+        Inizializza l'orologio
+
+        Args:
+            tick_rate: Tick di simulazione per secondo di gioco
+            max_catchup_ticks: Tick massimi recuperati in un frame (a velocità 1x)
+        """
+        self.tick_duration = 1.0 / tick_rate
+        self.max_catchup_ticks = max_catchup_ticks
+        self.paused = False
+        self.time_scale = 1.0
+        self.turbo = False
+        self.reset()
+
+    def reset(self) -> None:
+        """Riporta a zero il tempo di simulazione"""
+        self.tick_count = 0
+        self._accumulator = 0.0
+
+    def tick(self) -> None:
+        """Avanza il tempo di simulazione di un tick (ignorato in pausa)"""
+        if not self.paused:
+            self.tick_count += 1
+
+    def get_ticks(self) -> int:
+        """
+        Restituisce il tempo di simulazione in millisecondi
+
+        Returns:
+            Millisecondi di gioco, sostituto di pygame.time.get_ticks()
+        """
+        return int(self.tick_count * self.tick_duration * 1000)
+
+    def get_seconds(self) -> float:
+        """Restituisce il tempo di simulazione in secondi"""
+        return self.tick_count * self.tick_duration
+
+    def pause(self) -> None:
+        """Ferma il tempo di simulazione (e i tick del loop principale)"""
+        self.paused = True
+        self._accumulator = 0.0
+
+    def resume(self) -> None:
+        """Fa ripartire il tempo di simulazione"""
+        self.paused = False
+        self._accumulator = 0.0  # Niente raffica di tick per recuperare la pausa
+
+    def set_time_scale(self, scale: float) -> None:
+        """
+        Imposta la velocità della simulazione rispetto al tempo reale
+
+        Args:
+            scale: Moltiplicatore (0.5 = rallentatore, 2.0 = doppia velocità)
+        """
+        if scale <= 0:
+            raise ValueError("La scala del tempo deve essere positiva")
+        self.time_scale = scale
+
+    def set_turbo(self, enabled: bool) -> None:
+        """
+        Attiva o disattiva la modalità turbo (tick senza attendere il tempo reale)
+
+        Args:
+            enabled: True per simulare alla massima velocità possibile
+        """
+        self.turbo = enabled
+        self._accumulator = 0.0
+
+    def accumulate(self, real_seconds: float) -> None:
+        """
+        Aggiunge tempo reale trascorso, scalato, da consumare in tick
+
+        Args:
+            real_seconds: Secondi reali dall'ultimo frame
+        """
+        if not self.paused and not self.turbo:
+            self._accumulator += real_seconds * self.time_scale
+
+    def get_pending_ticks(self) -> int:
+        """
+        Consuma il tempo accumulato e restituisce i tick da eseguire in questo frame
+
+        Oltre il limite di recupero il ritardo residuo viene scartato, per non
+        finire in una spirale di frame sempre più lenti.
+
+        Returns:
+            Numero di tick di simulazione da eseguire
+        """
+        limit = int(self.max_catchup_ticks * max(1.0, self.time_scale))
+        ticks = min(int(self._accumulator / self.tick_duration), limit)
+        self._accumulator -= ticks * self.tick_duration
+        if self._accumulator >= self.tick_duration:
+            self._accumulator %= self.tick_duration
+        return ticks
+
+    def get_alpha(self) -> float:
+        """
+        Restituisce la frazione di tick già accumulata, per interpolare il disegno
+
+        Returns:
+            Valore tra 0.0 e 1.0
+        """
+        if self.turbo:
+            return 1.0
+        return min(1.0, self._accumulator / self.tick_duration)
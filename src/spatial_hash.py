@@ -0,0 +1,266 @@
+"""
+Griglia uniforme (spatial hash) per le query di collisione tra entità
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+import pygame
+from src.config import SPATIAL_HASH_CELL_SIZE
+
+
+class SpatialHash:
+    """
+    Indicizza oggetti con un attributo rect nelle celle di una griglia uniforme
+
+    Un oggetto viene inserito in tutte le celle toccate dal suo rect, quindi
+    una query esamina solo gli oggetti vicini all'area richiesta: il costo
+    dipende dalla densità locale, non dal numero totale di oggetti.
+
+    La griglia segue una lista di entità: sync() la ricostruisce solo quando
+    la lista cambia (altra lista o altra lunghezza), move() aggiorna un
+    oggetto spostato e non fa nulla finché resta nelle stesse celle, update()
+    fa entrambe le cose per tutta la lista una volta per tick. Il
+    padding verticale allarga le celle occupate, così le entità che oscillano
+    sul posto (i collezionabili) non devono mai essere spostate.
+
+    Ogni cella tiene anche i rect degli oggetti (gli stessi oggetti Rect
+    delle entità, quindi sempre aggiornati): le query li esaminano con
+    Rect.collidelistall, in C, invece che uno per uno in Python. I risultati
+    sono ordinati come la lista seguita, così chi si ferma al primo oggetto
+    (es. l'attacco del player) colpisce lo stesso nemico di un ciclo sulla lista.
+    """
+
+    def __init__(self, cell_size: int = SPATIAL_HASH_CELL_SIZE, padding_y: int = 0):
+        """
+        Inizializza la griglia
+
+        Args:
+            cell_size: Lato di una cella in pixel
+            padding_y: Margine verticale aggiunto sopra e sotto ogni rect inserito
+        """
+        self.cell_size = cell_size
+        self.padding_y = padding_y
+        self.cells: Dict[Tuple[int, int], List[object]] = {}
+        self.cell_rects: Dict[Tuple[int, int], List[pygame.Rect]] = {}
+
+        # Celle occupate da ogni oggetto (per id) e area coperta da quelle
+        # celle, per il controllo rapido di move()
+        self._ranges: Dict[int, Tuple[int, int, int, int]] = {}
+        self._areas: Dict[int, pygame.Rect] = {}
+        # Ordine di inserimento di ogni oggetto (per id): le query restituiscono
+        # gli oggetti nell'ordine della lista seguita, non in quello delle celle
+        self._order: Dict[int, int] = {}
+        self._next_order = 0
+        self._count = 0
+        self._source: Optional[Sequence[object]] = None
+        self._source_length = 0
+
+    def _get_range(self, rect: pygame.Rect) -> Tuple[int, int, int, int]:
+        """Celle (prima e ultima colonna, prima e ultima riga) toccate da un rect"""
+        size = self.cell_size
+        padding = self.padding_y
+        return (rect.left // size, (rect.right - 1) // size,
+                (rect.top - padding) // size, (rect.bottom - 1 + padding) // size)
+
+    def _get_area(self, cell_range: Tuple[int, int, int, int]) -> pygame.Rect:
+        """Area in cui un rect resta dentro le celle di un intervallo (padding escluso)"""
+        size = self.cell_size
+        padding = self.padding_y
+        first_x, last_x, first_y, last_y = cell_range
+        return pygame.Rect(first_x * size, first_y * size + padding,
+                           (last_x - first_x + 1) * size,
+                           (last_y - first_y + 1) * size - 2 * padding)
+
+    def clear(self) -> None:
+        """Svuota la griglia mantenendo le liste delle celle"""
+        for cell in self.cells.values():
+            cell.clear()
+        for cell_rects in self.cell_rects.values():
+            cell_rects.clear()
+        self._ranges.clear()
+        self._areas.clear()
+        self._order.clear()
+        self._next_order = 0
+        self._count = 0
+        self._source = None
+
+    def insert(self, obj: object) -> None:
+        """
+        Inserisce un oggetto nelle celle toccate dal suo rect
+
+        Args:
+            obj: Oggetto da indicizzare (con attributo rect)
+        """
+        cell_range = self._get_range(obj.rect)
+        self._add_to_cells(obj, cell_range)
+        self._ranges[id(obj)] = cell_range
+        self._areas[id(obj)] = self._get_area(cell_range)
+        self._order[id(obj)] = self._next_order
+        self._next_order += 1
+        self._count += 1
+
+    def remove(self, obj: object) -> None:
+        """
+        Rimuove un oggetto dalla griglia
+
+        Da chiamare quando l'oggetto viene tolto dalla lista seguita, così
+        sync() non deve ricostruire la griglia.
+
+        Args:
+            obj: Oggetto da rimuovere (ignorato se assente)
+        """
+        cell_range = self._ranges.pop(id(obj), None)
+        if cell_range is None:
+            return
+        del self._areas[id(obj)]
+        del self._order[id(obj)]
+        self._remove_from_cells(obj, cell_range)
+        self._count -= 1
+        self._source_length -= 1
+
+    def move(self, obj: object) -> None:
+        """
+        Aggiorna le celle di un oggetto dopo uno spostamento
+
+        Finché il rect resta dentro le celle in cui è registrato non serve
+        fare nulla: un oggetto può stare anche in celle che non tocca più,
+        le query controllano comunque il rect vero.
+
+        Args:
+            obj: Oggetto già presente nella griglia
+        """
+        area = self._areas.get(id(obj))
+        if area is None or area.contains(obj.rect):
+            return
+        self._relocate(obj)
+
+    def _relocate(self, obj: object) -> None:
+        """Sposta un oggetto nelle celle toccate dal suo rect attuale"""
+        new_range = self._get_range(obj.rect)
+        self._remove_from_cells(obj, self._ranges[id(obj)])
+        self._add_to_cells(obj, new_range)
+        self._ranges[id(obj)] = new_range
+        self._areas[id(obj)] = self._get_area(new_range)
+
+    def rebuild(self, objects: Sequence[object]) -> None:
+        """
+        Ricostruisce la griglia da una lista di oggetti
+
+        Args:
+            objects: Oggetti da indicizzare
+        """
+        self.clear()
+        for obj in objects:
+            self.insert(obj)
+        self._source = objects
+        self._source_length = len(objects)
+
+    def sync(self, objects: Sequence[object]) -> None:
+        """
+        Ricostruisce la griglia solo se la lista di oggetti è cambiata
+
+        Args:
+            objects: Lista di entità seguita dalla griglia
+        """
+        if objects is not self._source or len(objects) != self._source_length:
+            self.rebuild(objects)
+
+    def update(self, objects: Sequence[object]) -> None:
+        """
+        Allinea la griglia a una lista di entità che si muovono
+
+        Come sync(), più move() su ogni oggetto, in un solo ciclo.
+
+        Args:
+            objects: Lista di entità seguita dalla griglia
+        """
+        if objects is not self._source or len(objects) != self._source_length:
+            self.rebuild(objects)
+            return
+        areas_get = self._areas.get
+        for obj in objects:
+            area = areas_get(id(obj))
+            if area is not None and not area.contains(obj.rect):
+                self._relocate(obj)
+
+    def _add_to_cells(self, obj: object, cell_range: Tuple[int, int, int, int]) -> None:
+        """Aggiunge un oggetto alle celle di un intervallo"""
+        cells = self.cells
+        rect = obj.rect
+        first_x, last_x, first_y, last_y = cell_range
+        for cell_x in range(first_x, last_x + 1):
+            for cell_y in range(first_y, last_y + 1):
+                key = (cell_x, cell_y)
+                cell = cells.get(key)
+                if cell is None:
+                    cell = cells[key] = []
+                    self.cell_rects[key] = []
+                cell.append(obj)
+                self.cell_rects[key].append(rect)
+
+    def _remove_from_cells(self, obj: object, cell_range: Tuple[int, int, int, int]) -> None:
+        """Toglie un oggetto dalle celle di un intervallo"""
+        first_x, last_x, first_y, last_y = cell_range
+        for cell_x in range(first_x, last_x + 1):
+            for cell_y in range(first_y, last_y + 1):
+                key = (cell_x, cell_y)
+                cell = self.cells[key]
+                index = cell.index(obj)
+                del cell[index]
+                del self.cell_rects[key][index]
+
+    def query_rect(self, rect: pygame.Rect) -> List[object]:
+        """
+        Restituisce gli oggetti il cui rect interseca un'area
+
+        Args:
+            rect: Area da interrogare
+
+        Returns:
+            Oggetti in collisione, in ordine di inserimento (quello della lista)
+        """
+        size = self.cell_size
+        cells = self.cells
+        cell_rects = self.cell_rects
+        found: List[object] = []
+        seen = set()  # Un oggetto può stare in più celle
+        for cell_x in range(rect.left // size, (rect.right - 1) // size + 1):
+            for cell_y in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                key = (cell_x, cell_y)
+                cell = cells.get(key)
+                if not cell:
+                    continue
+                for index in rect.collidelistall(cell_rects[key]):
+                    obj = cell[index]
+                    obj_id = id(obj)
+                    if obj_id not in seen:
+                        seen.add(obj_id)
+                        found.append(obj)
+        if len(found) > 1:
+            order = self._order
+            found.sort(key=lambda obj: order[id(obj)])
+        return found
+
+    def query_point(self, x: float, y: float) -> List[object]:
+        """
+        Restituisce gli oggetti il cui rect contiene un punto
+
+        Args:
+            x: Coordinata x
+            y: Coordinata y
+
+        Returns:
+            Oggetti che contengono il punto, in ordine di inserimento
+        """
+        size = self.cell_size
+        key = (int(x // size), int(y // size))
+        cell = self.cells.get(key)
+        if not cell:
+            return []
+        point = pygame.Rect(int(x), int(y), 1, 1)
+        found = [cell[index] for index in point.collidelistall(self.cell_rects[key])]
+        if len(found) > 1:
+            order = self._order
+            found.sort(key=lambda obj: order[id(obj)])
+        return found
+
+    def __len__(self) -> int:
+        return self._count
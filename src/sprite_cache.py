@@ -0,0 +1,163 @@
+"""
+Cache su disco dei pixel degli sprite già decodificati e ridimensionati
+
+Ai lanci successivi gli sprite vengono ricostruiti dai byte RGBA grezzi
+(mappati in memoria quando possibile) invece di decodificare di nuovo il PNG;
+l'unica copia dei pixel è la conversione nel formato del display.
+La chiave è l'hash del contenuto del PNG sorgente più la dimensione richiesta,
+quindi la cache si invalida da sola quando cambia l'immagine o la dimensione.
+"""
+from typing import Dict, Optional, Tuple
+import json
+import os
+import threading
+import pygame
+from src.asset_pipeline import get_file_digest
+
+try:
+    import mmap
+except ImportError:  # pragma: no cover - alcune piattaforme web non hanno mmap
+    mmap = None
+
+INDEX_FILE = "index.json"
+
+
+class SpriteDiskCache:
+    """Salva e ricarica i buffer RGBA degli sprite ridimensionati"""
+
+    def __init__(self, cache_dir: str):
+        """
+        Inizializza la cache su disco
+
+        Args:
+            cache_dir: Cartella in cui salvare i buffer grezzi
+        """
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+
+        # Indice percorso -> (mtime, dimensione file, hash) per non ricalcolare
+        # l'hash dei PNG che non sono cambiati dall'ultimo avvio
+        self._index: Optional[Dict[str, list]] = None
+        self._index_dirty = False
+
+        # Lo SpriteManager può decodificare da più thread di preload
+        self._lock = threading.Lock()
+
+    def load(self, source_path: str, size: Tuple[int, int]) -> Optional[pygame.Surface]:
+        """
+        Ricostruisce uno sprite dai byte RGBA salvati
+
+        Args:
+            source_path: PNG da cui lo sprite è stato ricavato
+            size: Dimensione (width, height) dello sprite
+
+        Returns:
+            Surface RGBA, None se lo sprite non è in cache
+        """
+        digest = self._get_source_digest(source_path)
+        if digest is None:
+            return None
+
+        path = self._get_entry_path(digest, size)
+        expected_bytes = size[0] * size[1] * 4
+        try:
+            with open(path, "rb") as cache_file:
+                if mmap is not None:
+                    # Niente bytes intermedi: la Surface legge le pagine del file
+                    # finché convert_alpha non la copia nel formato del display
+                    buffer = mmap.mmap(cache_file.fileno(), 0, access=mmap.ACCESS_READ)
+                else:
+                    buffer = cache_file.read()
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        if len(buffer) != expected_bytes:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        try:
+            self._save_index()
+        except OSError:
+            pass
+        return pygame.image.frombuffer(buffer, size, "RGBA")
+
+    def store(self, source_path: str, size: Tuple[int, int], surface: pygame.Surface) -> None:
+        """
+        Salva i pixel di uno sprite ridimensionato
+
+        Args:
+            source_path: PNG da cui lo sprite è stato ricavato
+            size: Dimensione (width, height) dello sprite
+            surface: Sprite già ridimensionato
+        """
+        digest = self._get_source_digest(source_path)
+        if digest is None:
+            return
+
+        path = self._get_entry_path(digest, size)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(temp_path, "wb") as cache_file:
+                cache_file.write(pygame.image.tobytes(surface, "RGBA"))
+            os.replace(temp_path, path)
+            self._save_index()
+        except OSError as e:
+            print(f"⚠️ Cache sprite non scrivibile: {e}")
+
+    def _get_entry_path(self, digest: str, size: Tuple[int, int]) -> str:
+        """Restituisce il percorso del buffer per (hash, dimensione)"""
+        return os.path.join(self.cache_dir, f"{digest}_{size[0]}x{size[1]}.rgba")
+
+    def _get_source_digest(self, source_path: str) -> Optional[str]:
+        """
+        Restituisce l'hash del contenuto del PNG sorgente
+
+        Args:
+            source_path: Percorso del PNG
+
+        Returns:
+            Hash esadecimale, None se il file non è leggibile
+        """
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            return None
+
+        with self._lock:
+            entry = self._get_index().get(source_path)
+        if entry is not None and entry[0] == stat.st_mtime and entry[1] == stat.st_size:
+            return entry[2]
+
+        digest = get_file_digest(source_path)
+        if digest is None:
+            return None
+
+        with self._lock:
+            self._get_index()[source_path] = [stat.st_mtime, stat.st_size, digest]
+            self._index_dirty = True
+        return digest
+
+    def _get_index(self) -> Dict[str, list]:
+        """Carica l'indice degli hash al primo uso"""
+        if self._index is None:
+            try:
+                with open(os.path.join(self.cache_dir, INDEX_FILE), "r", encoding="utf-8") as index_file:
+                    self._index = json.load(index_file)
+            except (OSError, ValueError):
+                self._index = {}
+        return self._index
+
+    def _save_index(self) -> None:
+        """Scrive l'indice degli hash se è cambiato"""
+        with self._lock:
+            if not self._index_dirty:
+                return
+            index_path = os.path.join(self.cache_dir, INDEX_FILE)
+            with open(f"{index_path}.tmp", "w", encoding="utf-8") as index_file:
+                json.dump(self._index, index_file)
+            os.replace(f"{index_path}.tmp", index_path)
+            self._index_dirty = False
@@ -1,63 +1,310 @@
 import pygame
 import os
-from typing import Dict, Optional
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+from src.asset_pipeline import load_manifest, find_variant
+from src.sprite_cache import SpriteDiskCache
+from src.surface_cache import SurfaceCache
+from src.config import SPRITE_CACHE_DIR, SPRITE_MEMORY_BUDGET
+from src.tracing import traced
 
 class SpriteManager:
     """Gestisce il caricamento e il caching degli sprite"""
     
     def __init__(self):
         """Inizializza il sprite manager"""
-        self.sprites: Dict[str, pygame.Surface] = {}
+        # Sprite e varianti trasformate, entro il budget di memoria
+        self.sprites = SurfaceCache(SPRITE_MEMORY_BUDGET)
         self.sprite_path = "sprites"
         
-    def load_sprite(self, name: str, size: Optional[tuple] = None) -> pygame.Surface:
+        # Superfici create (sprite, fallback e varianti), per il profiler
+        self.allocations = 0
+        
+        # Manifest delle varianti pre-ridimensionate (caricato al primo uso)
+        self._manifest: Optional[Dict[str, dict]] = None
+        self._manifest_path: Optional[str] = None
+        
+        # Cache su disco dei pixel decodificati (None per disabilitarla)
+        self.disk_cache: Optional[SpriteDiskCache] = (
+            SpriteDiskCache(SPRITE_CACHE_DIR) if SPRITE_CACHE_DIR else None
+        )
+        
+    @traced("SpriteManager.load_sprite")
+    def load_sprite(self, name: str, size: Optional[tuple] = None,
+                    flip_x: bool = False) -> pygame.Surface:
         """
         Carica uno sprite e lo ridimensiona se necessario
         
         Args:
             name: Nome del file (senza estensione)
             size: Tuple (width, height) per ridimensionare, None per dimensione originale
+            flip_x: True per la variante specchiata orizzontalmente
             
         Returns:
             Surface di pygame con lo sprite caricato
         """
-        cache_key = f"{name}_{size}" if size else name
+        if flip_x:
+            return self.load_transformed(name, size, flip_x=True)
+            
+        if size:
+            size = tuple(size)
+        return self._get_base_sprite(name, size)
+        
+    def _get_base_sprite(self, name: str, size: Optional[tuple],
+                         record: bool = True) -> pygame.Surface:
+        """
+        Restituisce lo sprite base dalla cache, caricandolo se manca
+        
+        Args:
+            name: Nome del file (senza estensione)
+            size: Tuple (width, height) già normalizzata, None per dimensione originale
+            record: False quando la richiesta è già stata contata (varianti)
+            
+        Returns:
+            Surface di pygame con lo sprite caricato
+        """
+        cache_key = self._get_cache_key(name, size)
+        
+        sprite = self.sprites.get(cache_key, record=record)
+        if sprite is not None:
+            return sprite
+            
+        try:
+            sprite = self._finalize_sprite(name, self._decode_sprite(name, size))
+        except (FileNotFoundError, pygame.error) as e:
+            sprite = self._create_fallback(name, size, e)
+            
+        self.allocations += 1
+        self.sprites.put(cache_key, sprite)
+        return sprite
+        
+    def preload(self, sprites: Iterable[Tuple[str, Optional[tuple]]],
+                max_workers: Optional[int] = None) -> "SpritePreloadJob":
+        """
+        Avvia la decodifica in background degli sprite indicati
         
-        if cache_key in self.sprites:
-            return self.sprites[cache_key]
+        Args:
+            sprites: Coppie (nome, dimensione) da preparare
+            max_workers: Thread di decodifica, 0 per la modalità cooperativa
+                (None = automatico; sotto pygbag non ci sono thread)
             
-        # Carica l'immagine
+        Returns:
+            Job da interrogare con poll() a ogni frame
+        """
+        if max_workers is None:
+            max_workers = 0 if sys.platform == "emscripten" else min(4, os.cpu_count() or 1)
+        return SpritePreloadJob(self, sprites, max_workers)
+        
+    def pin_sprites(self, sprites: Iterable[Tuple[str, Optional[tuple]]]) -> None:
+        """
+        Protegge dall'evizione gli sprite indicati e le loro varianti
+        
+        Sostituisce l'insieme precedente: gli sprite del livello prima diventano
+        di nuovo rimovibili.
+        
+        Args:
+            sprites: Coppie (nome, dimensione) necessarie al livello corrente
+        """
+        self.sprites.pin(
+            self._get_cache_key(name, tuple(size) if size else None)
+            for name, size in sprites
+        )
+        
+    def release_unpinned(self) -> int:
+        """
+        Rilascia gli sprite non fissati (es. quelli del livello precedente)
+        
+        Le superfici rilasciate sono contate tra le evizioni di get_cache_stats().
+        
+        Returns:
+            Numero di superfici rilasciate
+        """
+        return self.sprites.trim()
+        
+    def get_cache_stats(self) -> Dict[str, float]:
+        """
+        Restituisce le statistiche della cache degli sprite
+        
+        Returns:
+            Dizionario con voci, byte residenti, budget, hit rate ed evizioni
+        """
+        return self.sprites.get_stats()
+        
+    def _get_cache_key(self, name: str, size: Optional[tuple]) -> str:
+        """Restituisce la chiave della cache in memoria per (nome, dimensione)"""
+        return f"{name}_{size}" if size else name
+        
+    def _decode_sprite(self, name: str, size: Optional[tuple]) -> pygame.Surface:
+        """
+        Decodifica e ridimensiona uno sprite senza toccare il display
+        
+        Non usa la cache in memoria né convert_alpha(), quindi può essere
+        eseguito da un thread di preload.
+        
+        Args:
+            name: Nome del file (senza estensione)
+            size: Tuple (width, height) per ridimensionare, None per dimensione originale
+            
+        Returns:
+            Surface non ancora convertita nel formato del display
+            
+        Raises:
+            FileNotFoundError: Se l'immagine non esiste
+            pygame.error: Se l'immagine non è decodificabile
+        """
         image_path = os.path.join(self.sprite_path, f"{name}.png")
         
+        if size:
+            # Variante già ridimensionata dalla pipeline offline, se presente
+            variant_path = self._find_prescaled_path(name, size)
+            source_path = variant_path or image_path
+            
+            # Pixel già decodificati e ridimensionati in un avvio precedente
+            if self.disk_cache is not None:
+                sprite = self.disk_cache.load(source_path, size)
+                if sprite is not None:
+                    return sprite
+                    
+            if variant_path:
+                sprite = self._load_prescaled(variant_path, name, size)
+                if sprite is not None:
+                    return sprite
+                    
         if not os.path.exists(image_path):
-            # Fallback - crea un rettangolo colorato se l'immagine non esiste
-            print(f"⚠️ Sprite non trovato: {image_path}")
-            fallback_size = size if size else (64, 64)
-            surface = pygame.Surface(fallback_size)
+            raise FileNotFoundError(image_path)
+            
+        sprite = pygame.image.load(image_path)
+        
+        # Ridimensiona se necessario
+        if size:
+            sprite = pygame.transform.scale(sprite, size)
+            if self.disk_cache is not None:
+                self.disk_cache.store(image_path, size, sprite)
+                
+        return sprite
+        
+    def _finalize_sprite(self, name: str, sprite: pygame.Surface) -> pygame.Surface:
+        """
+        Converte uno sprite decodificato nel formato del display (thread principale)
+        
+        Args:
+            name: Nome dello sprite (per i messaggi)
+            sprite: Surface restituita da _decode_sprite
+            
+        Returns:
+            Surface pronta per il blit
+            
+        Raises:
+            pygame.error: Se non c'è una modalità video attiva
+        """
+        sprite = sprite.convert_alpha()
+        print(f"✅ Sprite caricato: {name} -> {sprite.get_size()}")
+        return sprite
+        
+    def _create_fallback(self, name: str, size: Optional[tuple],
+                         error: Exception) -> pygame.Surface:
+        """
+        Crea un rettangolo colorato al posto di uno sprite non caricabile
+        
+        Args:
+            name: Nome dello sprite
+            size: Dimensione richiesta
+            error: Errore di caricamento
+            
+        Returns:
+            Surface magenta se l'immagine manca, rossa se non è decodificabile
+        """
+        fallback_size = size if size else (64, 64)
+        surface = pygame.Surface(fallback_size)
+        if isinstance(error, FileNotFoundError):
+            print(f"⚠️ Sprite non trovato: {error}")
             surface.fill((255, 0, 255))  # Magenta per indicare sprite mancante
-            self.sprites[cache_key] = surface
-            return surface
+        else:
+            print(f"❌ Errore caricamento sprite {name}: {error}")
+            surface.fill((255, 0, 0))  # Rosso per errore
+        return surface
+    
+    def _find_prescaled_path(self, name: str, size: tuple) -> Optional[str]:
+        """
+        Cerca la variante pre-ridimensionata generata da src.asset_pipeline
+        
+        Args:
+            name: Nome del file (senza estensione)
+            size: Tuple (width, height) richiesta
+            
+        Returns:
+            Percorso della variante, None se manca o non è aggiornata
+        """
+        if self._manifest is None or self._manifest_path != self.sprite_path:
+            self._manifest = load_manifest(self.sprite_path)
+            self._manifest_path = self.sprite_path
+            
+        return find_variant(self._manifest, self.sprite_path, name, size)
+        
+    def _load_prescaled(self, variant_path: str, name: str,
+                        size: tuple) -> Optional[pygame.Surface]:
+        """
+        Carica una variante pre-ridimensionata
+        
+        Args:
+            variant_path: Percorso del PNG della variante
+            name: Nome dello sprite (per i messaggi)
+            size: Tuple (width, height) attesa
             
+        Returns:
+            Surface già alla dimensione richiesta, None in caso di errore
+        """
         try:
-            sprite = pygame.image.load(image_path).convert_alpha()
+            sprite = pygame.image.load(variant_path)
+        except pygame.error as e:
+            print(f"❌ Errore caricamento variante {name} {size}: {e}")
+            return None
             
-            # Ridimensiona se necessario
-            if size:
-                sprite = pygame.transform.scale(sprite, size)
-                
-            self.sprites[cache_key] = sprite
-            print(f"✅ Sprite caricato: {name} -> {sprite.get_size()}")
+        if sprite.get_size() != size:
+            return None
+            
+        if self.disk_cache is not None:
+            self.disk_cache.store(variant_path, size, sprite)
+        return sprite
+        
+    def load_transformed(self, name: str, size: Optional[tuple] = None,
+                         flip_x: bool = False, flip_y: bool = False,
+                         angle: int = 0) -> pygame.Surface:
+        """
+        Restituisce una variante trasformata di uno sprite, calcolata una sola volta
+        
+        Args:
+            name: Nome del file (senza estensione)
+            size: Tuple (width, height) per ridimensionare, None per dimensione originale
+            flip_x: True per specchiare orizzontalmente
+            flip_y: True per specchiare verticalmente
+            angle: Rotazione in gradi (senso antiorario)
+            
+        Returns:
+            Surface con la variante trasformata (condivisa: non va modificata)
+        """
+        angle %= 360
+        size = tuple(size) if size else None
+        cache_key = (name, size, (flip_x, flip_y, angle))
+        
+        sprite = self.sprites.get(cache_key)
+        if sprite is not None:
             return sprite
             
-        except pygame.error as e:
-            print(f"❌ Errore caricamento sprite {name}: {e}")
-            # Fallback
-            fallback_size = size if size else (64, 64)
-            surface = pygame.Surface(fallback_size)
-            surface.fill((255, 0, 0))  # Rosso per errore
-            self.sprites[cache_key] = surface
-            return surface
-    
+        # Il miss è già stato contato sulla variante
+        sprite = self._get_base_sprite(name, size, record=False)
+        if flip_x or flip_y:
+            sprite = pygame.transform.flip(sprite, flip_x, flip_y)
+            self.allocations += 1
+        if angle:
+            sprite = pygame.transform.rotate(sprite, angle)
+            self.allocations += 1
+            
+        # Stesso gruppo dello sprite base: il pinning vale anche per la variante
+        self.sprites.put(cache_key, sprite, group=self._get_cache_key(name, size))
+        return sprite
+        
     def load_background(self, name: str, screen_size: tuple) -> pygame.Surface:
         """
         Carica un fondale e lo ridimensiona per lo schermo
@@ -71,27 +318,31 @@ class SpriteManager:
         """
         return self.load_sprite(name, screen_size)
     
-    def get_player_sprite(self, attacking: bool = False, size: tuple = (64, 80)) -> pygame.Surface:
+    def get_player_sprite(self, attacking: bool = False, size: tuple = (64, 80),
+                          flip_x: bool = False) -> pygame.Surface:
         """
         Ottiene lo sprite corretto del player (dimensioni aumentate!)
         
         Args:
             attacking: True se il player sta attaccando
             size: Dimensione dello sprite (default aumentato a 64x80)
+            flip_x: True se il player guarda a sinistra
             
         Returns:
             Surface con lo sprite del player
         """
         sprite_name = "cavaliereattacco" if attacking else "cavaliereariposo"
-        return self.load_sprite(sprite_name, size)
+        return self.load_sprite(sprite_name, size, flip_x)
     
-    def get_enemy_sprite(self, is_boss: bool = False, size: tuple = (56, 74)) -> pygame.Surface:
+    def get_enemy_sprite(self, is_boss: bool = False, size: tuple = (56, 74),
+                         flip_x: bool = False) -> pygame.Surface:
         """
         Ottiene lo sprite corretto del nemico (dimensioni aumentate!)
         
         Args:
             is_boss: True se è un boss
             size: Dimensione dello sprite (default aumentato a 56x74 per demoni normali)
+            flip_x: True se il nemico guarda a sinistra
             
         Returns:
             Surface con lo sprite del nemico
@@ -100,7 +351,127 @@ class SpriteManager:
         # Boss ancora più grandi
         if is_boss and size == (56, 74):  # Se sta usando la dimensione di default
             size = (80, 110)
-        return self.load_sprite(sprite_name, size)
+        return self.load_sprite(sprite_name, size, flip_x)
+
+
+class SpritePreloadJob:
+    """
+    Decodifica in background di un gruppo di sprite
+    
+    I PNG vengono decodificati e ridimensionati su un pool di thread; la
+    conversione nel formato del display avviene invece in poll(), sul thread
+    principale. Con max_workers=0 (pygbag, dove non ci sono thread) ogni
+    chiamata a poll() decodifica un solo sprite, così il loop asincrono del
+    gioco continua a girare tra uno sprite e l'altro.
+    """
+    
+    def __init__(self, manager: SpriteManager,
+                 sprites: Iterable[Tuple[str, Optional[tuple]]], max_workers: int):
+        """
+        Inizializza il job e avvia la decodifica
+        
+        Args:
+            manager: SpriteManager che riceverà gli sprite
+            sprites: Coppie (nome, dimensione) da preparare
+            max_workers: Thread di decodifica, 0 per la modalità cooperativa
+        """
+        self.manager = manager
+        self.pending: List[Tuple[str, Optional[tuple]]] = []
+        for name, size in sprites:
+            size = tuple(size) if size else None
+            spec = (name, size)
+            if spec not in self.pending and manager._get_cache_key(name, size) not in manager.sprites:
+                self.pending.append(spec)
+                
+        self.total = len(self.pending)
+        self.completed = 0
+        self._futures: Dict[Tuple[str, Optional[tuple]], Future] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
+        if max_workers > 0 and self.pending:
+            self._executor = ThreadPoolExecutor(
+                max_workers=min(max_workers, len(self.pending)),
+                thread_name_prefix="sprite-preload"
+            )
+            for name, size in self.pending:
+                self._futures[(name, size)] = self._executor.submit(
+                    manager._decode_sprite, name, size
+                )
+            self._executor.shutdown(wait=False)
+            
+    @property
+    def progress(self) -> float:
+        """Frazione di sprite pronti (0.0 - 1.0)"""
+        return self.completed / self.total if self.total else 1.0
+        
+    @property
+    def done(self) -> bool:
+        """True quando tutti gli sprite sono nella cache del manager"""
+        return not self.pending
+        
+    def poll(self) -> float:
+        """
+        Raccoglie gli sprite decodificati e li rende disponibili
+        
+        Returns:
+            Avanzamento corrente (0.0 - 1.0)
+        """
+        if self._executor is None:
+            if self.pending:
+                name, size = self.pending[0]
+                self._finish(name, size, lambda: self.manager._decode_sprite(name, size))
+            return self.progress
+            
+        for spec in list(self.pending):
+            future = self._futures[spec]
+            if future.done():
+                self._finish(spec[0], spec[1], future.result)
+        return self.progress
+        
+    def wait(self) -> None:
+        """Blocca finché tutti gli sprite non sono pronti"""
+        while self.pending:
+            if self._executor is not None:
+                self._futures[self.pending[0]].exception()  # Attende il completamento
+            self.poll()
+            
+    def cancel(self) -> None:
+        """Annulla la decodifica degli sprite non ancora iniziati"""
+        for future in self._futures.values():
+            future.cancel()
+        self.pending.clear()
+        
+    def _finish(self, name: str, size: Optional[tuple], decode) -> None:
+        """
+        Converte uno sprite decodificato e lo inserisce nella cache del manager
+        
+        Args:
+            name: Nome dello sprite
+            size: Dimensione richiesta
+            decode: Callable che restituisce la Surface decodificata
+        """
+        self.pending.remove((name, size))
+        self.completed += 1
+        
+        cache_key = self.manager._get_cache_key(name, size)
+        if cache_key in self.manager.sprites:
+            return  # Già caricato nel frattempo dal thread principale
+            
+        try:
+            sprite = self.manager._finalize_sprite(name, decode())
+        except (FileNotFoundError, pygame.error) as e:
+            sprite = self.manager._create_fallback(name, size, e)
+        except Exception as e:
+            # Un errore imprevisto non deve interrompere il cambio di livello:
+            # lo sprite viene ricaricato in modo sincrono sul thread principale
+            print(f"⚠️ Preload di {name} fallito ({e!r}), caricamento sincrono")
+            try:
+                sprite = self.manager._finalize_sprite(name, self.manager._decode_sprite(name, size))
+            except Exception as e:
+                sprite = self.manager._create_fallback(name, size, e)
+        self.manager.allocations += 1
+        self.manager.sprites.put(cache_key, sprite)
+
 
 # Istanza globale del sprite manager
-sprite_manager = SpriteManager() 
\ No newline at end of file
+sprite_manager = SpriteManager()
@@ -0,0 +1,191 @@
+"""
+Cache LRU delle superfici degli sprite con un budget di memoria in byte
+"""
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, Optional, Set
+import pygame
+
+
+def get_surface_bytes(surface: pygame.Surface) -> int:
+    """
+    Stima la memoria occupata dai pixel di una superficie
+
+    Args:
+        surface: Superficie da misurare
+
+    Returns:
+        width × height × byte per pixel
+    """
+    width, height = surface.get_size()
+    return width * height * surface.get_bytesize()
+
+
+class SurfaceCache:
+    """
+    Cache LRU delle superfici, limitata dal totale dei byte residenti
+
+    Ogni voce appartiene a un gruppo (di norma lo sprite di origine, così le
+    varianti specchiate seguono lo sprite base). I gruppi fissati con pin()
+    non vengono mai rimossi, anche se il budget viene superato.
+    """
+
+    def __init__(self, budget_bytes: Optional[int] = None):
+        """
+        Inizializza la cache
+
+        Args:
+            budget_bytes: Byte massimi residenti, None per nessun limite
+        """
+        self.budget_bytes = budget_bytes
+        self.surfaces: "OrderedDict[Hashable, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._sizes: Dict[Hashable, int] = {}
+        self._groups: Dict[Hashable, Hashable] = {}
+        self._pinned: Set[Hashable] = set()
+        self._resident_bytes = 0
+
+    def get(self, key: Hashable, record: bool = True) -> Optional[pygame.Surface]:
+        """
+        Restituisce una superficie e la segna come usata di recente
+
+        Args:
+            key: Chiave della superficie
+            record: False per le ricerche interne, escluse da hit e miss
+
+        Returns:
+            Superficie in cache, None se assente
+        """
+        surface = self.surfaces.get(key)
+        if surface is None:
+            if record:
+                self.misses += 1
+            return None
+
+        if record:
+            self.hits += 1
+        self.surfaces.move_to_end(key)
+        return surface
+
+    def put(self, key: Hashable, surface: pygame.Surface,
+            group: Optional[Hashable] = None) -> None:
+        """
+        Inserisce una superficie, rimuovendo le meno usate oltre il budget
+
+        Args:
+            key: Chiave della superficie
+            surface: Superficie da mantenere
+            group: Gruppo per il pinning (None = la chiave stessa)
+        """
+        self.discard(key)
+
+        size = get_surface_bytes(surface)
+        self.surfaces[key] = surface
+        self._sizes[key] = size
+        self._groups[key] = key if group is None else group
+        self._resident_bytes += size
+
+        self._evict(keep=key)
+
+    def discard(self, key: Hashable) -> None:
+        """
+        Rimuove una superficie se presente
+
+        Args:
+            key: Chiave della superficie
+        """
+        if key in self.surfaces:
+            del self.surfaces[key]
+            self._resident_bytes -= self._sizes.pop(key)
+            del self._groups[key]
+
+    def pin(self, groups: Iterable[Hashable]) -> None:
+        """
+        Sostituisce l'insieme dei gruppi da non rimuovere
+
+        Args:
+            groups: Gruppi necessari al livello corrente
+        """
+        self._pinned = set(groups)
+        self._evict()
+
+    def is_pinned(self, key: Hashable) -> bool:
+        """Restituisce True se la superficie appartiene a un gruppo fissato"""
+        return self._groups.get(key) in self._pinned
+
+    def trim(self) -> int:
+        """
+        Rimuove tutte le superfici non fissate
+
+        Returns:
+            Numero di superfici rimosse
+        """
+        removed = 0
+        for key in list(self.surfaces):
+            if not self.is_pinned(key):
+                self.discard(key)
+                self.evictions += 1
+                removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """Svuota la cache (anche le superfici fissate)"""
+        self.surfaces.clear()
+        self._sizes.clear()
+        self._groups.clear()
+        self._resident_bytes = 0
+
+    def get_resident_bytes(self) -> int:
+        """Restituisce i byte occupati dalle superfici in cache"""
+        return self._resident_bytes
+
+    def get_hit_rate(self) -> float:
+        """
+        Restituisce la percentuale di richieste servite dalla cache
+
+        Returns:
+            Hit rate tra 0.0 e 1.0
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Restituisce le statistiche della cache
+
+        Returns:
+            Dizionario con voci, byte residenti, budget, hit rate ed evizioni
+        """
+        return {
+            'entries': len(self.surfaces),
+            'resident_bytes': self._resident_bytes,
+            'budget_bytes': self.budget_bytes or 0,
+            'hit_rate': self.get_hit_rate(),
+            'evictions': self.evictions,
+        }
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.surfaces
+
+    def __len__(self) -> int:
+        return len(self.surfaces)
+
+    def _evict(self, keep: Optional[Hashable] = None) -> None:
+        """
+        Rimuove le superfici meno usate finché i byte rientrano nel budget
+
+        Args:
+            keep: Chiave appena inserita, da non rimuovere
+        """
+        if self.budget_bytes is None:
+            return
+
+        for key in list(self.surfaces):
+            if self._resident_bytes <= self.budget_bytes:
+                break
+            if key == keep or self.is_pinned(key):
+                continue
+            self.discard(key)
+            self.evictions += 1
@@ -0,0 +1,52 @@
+"""
+Pool di superfici semitrasparenti riutilizzabili (aree di attacco, pausa)
+"""
+from typing import Dict, Tuple
+import pygame
+
+
+class OverlayPool:
+    """Restituisce superfici piene e semitrasparenti, create una sola volta per chiave"""
+
+    def __init__(self):
+        """Inizializza il pool delle superfici"""
+        self.surfaces: Dict[tuple, pygame.Surface] = {}
+
+        # Contatori di debug: a regime allocations non deve più crescere
+        self.allocations = 0
+        self.hits = 0
+
+    def get(self, size: Tuple[int, int], color: Tuple[int, int, int],
+            alpha: int) -> pygame.Surface:
+        """
+        Restituisce una superficie della dimensione e del colore richiesti
+
+        Args:
+            size: Dimensione (width, height) della superficie
+            color: Colore RGB di riempimento
+            alpha: Trasparenza (0-255)
+
+        Returns:
+            Superficie condivisa già riempita (non va modificata)
+        """
+        key = (tuple(size), tuple(color), alpha)
+        surface = self.surfaces.get(key)
+
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        surface = pygame.Surface(size)
+        surface.set_alpha(alpha)
+        surface.fill(color)
+        self.surfaces[key] = surface
+        self.allocations += 1
+        return surface
+
+    def clear(self) -> None:
+        """Svuota il pool"""
+        self.surfaces.clear()
+
+
+# Istanza globale del pool di overlay
+overlay_pool = OverlayPool()
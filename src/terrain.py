@@ -0,0 +1,69 @@
+"""
+Mappa delle altezze del terreno (heightfield) compilata per livello
+"""
+from array import array
+from typing import Sequence
+from src.config import GROUND_Y, SCREEN_WIDTH
+from src.platform import Ramp
+
+
+class TerrainMap:
+    """
+    Terreno solido di un livello (suolo e rampe) compilato colonna per colonna
+
+    Per ogni x dello schermo la mappa tiene l'altezza del terreno in un
+    array('h') di interi: la domanda "dov'è il terreno sotto x" diventa un
+    accesso all'array, invece di un ciclo sulle rampe a ogni frame. Le
+    piattaforme restano nel PlatformIndex, che risolve gli atterraggi.
+    """
+
+    def __init__(self, ramps: Sequence[Ramp] = (), ground_y: int = GROUND_Y,
+                 width: int = SCREEN_WIDTH):
+        """
+        Compila la mappa
+
+        Args:
+            ramps: Rampe del livello
+            ground_y: Y del suolo
+            width: Larghezza del livello in pixel (una colonna per pixel)
+        """
+        self.ramps = ramps
+        self.width = width
+        self._ramp_count = len(ramps)
+
+        # Terreno solido: il suolo, alzato dalle rampe
+        self.ground = array('h', [ground_y]) * width
+        for ramp in ramps:
+            for x in range(max(0, ramp.x), min(width, ramp.x + ramp.width + 1)):
+                self.ground[x] = min(self.ground[x], int(ramp.get_height_at_x(x)))
+
+    def is_built_from(self, ramps: Sequence[Ramp]) -> bool:
+        """
+        Controlla se la mappa è aggiornata rispetto alle rampe del livello
+
+        Args:
+            ramps: Rampe del livello
+
+        Returns:
+            True se la mappa è stata compilata da questa lista e non è cambiata
+        """
+        return ramps is self.ramps and len(ramps) == self._ramp_count
+
+    def ground_height(self, x: float) -> int:
+        """
+        Restituisce la Y del terreno solido (suolo o rampa) in una colonna
+
+        Le x fuori dal livello usano le colonne ai bordi.
+
+        Args:
+            x: Coordinata x
+
+        Returns:
+            Y della superficie del terreno
+        """
+        column = int(x)
+        if column < 0:
+            column = 0
+        elif column >= self.width:
+            column = self.width - 1
+        return self.ground[column]
@@ -0,0 +1,73 @@
+"""
+Cache delle superfici di testo renderizzate per HUD e menu
+"""
+from collections import OrderedDict
+from typing import Tuple
+import pygame
+from src.quit_hook import QuitHook
+
+
+class TextCache:
+    """Cache LRU delle superfici di testo, con chiave (font, testo, colore, antialias)"""
+
+    def __init__(self, max_entries: int = 256):
+        """
+        Inizializza la cache del testo
+
+        Args:
+            max_entries: Numero massimo di superfici mantenute in cache
+        """
+        self.max_entries = max_entries
+        self.surfaces: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._quit_hook = QuitHook(self.clear)
+
+    def render(self, font: pygame.font.Font, text: str, color: Tuple[int, int, int],
+               antialias: bool = True) -> pygame.Surface:
+        """
+        Restituisce il testo renderizzato, rasterizzandolo solo alla prima richiesta
+
+        Args:
+            font: Font con cui renderizzare il testo
+            text: Testo da renderizzare
+            color: Colore RGB del testo
+            antialias: True per il testo con antialiasing
+
+        Returns:
+            Superficie con il testo (condivisa: non va modificata)
+        """
+        key = (font, text, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        self._quit_hook.ensure_registered()
+
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self) -> None:
+        """Svuota la cache"""
+        self.surfaces.clear()
+
+    def get_hit_rate(self) -> float:
+        """
+        Restituisce la percentuale di richieste servite dalla cache
+
+        Returns:
+            Hit rate tra 0.0 e 1.0
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+# Istanza globale della cache del testo
+text_cache = TextCache()
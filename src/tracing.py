@@ -0,0 +1,227 @@
+"""
+Tracing degli span di frame, esportabile in chrome://tracing o Perfetto
+
+Il tracing si attiva impostando la variabile d'ambiente KQ_TRACE prima di
+avviare il gioco (KQ_TRACE=1 scrive trace.json, KQ_TRACE=percorso.json
+sceglie il file). Da disattivato span() restituisce un contesto vuoto
+condiviso e traced() restituisce la funzione originale, senza wrapper.
+"""
+from array import array
+from typing import Callable, Dict, List, Optional
+import functools
+import json
+import os
+import threading
+import time
+from src.config import TRACE_ENV_VAR, TRACE_BUFFER_SIZE
+
+DEFAULT_TRACE_PATH = "trace.json"
+
+
+class _NullSpan:
+    """Span che non registra nulla, usato quando il tracing è spento"""
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """Span registrato nel buffer del tracer all'uscita dal blocco"""
+    __slots__ = ("tracer", "name_id", "start")
+
+    def __init__(self, tracer: "Tracer", name_id: int):
+        self.tracer = tracer
+        self.name_id = name_id
+        self.start = 0.0
+
+    def __enter__(self) -> "_Span":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        self.tracer.record(self.name_id, self.start, time.perf_counter())
+        return False
+
+
+class Tracer:
+    """
+    Registra span (nome, inizio, durata, thread) in un buffer circolare
+
+    Il buffer è preallocato: registrare uno span scrive solo in array di
+    numeri, senza creare oggetti. Quando è pieno gli span più vecchi vengono
+    sovrascritti. Gli span con lo stesso nome non devono annidarsi tra loro.
+    """
+
+    def __init__(self, capacity: int = TRACE_BUFFER_SIZE, enabled: bool = False,
+                 path: str = DEFAULT_TRACE_PATH):
+        """
+        Inizializza il tracer
+
+        Args:
+            capacity: Span massimi mantenuti nel buffer
+            enabled: True per registrare gli span
+            path: File in cui scrivere la traccia
+        """
+        self.enabled = enabled
+        self.capacity = capacity
+        self.path = path
+
+        self.names: List[str] = []
+        self._name_ids: Dict[str, int] = {}
+        self._spans: Dict[str, _Span] = {}
+
+        # Buffer circolare: id del nome, inizio e durata (µs), thread
+        self._name_buffer = array('l', [0]) * capacity
+        self._start_buffer = array('d', [0.0]) * capacity
+        self._duration_buffer = array('d', [0.0]) * capacity
+        self._thread_buffer = array('Q', [0]) * capacity
+        self._index = 0
+        self.recorded = 0
+
+        self._origin = time.perf_counter()
+
+    def _get_name_id(self, name: str) -> int:
+        """Restituisce l'indice del nome nella tabella dei nomi"""
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = self._name_ids[name] = len(self.names)
+            self.names.append(name)
+        return name_id
+
+    def span(self, name: str):
+        """
+        Restituisce il contesto che registra uno span
+
+        Args:
+            name: Nome dello span (es. "update.enemies")
+
+        Returns:
+            Context manager da usare con "with"
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        span = self._spans.get(name)
+        if span is None:
+            span = self._spans[name] = _Span(self, self._get_name_id(name))
+        return span
+
+    def traced(self, name: Optional[str] = None) -> Callable[[Callable], Callable]:
+        """
+        Decoratore che registra uno span per ogni chiamata della funzione
+
+        Il tracing viene deciso alla definizione: da spento la funzione non
+        viene avvolta e non paga alcun costo.
+
+        Args:
+            name: Nome dello span (default: nome qualificato della funzione)
+
+        Returns:
+            Decoratore
+        """
+        def decorator(function: Callable) -> Callable:
+            if not self.enabled:
+                return function
+            name_id = self._get_name_id(name or function.__qualname__)
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    self.record(name_id, start, time.perf_counter())
+            return wrapper
+        return decorator
+
+    def record(self, name_id: int, start: float, end: float) -> None:
+        """
+        Scrive uno span nel buffer circolare
+
+        Args:
+            name_id: Indice del nome dello span
+            start: Inizio (time.perf_counter)
+            end: Fine (time.perf_counter)
+        """
+        index = self._index
+        self._name_buffer[index] = name_id
+        self._start_buffer[index] = (start - self._origin) * 1e6
+        self._duration_buffer[index] = (end - start) * 1e6
+        self._thread_buffer[index] = threading.get_ident()
+        self._index = (index + 1) % self.capacity
+        self.recorded += 1
+
+    def get_span_count(self) -> int:
+        """Restituisce il numero di span presenti nel buffer"""
+        return min(self.recorded, self.capacity)
+
+    def clear(self) -> None:
+        """Svuota il buffer"""
+        self._index = 0
+        self.recorded = 0
+
+    def to_chrome_trace(self) -> Dict[str, object]:
+        """
+        Converte gli span nel formato trace-event di Chrome
+
+        Returns:
+            Dizionario con 'traceEvents' (eventi completi, ph "X") in ordine di inizio
+        """
+        count = self.get_span_count()
+        first = (self._index - count) % self.capacity
+        pid = os.getpid()
+
+        events = []
+        for offset in range(count):
+            index = (first + offset) % self.capacity
+            events.append({
+                'name': self.names[self._name_buffer[index]],
+                'cat': 'game',
+                'ph': 'X',
+                'ts': self._start_buffer[index],
+                'dur': self._duration_buffer[index],
+                'pid': pid,
+                'tid': self._thread_buffer[index],
+            })
+        events.sort(key=lambda event: event['ts'])
+
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def dump(self, path: Optional[str] = None) -> Optional[str]:
+        """
+        Scrive la traccia in un file JSON
+
+        Args:
+            path: File di destinazione (default: quello del tracer)
+
+        Returns:
+            Percorso scritto, None se il tracing è spento
+        """
+        if not self.enabled:
+            return None
+        path = path or self.path
+        with open(path, "w", encoding="utf-8") as trace_file:
+            json.dump(self.to_chrome_trace(), trace_file)
+        print(f"📁 Traccia salvata in {path} ({self.get_span_count()} span)")
+        return path
+
+
+def _create_tracer() -> Tracer:
+    """Crea il tracer globale leggendo la variabile d'ambiente"""
+    setting = os.environ.get(TRACE_ENV_VAR, "")
+    if setting in ("", "0"):
+        return Tracer(capacity=1)
+    path = setting if setting.endswith(".json") else DEFAULT_TRACE_PATH
+    return Tracer(enabled=True, path=path)
+
+
+# Istanza globale del tracer
+tracer = _create_tracer()
+span = tracer.span
+traced = tracer.traced
@@ -0,0 +1,120 @@
+"""
+Test unitari per il tracciamento delle allocazioni e la taratura del GC
+"""
+import gc
+import unittest
+from src.alloc_tracker import AllocationTracker, apply_gc_thresholds, freeze_long_lived_objects
+from src.config import GC_THRESHOLDS
+
+
+class TestAllocationTracker(unittest.TestCase):
+    """Test per la classe AllocationTracker"""
+
+    def setUp(self):
+        """Setup per ogni test"""
+        self.tracker = AllocationTracker(enabled=True, report_interval=0)
+
+    def tearDown(self):
+        """Cleanup dopo ogni test"""
+        self.tracker.stop()
+
+    def test_disabled_tracker_ignores_ticks(self):
+        """Test che da spento tick() non conti nulla"""
+        tracker = AllocationTracker()
+        tracker.tick()
+
+        self.assertFalse(tracker.enabled)
+        self.assertEqual(tracker.ticks, 0)
+
+    def test_report_finds_allocating_site(self):
+        """Test che il report indichi la riga che alloca"""
+        retained = []
+        for _ in range(10):
+            retained.append([object() for _ in range(100)])  # Riga che alloca
+            self.tracker.tick()
+
+        report = self.tracker.report()
+
+        self.assertEqual(report['ticks'], 10)
+        top_site = report['retained_sites'][0]
+        self.assertIn("test_alloc_tracker.py", top_site['site'])
+        self.assertGreaterEqual(top_site['blocks_per_tick'], 100)
+        self.assertEqual(self.tracker.ticks, 0)  # Nuova finestra
+
+    def test_report_finds_temporary_allocation_site(self):
+        """Test che un oggetto temporaneo liberato nel tick compaia sotto la sua riga"""
+        def simulate_tick():
+            scratch = [object() for _ in range(200)]  # Temporaneo del tick
+            return len(scratch)
+
+        for _ in range(10):
+            simulate_tick()
+            self.tracker.tick()
+
+        report = self.tracker.report()
+
+        line = simulate_tick.__code__.co_firstlineno + 1
+        sites = {site['site']: site for site in report['sites']}
+        site = sites[f"{__file__}:{line}"]
+        self.assertGreaterEqual(site['bytes_per_tick'], 200 * 16)
+        self.assertGreaterEqual(site['allocs_per_tick'], 1)
+        # Nulla resta vivo: la crescita netta non la vede
+        for retained in report['retained_sites']:
+            if retained['site'].endswith(f":{line}"):
+                self.assertLess(retained['blocks_per_tick'], 1)
+
+    def test_report_counts_gc_collections(self):
+        """Test che le raccolte del GC nella finestra vengano contate"""
+        gc.collect()
+        self.tracker.tick()
+
+        report = self.tracker.report()
+
+        self.assertGreaterEqual(report['gc_collections'][2], 1)
+        self.assertGreater(report['gc_pause_ms_total'], 0.0)
+
+
+class TestFreezeLongLivedObjects(unittest.TestCase):
+    """Test per la taratura del GC dopo il caricamento di un livello"""
+
+    def tearDown(self):
+        """Cleanup dopo ogni test"""
+        gc.unfreeze()
+
+    def test_freeze_moves_objects_to_permanent_generation(self):
+        """Test che gli oggetti esistenti vengano congelati"""
+        thresholds = gc.get_threshold()
+        freeze_long_lived_objects()
+
+        self.assertGreater(gc.get_freeze_count(), 0)
+        self.assertEqual(gc.get_threshold(), thresholds)
+
+    def test_apply_gc_thresholds_returns_previous(self):
+        """Test che le soglie vengano applicate e quelle precedenti restituite"""
+        thresholds = gc.get_threshold()
+        previous = apply_gc_thresholds()
+        try:
+            self.assertEqual(previous, thresholds)
+            if GC_THRESHOLDS is not None:
+                self.assertEqual(gc.get_threshold(), GC_THRESHOLDS)
+        finally:
+            gc.set_threshold(*previous)
+
+    def test_freeze_releases_previous_level_objects(self):
+        """Test che gli oggetti congelati in precedenza e ora irraggiungibili vengano raccolti"""
+        cycles = []
+        for _ in range(1000):
+            cycle = []
+            cycle.append(cycle)
+            cycles.append(cycle)
+        freeze_long_lived_objects()
+        frozen_with_cycles = gc.get_freeze_count()
+
+        del cycles, cycle
+        freeze_long_lived_objects()
+
+        self.assertLessEqual(gc.get_freeze_count(), frozen_with_cycles - 1000)
+
+
+if __name__ == '__main__':
+    unittest.main()
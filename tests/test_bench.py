@@ -0,0 +1,61 @@
+"""
+Test unitari per il benchmark headless
+"""
+import tracemalloc
+import unittest
+from src.bench import (
+    SCENARIOS, PHASES, percentile, compare_results, run_scenario, run_physics_comparison
+)
+
+
+def make_result(ticks_per_sec: float, frame_p95: float) -> dict:
+    """Crea un risultato minimo di uno scenario"""
+    phases = {phase: {'p95_ms': 1.0} for phase in PHASES}
+    phases['frame'] = {'p95_ms': frame_p95}
+    return {'ticks_per_sec': ticks_per_sec, 'phases': phases}
+
+
+class TestBench(unittest.TestCase):
+    """Test per src.bench"""
+
+    def test_scenarios(self):
+        """Test che ci siano i livelli e gli scenari di stress"""
+        for name in ("level1", "level5", "demon_arena", "coin_field", "menu_idle"):
+            self.assertIn(name, SCENARIOS)
+
+    def test_percentile(self):
+        """Test del percentile nearest-rank"""
+        values = [float(i) for i in range(1, 101)]
+
+        self.assertEqual(percentile(values, 50), 50.0)
+        self.assertEqual(percentile(values, 99), 99.0)
+        self.assertEqual(percentile([], 50), 0.0)
+
+    def test_compare_detects_regressions(self):
+        """Test che un calo di ticks/s o un aumento del p95 oltre soglia siano segnalati"""
+        baseline = {'level1': make_result(1000, 1.0)}
+
+        self.assertEqual(compare_results({'level1': make_result(950, 1.05)}, baseline, 0.10), [])
+        regressions = compare_results({'level1': make_result(800, 1.5)}, baseline, 0.10)
+        self.assertEqual(len(regressions), 2)
+
+    def test_run_scenario(self):
+        """Test di un'esecuzione breve dello scenario del menu"""
+        result = run_scenario(SCENARIOS["menu_idle"], ticks=20, warmup_ticks=2)
+
+        self.assertEqual(result['ticks'], 20)
+        self.assertGreater(result['ticks_per_sec'], 0)
+        self.assertEqual(set(result['phases']), set(PHASES))
+        self.assertGreater(result['tick_alloc_peak_bytes'], 0)
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_run_physics_comparison(self):
+        """Test che il confronto della fisica misuri entrambi i percorsi"""
+        timings = run_physics_comparison(bodies=50, ticks=20)
+
+        self.assertGreater(timings['per_entity_us_per_tick'], 0)
+        self.assertGreater(timings['physics_world_us_per_tick'], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
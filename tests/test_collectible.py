@@ -4,7 +4,9 @@ Test unitari per le classi Collectible
 import unittest
 from unittest.mock import Mock, patch
 import pygame
-from src.collectible import Gold, Silver, Myrrh, create_random_collectible, spawn_collectibles_in_area
+from src.collectible import (
+    Collectible, Gold, Silver, Myrrh, create_random_collectible, spawn_collectibles_in_area
+)
 from src.config import GOLD_VALUE, SILVER_VALUE, MYRRH_VALUE, COLLECTIBLE_SIZE
 
 
@@ -14,10 +16,12 @@ class TestGold(unittest.TestCase):
     def setUp(self):
         """Setup per ogni test"""
         pygame.init()
+        Collectible.clear_sprite_cache()
         self.gold = Gold(100, 200)
         
     def tearDown(self):
         """Cleanup dopo ogni test"""
+        Collectible.clear_sprite_cache()
         pygame.quit()
 
     def test_init(self):
@@ -47,16 +51,30 @@ class TestGold(unittest.TestCase):
         # La Y dovrebbe essere cambiata per l'animazione
         # (potrebbe essere uguale per coincidenza, ma di solito cambia)
 
-    @patch('pygame.draw.circle')
-    @patch('pygame.font.Font')
-    def test_draw(self, mock_font, mock_circle):
-        """Test disegno dell'oro"""
+    def test_draw(self):
+        """Test disegno dell'oro con un solo blit dello sprite condiviso"""
         mock_screen = Mock()
-        mock_font.return_value.render.return_value = Mock()
-        mock_font.return_value.render.return_value.get_rect.return_value = Mock()
         
+        with patch('pygame.draw.circle', wraps=pygame.draw.circle) as mock_circle:
+            self.gold.draw(mock_screen)
+            self.assertTrue(mock_circle.called)
+            
+        mock_screen.blit.assert_called_once_with(Gold.get_sprite(), (100, 200))
+
+    def test_draw_reuses_shared_sprite(self):
+        """Test che la grafica venga disegnata una sola volta per tipo"""
+        mock_screen = Mock()
         self.gold.draw(mock_screen)
-        self.assertTrue(mock_circle.called)
+
+        with patch('pygame.draw.circle') as mock_circle, \
+             patch('pygame.font.Font') as mock_font:
+            Gold(300, 200).draw(mock_screen)
+            mock_circle.assert_not_called()
+            mock_font.assert_not_called()
+
+        first_sprite = mock_screen.blit.call_args_list[0][0][0]
+        second_sprite = mock_screen.blit.call_args_list[1][0][0]
+        self.assertIs(first_sprite, second_sprite)
 
     def test_draw_when_collected(self):
         """Test che non disegni quando raccolto"""
@@ -74,10 +92,12 @@ class TestSilver(unittest.TestCase):
     def setUp(self):
         """Setup per ogni test"""
         pygame.init()
+        Collectible.clear_sprite_cache()
         self.silver = Silver(150, 250)
         
     def tearDown(self):
         """Cleanup dopo ogni test"""
+        Collectible.clear_sprite_cache()
         pygame.quit()
 
     def test_init(self):
@@ -99,6 +119,7 @@ class TestSilver(unittest.TestCase):
         self.silver.draw(mock_screen)
         self.assertTrue(mock_rect.called)
         self.assertTrue(mock_line.called)
+        mock_screen.blit.assert_called_once()
 
 
 class TestMyrrh(unittest.TestCase):
@@ -107,10 +128,12 @@ class TestMyrrh(unittest.TestCase):
     def setUp(self):
         """Setup per ogni test"""
         pygame.init()
+        Collectible.clear_sprite_cache()
         self.myrrh = Myrrh(200, 300)
         
     def tearDown(self):
         """Cleanup dopo ogni test"""
+        Collectible.clear_sprite_cache()
         pygame.quit()
 
     def test_init(self):
@@ -141,6 +164,14 @@ class TestMyrrh(unittest.TestCase):
         self.assertTrue(mock_polygon.called)
         self.assertTrue(mock_line.called)
 
+    def test_sparkle_phases_use_two_sprites(self):
+        """Test che scintillio e alone usino due sprite pre-renderizzati"""
+        self.myrrh.sparkle_timer = 5
+        self.assertEqual(self.myrrh.get_animation_phase(), 0)
+        self.myrrh.sparkle_timer = 20
+        self.assertEqual(self.myrrh.get_animation_phase(), 1)
+        self.assertIsNot(Myrrh.get_sprite(0), Myrrh.get_sprite(1))
+
 
 class TestCollectibleFunctions(unittest.TestCase):
     """Test per le funzioni helper dei collezionabili"""
@@ -1,13 +1,19 @@
 """
 Test unitari per la classe Game
 """
+import asyncio
+import gc
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 import pygame
 from src.game import Game
+from src.enemy import DemonArmed
+from src.collectible import Gold
+from src.platform import Platform
 from src.config import (
     GAME_STATE_MENU, GAME_STATE_PLAYING, GAME_STATE_PAUSED,
-    GAME_STATE_GAME_OVER, SCREEN_WIDTH, SCREEN_HEIGHT
+    GAME_STATE_GAME_OVER, GAME_STATE_LEVEL_INTRO, GAME_STATE_LEVEL_COMPLETE,
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, MAX_CATCHUP_TICKS, GROUND_Y
 )
 
 
@@ -16,12 +22,8 @@ class TestGame(unittest.TestCase):
 
     def setUp(self):
         """Setup per ogni test"""
-        # Mock pygame per evitare apertura finestre durante i test
-        with patch('pygame.init'), \
-             patch('pygame.display.set_mode'), \
-             patch('pygame.display.set_caption'), \
-             patch('pygame.font.Font'):
-            self.game = Game()
+        # Modalità headless: driver SDL dummy, nessuna finestra
+        self.game = Game(headless=True)
             
     def tearDown(self):
         """Cleanup dopo ogni test"""
@@ -44,6 +46,19 @@ class TestGame(unittest.TestCase):
         self.assertIsNotNone(self.game.player)
         self.assertEqual(self.game.player.x, 100)
 
+    def test_headless_game_leaves_gc_untouched(self):
+        """Test che un gioco headless non cambi soglie, oggetti congelati e callback del GC"""
+        thresholds = gc.get_threshold()
+        frozen = gc.get_freeze_count()
+        callbacks = list(gc.callbacks)
+        
+        game = Game(headless=True)
+        game._start_level(2)
+        
+        self.assertEqual(gc.get_threshold(), thresholds)
+        self.assertEqual(gc.get_freeze_count(), frozen)
+        self.assertEqual(gc.callbacks, callbacks)
+
     @patch('pygame.event.get')
     def test_handle_quit_event(self, mock_event_get):
         """Test gestione evento quit"""
@@ -93,22 +108,17 @@ class TestGame(unittest.TestCase):
     def test_update_player_when_playing(self):
         """Test che il player si aggiorni quando lo stato è PLAYING"""
         self.game.state = GAME_STATE_PLAYING
-        self.game.player = Mock()
-        self.game.player.is_alive.return_value = True
-        self.game.player.x = 100
-        self.game.player.width = 32
+        self.game.player.is_alive = Mock(return_value=True)
+        self.game.player.update_controls = Mock()
         
         self.game._update()
         
-        self.game.player.update.assert_called_once_with(self.game.keys_pressed)
+        self.game.player.update_controls.assert_called_once_with(self.game.keys_pressed)
 
     def test_game_over_when_player_dies(self):
         """Test transizione a game over quando il player muore"""
         self.game.state = GAME_STATE_PLAYING
-        self.game.player = Mock()
-        self.game.player.is_alive.return_value = False
-        self.game.player.x = 100
-        self.game.player.width = 32
+        self.game.player.is_alive = Mock(return_value=False)
         
         self.game._update()
         
@@ -145,6 +155,21 @@ class TestGame(unittest.TestCase):
         self.assertNotEqual(self.game.player, old_player)
         self.assertEqual(self.game.state, GAME_STATE_PLAYING)
 
+    def test_static_layer_follows_platform_changes(self):
+        """Test che aggiungere una piattaforma ricomponga il layer statico"""
+        self.game._start_level(1)
+        layer = self.game._get_static_layer()
+        self.assertIs(self.game._get_static_layer(), layer)
+        
+        platform = Platform(500, 60, 120)
+        before = layer.get_at(platform.rect.center)
+        self.game.platforms.append(platform)
+        
+        new_layer = self.game._get_static_layer()
+        self.assertIsNot(new_layer, layer)
+        self.assertNotEqual(new_layer.get_at(platform.rect.center), before)
+        self.assertIs(self.game._get_static_layer(), new_layer)
+
     @patch('pygame.event.get')
     def test_restart_from_game_over(self, mock_event_get):
         """Test riavvio da game over con R"""
@@ -161,6 +186,120 @@ class TestGame(unittest.TestCase):
         self.assertNotEqual(self.game.player, old_player)
         self.assertEqual(self.game.state, GAME_STATE_PLAYING)
 
+    @patch('pygame.event.get')
+    def test_level_intro_waits_for_preload(self, mock_event_get):
+        """Test che ENTER sull'introduzione attenda gli sprite del livello"""
+        mock_keydown_event = Mock()
+        mock_keydown_event.type = pygame.KEYDOWN
+        mock_keydown_event.key = pygame.K_RETURN
+        mock_event_get.return_value = [mock_keydown_event]
+        
+        self.game.state = GAME_STATE_LEVEL_INTRO
+        self.game.preload_job = Mock(done=False)
+        self.game._handle_events()
+        self.assertEqual(self.game.state, GAME_STATE_LEVEL_INTRO)
+        
+        self.game.preload_job.done = True
+        self.game._update()
+        self.assertIsNone(self.game.preload_job)
+        self.assertEqual(self.game.state, GAME_STATE_PLAYING)
+
+    def test_enemy_ai_uses_grid_for_player_distance(self):
+        """Test che l'IA veda solo i nemici vicini trovati con la griglia"""
+        self.game.state = GAME_STATE_PLAYING
+        self.game.player.x = 300
+        near = DemonArmed(400, GROUND_Y - 74)
+        far = DemonArmed(800, GROUND_Y - 74)
+        far.ai_state = "chase"
+        self.game.enemies = [near, far]
+        
+        self.assertEqual(self.game._find_enemies_near_player(), {near})
+        
+        self.game._update()
+        
+        self.assertEqual(near.ai_state, "chase")
+        self.assertEqual(far.ai_state, "patrol")
+
+    def test_next_level_prefetch_is_reused(self):
+        """Test che il prefetch sulla schermata di fine livello serva il livello successivo"""
+        self.game._complete_preload()
+        self.game.state = GAME_STATE_LEVEL_COMPLETE
+        self.game._update()
+        prefetch_job = self.game.prefetch_job
+        
+        self.assertIsNotNone(prefetch_job)
+        self.assertEqual(self.game._prefetch_level, 2)
+        
+        self.game._advance_to_next_level()
+        self.assertIs(self.game.preload_job, prefetch_job)
+        self.assertIsNone(self.game.prefetch_job)
+
+    def _run_frames(self, frame_durations) -> int:
+        """
+        Esegue il loop principale con un orologio simulato
+        
+        Args:
+            frame_durations: Durata in secondi di ogni frame
+            
+        Returns:
+            Numero di tick di simulazione eseguiti
+        """
+        clock = {'now': 0.0, 'frame': 0}
+        self.game.headless = False  # Loop a passo fisso, non quello headless
+        
+        def fake_draw():
+            clock['now'] += frame_durations[clock['frame']]
+            clock['frame'] += 1
+            if clock['frame'] >= len(frame_durations):
+                self.game.running = False
+                
+        with patch('src.game.time.perf_counter', side_effect=lambda: clock['now']), \
+             patch.object(self.game, '_handle_events'), \
+             patch.object(self.game, '_update') as mock_update, \
+             patch.object(self.game, '_draw', side_effect=fake_draw), \
+             patch('src.game.asyncio.sleep', new=AsyncMock()), \
+             patch('pygame.quit'), \
+             patch('sys.exit'):
+            asyncio.run(self.game.run())
+        return mock_update.call_count
+
+    def test_fixed_timestep_independent_of_frame_rate(self):
+        """Test che 2 secondi simulati diano gli stessi tick a 30 e a 144 fps"""
+        ticks_30 = self._run_frames([1 / 30] * 61)
+        self.game.running = True
+        ticks_144 = self._run_frames([1 / 144] * 289)
+        
+        self.assertAlmostEqual(ticks_30, 2 * FPS, delta=1)
+        self.assertAlmostEqual(ticks_144, 2 * FPS, delta=1)
+
+    def test_catch_up_ticks_are_capped(self):
+        """Test che un frame lentissimo non provochi una raffica di tick"""
+        ticks = self._run_frames([0.0, 2.0, 1 / FPS])
+        
+        self.assertLessEqual(ticks, MAX_CATCHUP_TICKS + 1)
+
+    def test_collisions_only_touch_nearby_entities(self):
+        """Test che attacco e raccolta colpiscano solo le entità vicine al player"""
+        player = self.game.player
+        player.x, player.y = 400, 300
+        player.rect.topleft = (400, 300)
+        
+        near = DemonArmed(player.x + player.width, player.y)
+        far = [DemonArmed(50 + i * 3, 600) for i in range(100)]
+        self.game.enemies = far + [near]
+        coin = Gold(player.x + 10, player.y + 10)
+        far_coin = Gold(900, 100)
+        self.game.collectibles = [far_coin, coin]
+        
+        player.start_attack()
+        self.game._handle_collisions()
+        
+        self.assertLess(near.health, near.max_health)
+        self.assertTrue(all(enemy.health == enemy.max_health for enemy in far))
+        self.assertTrue(coin.is_collected())
+        self.assertFalse(far_coin.is_collected())
+        self.assertEqual(len(self.game.enemy_grid), 101)
+
     @patch('pygame.event.get')
     def test_keyup_event(self, mock_event_get):
         """Test gestione evento keyup"""
@@ -178,5 +317,49 @@ class TestGame(unittest.TestCase):
         self.assertFalse(self.game.keys_pressed.get(pygame.K_LEFT, False))
 
 
+
+class TestHeadlessGame(unittest.TestCase):
+    """Test per la modalità headless"""
+
+    def test_run_ticks_without_rendering(self):
+        """Test che con render_every=0 la simulazione avanzi senza disegnare"""
+        game = Game(headless=True, render_every=0)
+        game.state = GAME_STATE_PLAYING
+        
+        with patch.object(game, '_draw') as mock_draw:
+            game.run_ticks(120)
+            
+        mock_draw.assert_not_called()
+        self.assertIsNone(game.preload_job)
+        self.assertEqual(game.ticks_run, 120)
+        self.assertEqual(game.sim_clock.get_ticks(), 2000)
+
+    def test_render_sampling(self):
+        """Test che venga disegnato un frame ogni render_every tick"""
+        game = Game(headless=True, render_every=10)
+        game._complete_preload()
+        game.state = GAME_STATE_PLAYING
+        
+        with patch.object(game, '_draw') as mock_draw:
+            game.run_ticks(100)
+            
+        self.assertEqual(mock_draw.call_count, 10)
+
+    def test_headless_run_has_no_frame_cap(self):
+        """Test che run() in headless non attenda il tempo reale"""
+        game = Game(headless=True, render_every=0)
+        game.state = GAME_STATE_PLAYING
+        
+        def stop_after_ticks(ticks):
+            Game.run_ticks(game, ticks)
+            game.running = False
+            
+        with patch.object(game, 'run_ticks', side_effect=stop_after_ticks), \
+             patch('pygame.quit'):
+            asyncio.run(game.run())
+            
+        self.assertGreaterEqual(game.ticks_run, 1000)
+
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
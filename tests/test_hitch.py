@@ -0,0 +1,137 @@
+"""
+Test unitari per il rilevatore di hitch
+"""
+import gc
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from types import SimpleNamespace
+from src.hitch import GCMonitor, HitchDetector, gc_monitor
+from src.sprite_manager import sprite_manager
+from src.config import GAME_STATE_PLAYING, GAME_STATE_LEVEL_INTRO
+
+
+class TestHitchDetector(unittest.TestCase):
+    """Test per la classe HitchDetector"""
+
+    def setUp(self):
+        """Setup per ogni test"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.log_path = os.path.join(self.temp_dir.name, "hitches.jsonl")
+        self.detector = HitchDetector(budget_ms=20.0, log_path=self.log_path, max_log_bytes=2000)
+        self.game = SimpleNamespace(
+            state=GAME_STATE_PLAYING,
+            level_manager=SimpleNamespace(current_level=1),
+            sim_clock=SimpleNamespace(tick_count=0),
+            enemies=[object()] * 3,
+            collectibles=[object()] * 5,
+        )
+        # Primo frame: fissa i valori di partenza
+        self.detector.end_frame(self.game, 0.001, 0.001, 0.001)
+
+    def tearDown(self):
+        """Cleanup dopo ogni test"""
+        self.detector.close()
+        self.temp_dir.cleanup()
+
+    def _read_log(self):
+        with open(self.log_path, "r", encoding="utf-8") as log_file:
+            return [json.loads(line) for line in log_file]
+
+    def test_frame_within_budget_is_not_logged(self):
+        """Test che i frame nel budget non vengano registrati"""
+        self.assertIsNone(self.detector.end_frame(self.game, 0.005, 0.005, 0.005))
+        self.assertEqual(self.detector.hitch_count, 0)
+        self.assertFalse(os.path.exists(self.log_path))
+
+    def test_hitch_record_contains_cause(self):
+        """Test che un hitch venga scritto con fasi, entità e causa"""
+        self.game.sim_clock.tick_count = 2
+        record = self.detector.end_frame(self.game, 0.001, 0.040, 0.002)
+
+        self.assertIsNotNone(record)
+        self.assertEqual(self.detector.hitch_count, 1)
+        self.assertEqual(record['frame'], 1)
+        self.assertEqual(record['state'], GAME_STATE_PLAYING)
+        self.assertEqual(record['ticks'], 2)
+        self.assertEqual(record['entities'], {'enemies': 3, 'collectibles': 5})
+        self.assertAlmostEqual(record['phases_ms']['update'], 40.0)
+        self.assertFalse(record['level_transition'])
+        self.assertEqual(record['causes'], ["slow_update"])
+        self.assertEqual(self._read_log(), [record])
+
+    def test_sprite_miss_gc_and_transition_are_reported(self):
+        """Test che miss della cache, GC e cambio di stato compaiano tra le cause"""
+        sprite_manager.sprites.get(("sprite_inesistente", None))
+        gc.collect()
+        self.game.state = GAME_STATE_LEVEL_INTRO
+        record = self.detector.end_frame(self.game, 0.0, 0.0, 0.050)
+
+        self.assertEqual(record['sprite_cache_misses'], 1)
+        self.assertGreaterEqual(record['gc_collections'][2], 1)
+        self.assertTrue(record['level_transition'])
+        self.assertEqual(record['previous_state'], GAME_STATE_PLAYING)
+        self.assertEqual(record['causes'], ["sprite_load", "gc", "level_transition"])
+        self.assertGreater(gc_monitor.pause_seconds, 0.0)
+
+    def test_log_size_is_bounded(self):
+        """Test che il log ruoti oltre la dimensione massima"""
+        for _ in range(20):
+            self.detector.end_frame(self.game, 0.0, 0.030, 0.0)
+
+        self.assertLessEqual(os.path.getsize(self.log_path), 2000)
+        self.assertTrue(os.path.exists(self.log_path + ".1"))
+        self.assertEqual(self.detector.hitch_count, 20)
+
+    def test_hitch_is_printed_only_on_request(self):
+        """Test che gli hitch finiscano su stdout solo con print_hitches"""
+        output = StringIO()
+        with redirect_stdout(output):
+            self.detector.end_frame(self.game, 0.0, 0.030, 0.0)
+        self.assertEqual(output.getvalue(), "")
+
+        self.detector.print_hitches = True
+        with redirect_stdout(output):
+            self.detector.end_frame(self.game, 0.0, 0.030, 0.0)
+        self.assertIn("Hitch", output.getvalue())
+
+
+    def test_gc_is_monitored_only_when_hitches_are_reported(self):
+        """Test che senza log né stampa il rilevatore non registri il callback del GC"""
+        callbacks = list(gc.callbacks)
+        detector = HitchDetector(log_path=None, print_hitches=False)
+        self.assertEqual(gc.callbacks, callbacks)
+        detector.close()
+
+        detector = HitchDetector(log_path=None, print_hitches=True)
+        detector.close()
+        self.assertEqual(gc.callbacks, callbacks)
+
+
+class TestGCMonitor(unittest.TestCase):
+    """Test per la classe GCMonitor"""
+
+    def test_callback_is_registered_only_by_install(self):
+        """Test che il callback del GC resti registrato finché c'è un utente"""
+        monitor = GCMonitor()
+        self.assertNotIn(monitor._on_gc, gc.callbacks)
+
+        monitor.install()
+        monitor.install()
+        try:
+            self.assertEqual(gc.callbacks.count(monitor._on_gc), 1)
+            gc.collect()
+            self.assertGreaterEqual(monitor.collections[2], 1)
+        finally:
+            monitor.uninstall()
+        self.assertIn(monitor._on_gc, gc.callbacks)
+        monitor.uninstall()
+        self.assertNotIn(monitor._on_gc, gc.callbacks)
+        monitor.uninstall()  # Senza utenti non fa nulla
+
+
+if __name__ == '__main__':
+    unittest.main()
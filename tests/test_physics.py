@@ -0,0 +1,174 @@
+"""
+Test unitari per la fisica dei corpi dinamici
+"""
+import random
+import unittest
+import pygame
+from src.config import GROUND_Y, SCREEN_WIDTH
+from src.enemy import DemonArmed
+from src.physics import PhysicsWorld, integrate_body
+from src.platform import Platform, PlatformIndex, Ramp
+from src.player import Player
+from src.terrain import TerrainMap
+
+
+class TestIntegrateBody(unittest.TestCase):
+    """Test per il passo fisico di un singolo corpo"""
+
+    def test_falls_and_lands_on_ground(self):
+        """Test gravità e appoggio sul suolo"""
+        x, y, vel_y, on_ground = integrate_body(100, 100, 0, 50, 80, False)
+        self.assertEqual((y, vel_y, on_ground), (101, 1, False))
+
+        x, y, vel_y, on_ground = integrate_body(100, GROUND_Y - 85, 10, 50, 80, False)
+        self.assertEqual((y, vel_y, on_ground), (GROUND_Y - 80, 0, True))
+
+    def test_clamps_to_level_edges(self):
+        """Test dei limiti orizzontali"""
+        self.assertEqual(integrate_body(-10, 0, 0, 50, 80, False)[0], 0)
+        self.assertEqual(integrate_body(SCREEN_WIDTH, 0, 0, 50, 80, False)[0], SCREEN_WIDTH - 50)
+
+    def test_resting_body_stays_on_platform(self):
+        """Test che un corpo fermo su una piattaforma resti appoggiato"""
+        platforms = PlatformIndex([Platform(100, 300, 200)])
+
+        result = integrate_body(150, 220, 0, 50, 80, True, platforms=platforms)
+
+        self.assertEqual(result, (150, 220, 0, True))
+
+    def test_rising_body_passes_through_platform(self):
+        """Test che in salita le piattaforme si attraversino"""
+        platforms = PlatformIndex([Platform(100, 300, 200)])
+
+        x, y, vel_y, on_ground = integrate_body(150, 230, -10, 50, 80, False, platforms=platforms)
+
+        self.assertEqual((y, on_ground), (221, False))
+
+
+class TestPhysicsWorld(unittest.TestCase):
+    """Test per la classe PhysicsWorld"""
+
+    def setUp(self):
+        """Setup per ogni test"""
+        pygame.init()
+        self.world = PhysicsWorld()
+
+    def tearDown(self):
+        """Cleanup dopo ogni test"""
+        pygame.quit()
+
+    def test_step_writes_back_to_bodies(self):
+        """Test che il passo aggiorni posizione, velocità, appoggio e rect dei corpi"""
+        player = Player(100, 100)
+        self.world.sync(player, [])
+        self.world.step()
+
+        self.assertEqual(player.y, 101)
+        self.assertEqual(player.vel_y, 1)
+        self.assertFalse(player.on_ground)
+        self.assertEqual(player.rect.y, 101)
+
+    def test_resting_bodies_sleep(self):
+        """Test che i corpi fermi a terra vengano saltati finché non si muovono"""
+        player = Player(600, GROUND_Y - 80)
+        demons = [DemonArmed(100 * i, GROUND_Y - 74) for i in range(5)]
+        self.world.sync(player, demons)
+        self.world.step()
+        self.world.step()
+        self.assertEqual(self.world.awake_count, 0)
+
+        demons[2].x += 2  # Mosso dall'IA: va di nuovo integrato
+        self.world.step()
+        self.assertEqual(self.world.awake_count, 1)
+        self.assertEqual(demons[2].rect.x, 202)
+
+    def test_jump_wakes_sleeping_body(self):
+        """Test che un salto svegli un corpo addormentato"""
+        player = Player(100, GROUND_Y - 80)
+        self.world.sync(player, [])
+        self.world.step()
+        self.world.step()
+
+        player.vel_y = -15
+        player.on_ground = False
+        self.world.step()
+
+        self.assertLess(player.y, GROUND_Y - 80)
+
+    def test_sync_keeps_bodies_until_list_changes(self):
+        """Test che sync() ricostruisca i corpi solo se cambiano player o nemici"""
+        player = Player(600, GROUND_Y - 80)
+        demons = [DemonArmed(100 * i, GROUND_Y - 74) for i in range(3)]
+        self.world.sync(player, demons)
+        bodies = self.world.bodies
+
+        self.world.sync(player, demons)
+        self.assertIs(self.world.bodies, bodies)
+        self.assertEqual(len(self.world), 4)
+
+        demons.append(DemonArmed(500, GROUND_Y - 74))
+        self.world.sync(player, demons)
+        self.assertEqual(self.world.bodies, [player] + demons)
+
+        other = [DemonArmed(0, GROUND_Y - 74)]
+        self.world.sync(player, other)
+        self.assertEqual(self.world.bodies, [player] + other)
+
+    def test_remove_keeps_slots_aligned(self):
+        """Test che remove() tolga il corpo e i suoi valori dagli array"""
+        player = Player(600, GROUND_Y - 80)
+        demons = [DemonArmed(100 * i, GROUND_Y - 74) for i in range(3)]
+        self.world.sync(player, demons)
+        self.world.step()
+
+        removed = demons.pop(0)
+        self.world.remove(removed)
+        self.world.sync(player, demons)  # Nessuna ricostruzione
+
+        self.assertEqual(self.world.bodies, [player] + demons)
+        self.assertEqual(list(self.world.xs), [600, 100, 200])
+
+    def test_enemies_land_on_platforms(self):
+        """Test che anche i nemici atterrino sulle piattaforme"""
+        platforms = PlatformIndex([Platform(100, 300, 200)])
+        player = Player(600, GROUND_Y - 80)
+        demon = DemonArmed(150, 200)
+        self.world.sync(player, [demon])
+        for _ in range(30):
+            self.world.step(platforms)
+
+        self.assertEqual(demon.y, 300 - demon.height)
+        self.assertTrue(demon.on_ground)
+
+    def test_step_matches_integrate_body(self):
+        """Test che il passo del mondo coincida con integrate_body corpo per corpo"""
+        rng = random.Random(3)
+        platforms = PlatformIndex([Platform(100, 400, 200), Platform(500, 300, 150)])
+        terrain = TerrainMap([Ramp(700, GROUND_Y, 200, 60)])
+        player = Player(50, GROUND_Y - 80)
+        demons = [DemonArmed(rng.randint(0, SCREEN_WIDTH), rng.randint(100, GROUND_Y - 74))
+                  for _ in range(40)]
+        bodies = [player] + demons
+        states = [(body.x, body.y, body.vel_y, body.on_ground) for body in bodies]
+        self.world.sync(player, demons)
+
+        for tick in range(120):
+            for index, body in enumerate(bodies):
+                if tick % 30 == index % 30 and body.on_ground:
+                    body.vel_y = -12  # Salto
+                    body.on_ground = False
+                body.x += rng.choice((-3, 0, 0, 2))
+                x, y, vel_y, on_ground = states[index]
+                if tick % 30 == index % 30 and on_ground:
+                    vel_y, on_ground = -12, False
+                states[index] = integrate_body(body.x, y, vel_y, body.width, body.height,
+                                               on_ground, platforms=platforms, terrain=terrain)
+            self.world.step(platforms, terrain)
+
+            for body, state in zip(bodies, states):
+                self.assertEqual((body.x, body.y, body.vel_y, body.on_ground), state)
+                self.assertEqual((body.rect.x, body.rect.y), (int(body.x), int(body.y)))
+
+
+if __name__ == '__main__':
+    unittest.main()
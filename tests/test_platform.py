@@ -1,16 +1,18 @@
 """
 Test per il modulo delle piattaforme
 """
+import random
 import unittest
 from unittest.mock import Mock, patch
 import sys
 import os
+import pygame
 
 # Aggiunge src al path per gli import
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from src.platform import Platform, Ramp, create_default_platforms, create_default_ramps
-from src.platform import check_platform_collision, check_ramp_collision
+from src.platform import check_platform_collision, check_ramp_collision, PlatformIndex
 
 
 class TestPlatform(unittest.TestCase):
@@ -196,5 +198,88 @@ class TestPlatformFunctions(unittest.TestCase):
         self.assertEqual(ramp_y, 275)
 
 
+
+class TestPlatformIndex(unittest.TestCase):
+    """Test per l'indice delle piattaforme"""
+    
+    def _brute_force_landing(self, body_rect, platforms):
+        """Atterraggio calcolato controllando tutte le piattaforme"""
+        tops = [platform.y for platform in platforms
+                if (platform.y - 3 <= body_rect.bottom <= platform.y + 8 and
+                    body_rect.right > platform.x + 5 and
+                    body_rect.left < platform.x + platform.width - 5)]
+        if not tops:
+            return False, 0
+        return True, min(tops)
+        
+    def test_find_landing_matches_brute_force(self):
+        """Test che l'indice trovi gli stessi atterraggi di un controllo lineare"""
+        rng = random.Random(7)
+        platforms = [Platform(rng.randint(-50, 1000), rng.randint(100, 600), rng.randint(5, 300), 25)
+                     for _ in range(300)]
+        index = PlatformIndex(platforms)
+        
+        for _ in range(500):
+            body_rect = pygame.Rect(rng.randint(-50, 1000), rng.randint(0, 600), 64, 80)
+            self.assertEqual(index.find_landing(body_rect, 5),
+                             self._brute_force_landing(body_rect, platforms))
+            
+    def test_no_landing_when_rising(self):
+        """Test che un corpo in salita non atterri"""
+        index = PlatformIndex([Platform(100, 200, 100, 25)])
+        
+        self.assertEqual(index.find_landing(pygame.Rect(120, 122, 64, 80), -5), (False, 0))
+        self.assertEqual(index.find_landing(pygame.Rect(120, 122, 64, 80), 5), (True, 200))
+        
+    def test_edge_inset(self):
+        """Test che il corpo debba sporgere oltre il bordo rientrato"""
+        index = PlatformIndex([Platform(100, 200, 100, 25)])
+        
+        self.assertFalse(index.find_landing(pygame.Rect(41, 122, 64, 80), 5)[0])
+        self.assertTrue(index.find_landing(pygame.Rect(42, 122, 64, 80), 5)[0])
+        self.assertFalse(index.find_landing(pygame.Rect(195, 122, 64, 80), 5)[0])
+        
+    def test_swept_landing_does_not_tunnel(self):
+        """Test che un corpo veloce atterri sulla prima piattaforma attraversata"""
+        index = PlatformIndex([Platform(100, 300, 100, 25), Platform(100, 200, 100, 25)])
+        
+        # Il fondo passa da 150 a 350 in un solo passo, oltre entrambe le piattaforme
+        body_rect = pygame.Rect(120, 270, 64, 80)
+        
+        self.assertEqual(index.find_landing(body_rect, 200), (False, 0))
+        self.assertEqual(index.find_landing(body_rect, 200, previous_bottom=150), (True, 200))
+        self.assertEqual(index.find_landing(body_rect, 200, previous_bottom=250), (True, 300))
+        
+    def test_swept_landing_ignores_platforms_already_passed(self):
+        """Test che una piattaforma già sopra il corpo al tick precedente venga ignorata"""
+        index = PlatformIndex([Platform(100, 200, 100, 25)])
+        
+        body_rect = pygame.Rect(120, 160, 64, 80)
+        
+        self.assertEqual(index.find_landing(body_rect, 30, previous_bottom=210), (False, 0))
+        
+    def test_is_built_from(self):
+        """Test che l'indice riconosca una lista sostituita o modificata"""
+        platforms = create_default_platforms()
+        index = PlatformIndex(platforms)
+        
+        self.assertTrue(index.is_built_from(platforms))
+        self.assertFalse(index.is_built_from(list(platforms)))
+        platforms.append(Platform(0, 0, 100))
+        self.assertFalse(index.is_built_from(platforms))
+        
+    def test_for_platforms_reuses_index_until_list_changes(self):
+        """Test che una lista passata a ogni tick non ricostruisca l'indice"""
+        platforms = create_default_platforms()
+        index = PlatformIndex.for_platforms(platforms)
+        
+        self.assertIs(PlatformIndex.for_platforms(platforms), index)
+        self.assertIs(PlatformIndex.for_platforms(index), index)
+        platforms.append(Platform(0, 0, 100))
+        rebuilt = PlatformIndex.for_platforms(platforms)
+        self.assertIsNot(rebuilt, index)
+        self.assertTrue(rebuilt.is_built_from(platforms))
+
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
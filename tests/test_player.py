@@ -4,6 +4,8 @@ Test unitari per la classe Player
 import unittest
 from unittest.mock import Mock, patch
 import pygame
+from src.platform import Platform, PlatformIndex, Ramp
+from src.terrain import TerrainMap
 from src.player import Player
 from src.config import (
     PLAYER_WIDTH, PLAYER_HEIGHT, PLAYER_SPEED, PLAYER_JUMP_SPEED,
@@ -109,6 +111,29 @@ class TestPlayer(unittest.TestCase):
         self.assertEqual(self.player.vel_y, 0)
         self.assertTrue(self.player.on_ground)
 
+    def test_fast_fall_lands_on_thin_platform(self):
+        """Test che una caduta veloce non attraversi una piattaforma"""
+        platforms = PlatformIndex([Platform(80, 400, 200, 25)])
+        self.player.y = 400 - self.player.height - 10
+        self.player.vel_y = 60  # Un passo ben oltre lo spessore della piattaforma
+        self.player._update_position(platforms)
+        
+        self.assertEqual(self.player.y, 400 - self.player.height)
+        self.assertEqual(self.player.vel_y, 0)
+        self.assertTrue(self.player.on_ground)
+
+    def test_walks_up_ramp(self):
+        """Test che il player a terra segua la rampa della mappa del terreno"""
+        ramp = Ramp(0, GROUND_Y, 400, 100, slope_up=True)
+        terrain = TerrainMap(ramps=[ramp])
+        self.player.y = GROUND_Y - self.player.height
+        self.player.vel_y = 1
+        self.player._update_position(None, terrain)
+        
+        center_x = self.player.x + self.player.width // 2
+        self.assertEqual(self.player.y + self.player.height, int(ramp.get_height_at_x(center_x)))
+        self.assertTrue(self.player.on_ground)
+
     def test_take_damage(self):
         """Test subire danno"""
         initial_health = self.player.health
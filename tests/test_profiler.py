@@ -0,0 +1,80 @@
+"""
+Test unitari per il profiler in-game
+"""
+import unittest
+import pygame
+from src.profiler import FrameProfiler, _NULL_PHASE
+
+
+class TestFrameProfiler(unittest.TestCase):
+    """Test per la classe FrameProfiler"""
+
+    def setUp(self):
+        """Setup per ogni test"""
+        pygame.init()
+        self.profiler = FrameProfiler(history=10, refresh_interval=5)
+
+    def tearDown(self):
+        """Cleanup dopo ogni test"""
+        pygame.quit()
+
+    def test_disabled_phase_is_noop(self):
+        """Test che da spento il profiler non misuri nulla"""
+        self.assertIs(self.profiler.phase("update"), _NULL_PHASE)
+
+        self.profiler.begin_frame()
+        with self.profiler.phase("update"):
+            pass
+        self.profiler.end_frame()
+
+        self.assertEqual(self.profiler.frame_number, 0)
+        self.assertEqual(self.profiler.last, {})
+
+    def test_phases_accumulate_in_frame(self):
+        """Test che i blocchi della stessa fase si sommino nel frame"""
+        self.profiler.toggle()
+
+        self.profiler.begin_frame()
+        with self.profiler.phase("update.enemies"):
+            pass
+        with self.profiler.phase("update.enemies"):
+            pass
+        self.profiler.end_frame()
+
+        self.assertEqual(self.profiler.frame_number, 1)
+        self.assertIn("update.enemies", self.profiler.last)
+        self.assertIn("frame", self.profiler.last)
+        self.assertGreaterEqual(self.profiler.last["frame"], self.profiler.last["update.enemies"])
+        self.assertGreater(self.profiler.get_frame_time_stats()['avg_ms'], 0.0)
+
+    def test_counter_sources_report_per_frame_delta(self):
+        """Test che i contatori registrati mostrino l'incremento del frame"""
+        total = [100]
+        self.profiler.add_counter_source("blits", lambda: total[0])
+        self.profiler.toggle()
+
+        self.profiler.begin_frame()
+        total[0] += 7
+        self.profiler.end_frame()
+
+        self.assertEqual(self.profiler.counts["blits"], 7)
+
+    def test_draw_returns_panel_rect(self):
+        """Test che l'overlay venga disegnato solo quando attivo"""
+        screen = pygame.Surface((800, 600))
+        font = pygame.font.Font(None, 18)
+
+        self.assertIsNone(self.profiler.draw(screen, font))
+
+        self.profiler.toggle()
+        self.profiler.begin_frame()
+        self.profiler.end_frame()
+        rect = self.profiler.draw(screen, font)
+
+        self.assertIsNotNone(rect)
+        self.assertEqual(rect.right, 790)
+        self.assertEqual(rect.top, 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
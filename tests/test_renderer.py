@@ -0,0 +1,96 @@
+"""
+Test unitari per il renderer a rettangoli sporchi
+"""
+import unittest
+from unittest.mock import patch
+import pygame
+from src.renderer import DirtyRectRenderer, build_static_layer
+from src.platform import Platform
+
+
+class TestDirtyRectRenderer(unittest.TestCase):
+    """Test per la classe DirtyRectRenderer"""
+
+    def setUp(self):
+        """Setup per ogni test"""
+        self.screen = pygame.Surface((200, 100))
+        self.background = pygame.Surface((200, 100))
+        self.background.fill((10, 20, 30))
+        self.renderer = DirtyRectRenderer(self.screen)
+        self.renderer.set_background(self.background)
+
+    @patch('pygame.display.flip')
+    def test_first_frame_is_full_redraw(self, mock_flip):
+        """Test che il primo frame ridisegni e presenti tutto lo schermo"""
+        self.renderer.begin_frame()
+        self.renderer.present()
+
+        mock_flip.assert_called_once()
+        self.assertEqual(self.screen.get_at((150, 50))[:3], (10, 20, 30))
+
+    @patch('pygame.display.update')
+    @patch('pygame.display.flip')
+    def test_dirty_frame_updates_only_marked_regions(self, mock_flip, mock_update):
+        """Test che i frame successivi presentino solo le regioni sporche"""
+        self.renderer.begin_frame()
+        self.renderer.present()
+
+        self.renderer.begin_frame()
+        self.renderer.mark(pygame.Rect(10, 10, 20, 20))
+        self.renderer.present()
+
+        mock_update.assert_called_once_with([pygame.Rect(10, 10, 20, 20)])
+
+    @patch('pygame.display.update')
+    @patch('pygame.display.flip')
+    def test_previous_regions_are_restored(self, mock_flip, mock_update):
+        """Test che le regioni del frame precedente vengano ripristinate dallo sfondo"""
+        self.renderer.begin_frame()
+        self.renderer.present()
+
+        self.renderer.begin_frame()
+        self.screen.fill((255, 0, 0), pygame.Rect(10, 10, 20, 20))
+        self.renderer.mark(pygame.Rect(10, 10, 20, 20))
+        self.renderer.present()
+
+        self.renderer.begin_frame()
+        self.assertEqual(self.screen.get_at((15, 15))[:3], (10, 20, 30))
+        self.renderer.present()
+
+        # Il frame presenta anche la regione vecchia per cancellarla
+        self.assertIn(pygame.Rect(10, 10, 20, 20), mock_update.call_args[0][0])
+
+    def test_mark_clips_to_screen(self):
+        """Test che le regioni fuori schermo vengano scartate o ritagliate"""
+        self.renderer.begin_frame()
+        self.renderer.mark(pygame.Rect(-50, -50, 10, 10))
+        self.renderer.mark(pygame.Rect(190, 90, 20, 20))
+
+        self.assertEqual(self.renderer.current_rects, [pygame.Rect(190, 90, 10, 10)])
+
+    def test_new_background_forces_full_redraw(self):
+        """Test che cambiare sfondo invalidi il frame"""
+        self.renderer.full_redraw = False
+        self.renderer.set_background(pygame.Surface((200, 100)))
+        self.assertTrue(self.renderer.full_redraw)
+
+
+class TestStaticLayer(unittest.TestCase):
+    """Test per la composizione del layer statico"""
+
+    def test_platforms_are_baked_into_layer(self):
+        """Test che le piattaforme vengano disegnate nel layer e non sullo sfondo"""
+        background = pygame.Surface((300, 200))
+        background.fill((10, 20, 30))
+        platform = Platform(50, 100, 120, 25)
+
+        layer = build_static_layer(background, [platform])
+
+        self.assertIsNot(layer, background)
+        self.assertNotEqual(layer.get_at((100, 112))[:3], (10, 20, 30))
+        self.assertEqual(background.get_at((100, 112))[:3], (10, 20, 30))
+        self.assertEqual(layer.get_at((10, 10))[:3], (10, 20, 30))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+Test unitari per l'orologio di simulazione
+"""
+import unittest
+from src.sim_clock import SimulationClock
+from src.level import LevelManager
+
+
+class TestSimulationClock(unittest.TestCase):
+    """Test per la classe SimulationClock"""
+
+    def setUp(self):
+        """Setup per ogni test"""
+        self.clock = SimulationClock(tick_rate=60, max_catchup_ticks=5)
+
+    def test_ticks_advance_time(self):
+        """Test che 60 tick corrispondano a un secondo di gioco"""
+        for _ in range(60):
+            self.clock.tick()
+
+        self.assertEqual(self.clock.get_ticks(), 1000)
+        self.assertAlmostEqual(self.clock.get_seconds(), 1.0)
+
+    def test_pause_freezes_time(self):
+        """Test che in pausa il tempo non avanzi e non vengano chiesti tick"""
+        self.clock.pause()
+        self.clock.accumulate(1.0)
+        self.clock.tick()
+
+        self.assertEqual(self.clock.get_pending_ticks(), 0)
+        self.assertEqual(self.clock.get_ticks(), 0)
+
+        self.clock.resume()
+        self.clock.tick()
+        self.assertGreater(self.clock.get_ticks(), 0)
+
+    def test_pending_ticks_follow_real_time(self):
+        """Test che il tempo reale venga convertito in tick interi"""
+        self.clock.accumulate(0.05)
+
+        self.assertEqual(self.clock.get_pending_ticks(), 3)
+        self.assertAlmostEqual(self.clock.get_alpha(), 0.0, places=5)
+
+    def test_time_scale(self):
+        """Test che a velocità doppia servano il doppio dei tick"""
+        self.clock.set_time_scale(2.0)
+        self.clock.accumulate(0.05)
+
+        self.assertEqual(self.clock.get_pending_ticks(), 6)
+
+    def test_invalid_time_scale(self):
+        """Test che una scala non positiva venga rifiutata"""
+        with self.assertRaises(ValueError):
+            self.clock.set_time_scale(0)
+
+    def test_catch_up_is_capped(self):
+        """Test che dopo un blocco lungo si recuperino al massimo i tick previsti"""
+        self.clock.accumulate(10.0)
+
+        self.assertEqual(self.clock.get_pending_ticks(), 5)
+        self.assertEqual(self.clock.get_pending_ticks(), 0)
+
+    def test_turbo_ignores_real_time(self):
+        """Test che in turbo il tempo reale non generi tick"""
+        self.clock.set_turbo(True)
+        self.clock.accumulate(1.0)
+
+        self.assertEqual(self.clock.get_pending_ticks(), 0)
+        self.assertEqual(self.clock.get_alpha(), 1.0)
+
+    def test_level_timer_uses_simulation_time(self):
+        """Test che il limite di 120 secondi del livello 2 scada in tick, non in tempo reale"""
+        level_manager = LevelManager()
+        level_manager.start_level(2, self.clock.get_ticks())
+
+        for _ in range(121 * 60):
+            self.clock.tick()
+        level_manager.update_timer(self.clock.get_ticks())
+
+        self.assertEqual(level_manager.level_time_elapsed, 121)
+        self.assertTrue(level_manager.is_level_failed({'player_alive': True, 'collectibles_remaining': 1}))
+
+
+if __name__ == "__main__":
+    unittest.main()
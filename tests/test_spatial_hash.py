@@ -0,0 +1,140 @@
+"""
+Test unitari per la griglia delle collisioni
+"""
+import random
+import unittest
+import pygame
+from src.spatial_hash import SpatialHash
+
+
+class Box:
+    """Oggetto minimo con un rect, come le entità del gioco"""
+
+    def __init__(self, x: int, y: int, width: int, height: int):
+        self.rect = pygame.Rect(x, y, width, height)
+
+
+class TestSpatialHash(unittest.TestCase):
+    """Test per la classe SpatialHash"""
+
+    def setUp(self):
+        """Setup per ogni test"""
+        self.grid = SpatialHash(cell_size=64)
+
+    def test_query_rect_matches_brute_force(self):
+        """Test che la query restituisca gli stessi oggetti di un controllo lineare"""
+        rng = random.Random(1)
+        boxes = [Box(rng.randint(-50, 1000), rng.randint(-50, 700),
+                     rng.randint(1, 120), rng.randint(1, 120)) for _ in range(300)]
+        self.grid.rebuild(boxes)
+
+        for _ in range(50):
+            area = pygame.Rect(rng.randint(-50, 1000), rng.randint(-50, 700),
+                               rng.randint(1, 200), rng.randint(1, 200))
+            expected = [box for box in boxes if box.rect.colliderect(area)]
+            self.assertEqual(self.grid.query_rect(area), expected)
+
+    def test_object_spanning_cells_is_returned_once(self):
+        """Test che un oggetto su più celle compaia una sola volta"""
+        big = Box(10, 10, 200, 200)
+        self.grid.rebuild([big])
+
+        self.assertEqual(self.grid.query_rect(pygame.Rect(0, 0, 300, 300)), [big])
+        self.assertEqual(len(self.grid), 1)
+
+    def test_query_keeps_list_order_after_moves(self):
+        """Test che le query seguano l'ordine della lista anche dopo uno spostamento"""
+        boxes = [Box(x, 10, 20, 20) for x in (10, 80, 150)]
+        self.grid.rebuild(boxes)
+        boxes[0].rect.x = 160  # Passa nella cella degli altri, in coda alla lista della cella
+        self.grid.move(boxes[0])
+
+        self.assertEqual(self.grid.query_rect(pygame.Rect(0, 0, 300, 64)), boxes)
+        self.assertEqual(self.grid.query_point(165, 15), [boxes[0], boxes[2]])
+
+    def test_negative_cells_do_not_collide(self):
+        """Test che le celle con coordinate negative restino distinte"""
+        above = Box(0, -64, 10, 10)
+        far = Box(-64, 65535 * 64, 10, 10)
+        self.grid.rebuild([above, far])
+
+        self.assertEqual(self.grid.query_rect(pygame.Rect(0, -64, 64, 64)), [above])
+        self.assertEqual(self.grid.cell_rects[(0, -1)], [above.rect])
+
+    def test_query_point(self):
+        """Test della query per punto"""
+        first = Box(0, 0, 50, 50)
+        second = Box(40, 40, 50, 50)
+        self.grid.rebuild([first, second])
+
+        self.assertCountEqual(self.grid.query_point(45, 45), [first, second])
+        self.assertEqual(self.grid.query_point(10, 10), [first])
+        self.assertEqual(self.grid.query_point(500, 500), [])
+
+    def test_rebuild_replaces_previous_objects(self):
+        """Test che la ricostruzione dimentichi gli oggetti precedenti"""
+        old = Box(0, 0, 10, 10)
+        self.grid.rebuild([old])
+        new = Box(100, 100, 10, 10)
+        self.grid.rebuild([new])
+
+        self.assertEqual(self.grid.query_rect(pygame.Rect(0, 0, 200, 200)), [new])
+
+    def test_move_and_remove(self):
+        """Test che move() segua lo spostamento e remove() tolga l'oggetto"""
+        box = Box(0, 0, 10, 10)
+        boxes = [box]
+        self.grid.rebuild(boxes)
+
+        box.rect.topleft = (300, 300)
+        self.grid.move(box)
+        self.assertEqual(self.grid.query_rect(pygame.Rect(0, 0, 50, 50)), [])
+        self.assertEqual(self.grid.query_point(305, 305), [box])
+
+        boxes.remove(box)
+        self.grid.remove(box)
+        self.assertEqual(len(self.grid), 0)
+        self.assertEqual(self.grid.query_point(305, 305), [])
+
+    def test_sync_rebuilds_only_when_list_changes(self):
+        """Test che sync() ricostruisca solo se la lista è stata sostituita o modificata"""
+        box = Box(0, 0, 10, 10)
+        boxes = [box]
+        self.grid.sync(boxes)
+
+        box.rect.topleft = (300, 300)  # Spostato senza move(): la griglia non lo sa
+        self.grid.sync(boxes)
+        self.assertEqual(self.grid.query_point(305, 305), [])
+
+        added = Box(200, 200, 10, 10)
+        boxes.append(added)
+        self.grid.sync(boxes)
+        self.assertEqual(self.grid.query_point(205, 205), [added])
+
+    def test_update_follows_moved_objects(self):
+        """Test che update() sposti solo gli oggetti usciti dalle loro celle"""
+        near = Box(0, 0, 10, 10)
+        far = Box(0, 0, 10, 10)
+        boxes = [near, far]
+        self.grid.update(boxes)
+
+        near.rect.x = 20  # Stessa cella
+        far.rect.x = 400  # Altra cella
+        self.grid.update(boxes)
+
+        self.assertEqual(self.grid.query_point(25, 5), [near])
+        self.assertEqual(self.grid.query_point(405, 5), [far])
+        self.assertEqual(self.grid.query_rect(pygame.Rect(0, 0, 15, 15)), [])
+
+    def test_padding_covers_vertical_oscillation(self):
+        """Test che con il padding un oggetto spostato in verticale venga trovato senza move()"""
+        grid = SpatialHash(cell_size=64, padding_y=10)
+        box = Box(10, 60, 10, 10)
+        grid.rebuild([box])
+
+        box.rect.y = 50  # Da una riga di celle all'altra, entro il padding
+        self.assertEqual(grid.query_rect(pygame.Rect(0, 0, 40, 58)), [box])
+
+
+if __name__ == '__main__':
+    unittest.main()
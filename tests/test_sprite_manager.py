@@ -0,0 +1,329 @@
+"""
+Test unitari per lo SpriteManager
+"""
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+import pygame
+from src.sprite_manager import SpriteManager
+from src.asset_pipeline import build_variants, get_sprite_variants
+from src.sprite_cache import SpriteDiskCache
+
+
+class TestSpriteManager(unittest.TestCase):
+    """Test per la classe SpriteManager"""
+
+    def setUp(self):
+        """Setup per ogni test: cartella sprite temporanea con un'immagine asimmetrica"""
+        # convert_alpha richiede una modalità video attiva
+        pygame.display.init()
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+        
+        self.sprite_dir = tempfile.mkdtemp()
+        image = pygame.Surface((20, 10), pygame.SRCALPHA)
+        image.fill((255, 0, 0, 255))
+        image.fill((0, 0, 255, 255), pygame.Rect(0, 0, 5, 10))
+        pygame.image.save(image, os.path.join(self.sprite_dir, "test.png"))
+
+        self.manager = SpriteManager()
+        self.manager.sprite_path = self.sprite_dir
+        self.manager.disk_cache = None
+
+    def tearDown(self):
+        """Cleanup dopo ogni test"""
+        shutil.rmtree(self.sprite_dir)
+        pygame.display.quit()
+
+    def test_load_sprite_is_cached(self):
+        """Test che lo stesso sprite venga caricato una sola volta"""
+        first = self.manager.load_sprite("test", (40, 20))
+        second = self.manager.load_sprite("test", (40, 20))
+
+        self.assertIs(first, second)
+        self.assertEqual(first.get_size(), (40, 20))
+
+    def test_flipped_variant_is_cached(self):
+        """Test che la variante specchiata venga calcolata una sola volta"""
+        with patch('pygame.transform.flip', wraps=pygame.transform.flip) as mock_flip:
+            first = self.manager.load_sprite("test", (20, 10), flip_x=True)
+            second = self.manager.load_sprite("test", (20, 10), flip_x=True)
+
+        self.assertIs(first, second)
+        self.assertEqual(mock_flip.call_count, 1)
+        # La banda blu passa dal lato sinistro a quello destro
+        self.assertEqual(first.get_at((19, 5))[:3], (0, 0, 255))
+        self.assertEqual(first.get_at((0, 5))[:3], (255, 0, 0))
+
+    def test_variant_miss_is_counted_once(self):
+        """Test che una variante mancante conti un miss e le superfici create"""
+        self.manager.load_sprite("test", (20, 10), flip_x=True)
+
+        self.assertEqual(self.manager.sprites.misses, 1)
+        self.assertEqual(self.manager.sprites.hits, 0)
+        self.assertEqual(self.manager.allocations, 2)  # Sprite base e variante
+
+        self.manager.load_sprite("test", (20, 10), flip_x=True)
+        self.assertEqual(self.manager.sprites.hits, 1)
+        self.assertEqual(self.manager.allocations, 2)
+
+    def test_flip_does_not_replace_base_sprite(self):
+        """Test che la variante specchiata non sostituisca lo sprite originale"""
+        base = self.manager.load_sprite("test", (20, 10))
+        flipped = self.manager.load_sprite("test", (20, 10), flip_x=True)
+
+        self.assertIsNot(base, flipped)
+        self.assertEqual(base.get_at((0, 5))[:3], (0, 0, 255))
+
+    def test_rotated_variant(self):
+        """Test variante ruotata tramite load_transformed"""
+        rotated = self.manager.load_transformed("test", (20, 10), angle=90)
+
+        self.assertEqual(rotated.get_size(), (10, 20))
+        self.assertIs(rotated, self.manager.load_transformed("test", (20, 10), angle=450))
+
+    def test_memory_budget_keeps_pinned_sprites(self):
+        """Test che il budget rimuova gli sprite non fissati ma non quelli del livello"""
+        self.manager.sprites.budget_bytes = 20 * 10 * 4 * 3
+        self.manager.pin_sprites([("test", (20, 10))])
+        pinned = self.manager.load_sprite("test", (20, 10))
+        flipped = self.manager.load_sprite("test", (20, 10), flip_x=True)
+        self.manager.load_sprite("test", (10, 10))
+        self.manager.load_sprite("test", (10, 20))
+
+        self.assertIs(self.manager.load_sprite("test", (20, 10)), pinned)
+        self.assertIs(self.manager.load_sprite("test", (20, 10), flip_x=True), flipped)
+        self.assertNotIn("test_(10, 10)", self.manager.sprites)
+        self.assertEqual(self.manager.get_cache_stats()['evictions'], 1)
+
+    def test_release_unpinned_is_silent(self):
+        """Test che il rilascio al cambio livello non scriva su stdout"""
+        self.manager.pin_sprites([("test", (20, 10))])
+        self.manager.load_sprite("test", (20, 10))
+        self.manager.load_sprite("test", (10, 10))
+
+        with patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            released = self.manager.release_unpinned()
+
+        self.assertEqual(released, 1)
+        self.assertEqual(stdout.getvalue(), "")
+        self.assertIn("test_(20, 10)", self.manager.sprites)
+
+
+class TestAssetPipeline(unittest.TestCase):
+    """Test per la pipeline offline delle varianti pre-ridimensionate"""
+
+    def setUp(self):
+        """Setup per ogni test"""
+        pygame.display.init()
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+
+        self.sprite_dir = tempfile.mkdtemp()
+        image = pygame.Surface((200, 100), pygame.SRCALPHA)
+        image.fill((0, 255, 0, 255))
+        self.source_path = os.path.join(self.sprite_dir, "test.png")
+        pygame.image.save(image, self.source_path)
+
+        self.manager = SpriteManager()
+        self.manager.sprite_path = self.sprite_dir
+        self.manager.disk_cache = None
+
+    def tearDown(self):
+        """Cleanup dopo ogni test"""
+        shutil.rmtree(self.sprite_dir)
+        pygame.display.quit()
+
+    def test_game_variants_cover_backgrounds(self):
+        """Test che le varianti includano tutti i fondali dei livelli"""
+        names = [name for name, _ in get_sprite_variants()]
+        self.assertIn("fondale1", names)
+        self.assertIn("fondale 4", names)
+        self.assertIn("cavaliereariposo", names)
+
+    def test_prescaled_variant_is_loaded(self):
+        """Test che lo SpriteManager carichi la variante senza decodificare l'originale"""
+        build_variants(self.sprite_dir, [("test", (20, 10))])
+
+        with patch('pygame.image.load', wraps=pygame.image.load) as mock_load, \
+             patch('pygame.transform.scale') as mock_scale:
+            sprite = self.manager.load_sprite("test", (20, 10))
+
+        self.assertEqual(sprite.get_size(), (20, 10))
+        mock_scale.assert_not_called()
+        loaded_path = mock_load.call_args[0][0]
+        self.assertIn("generated", loaded_path)
+
+    def test_missing_variant_falls_back_to_runtime_scaling(self):
+        """Test del fallback allo scaling a runtime per dimensioni non generate"""
+        build_variants(self.sprite_dir, [("test", (20, 10))])
+
+        sprite = self.manager.load_sprite("test", (40, 20))
+        self.assertEqual(sprite.get_size(), (40, 20))
+
+    def test_touched_source_keeps_variant(self):
+        """Test che un originale con mtime diverso ma stesso contenuto usi la variante"""
+        build_variants(self.sprite_dir, [("test", (20, 10))])
+        os.utime(self.source_path, (0, 0))
+
+        with patch('pygame.image.load', wraps=pygame.image.load) as mock_load:
+            self.manager.load_sprite("test", (20, 10))
+
+        self.assertIn("generated", mock_load.call_args[0][0])
+
+    def test_stale_variant_is_ignored(self):
+        """Test che una variante di un originale modificato venga ignorata"""
+        build_variants(self.sprite_dir, [("test", (20, 10))])
+        image = pygame.Surface((200, 100), pygame.SRCALPHA)
+        image.fill((255, 0, 0, 255))
+        pygame.image.save(image, self.source_path)
+
+        with patch('pygame.image.load', wraps=pygame.image.load) as mock_load:
+            self.manager.load_sprite("test", (20, 10))
+
+        self.assertEqual(mock_load.call_args[0][0], self.source_path)
+
+
+class TestSpriteDiskCache(unittest.TestCase):
+    """Test per la cache su disco dei pixel decodificati"""
+
+    def setUp(self):
+        """Setup per ogni test"""
+        pygame.display.init()
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+
+        self.sprite_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.sprite_dir, "cache")
+        image = pygame.Surface((200, 100), pygame.SRCALPHA)
+        image.fill((0, 0, 255, 128))
+        self.source_path = os.path.join(self.sprite_dir, "test.png")
+        pygame.image.save(image, self.source_path)
+
+    def tearDown(self):
+        """Cleanup dopo ogni test"""
+        shutil.rmtree(self.sprite_dir)
+        pygame.display.quit()
+
+    def _new_manager(self) -> SpriteManager:
+        """Crea uno SpriteManager vuoto, come a un nuovo avvio"""
+        manager = SpriteManager()
+        manager.sprite_path = self.sprite_dir
+        manager.disk_cache = SpriteDiskCache(self.cache_dir)
+        return manager
+
+    def test_second_launch_skips_png_decode(self):
+        """Test che al secondo avvio lo sprite venga ricostruito dai byte grezzi"""
+        first = self._new_manager().load_sprite("test", (20, 10))
+
+        manager = self._new_manager()
+        with patch('pygame.image.load') as mock_load:
+            sprite = manager.load_sprite("test", (20, 10))
+
+        mock_load.assert_not_called()
+        self.assertEqual(manager.disk_cache.hits, 1)
+        self.assertEqual(sprite.get_size(), (20, 10))
+        self.assertEqual(sprite.get_at((5, 5)), first.get_at((5, 5)))
+
+    def test_size_change_misses(self):
+        """Test che una dimensione diversa non usi la voce in cache"""
+        self._new_manager().load_sprite("test", (20, 10))
+
+        cache = SpriteDiskCache(self.cache_dir)
+        self.assertIsNone(cache.load(self.source_path, (40, 20)))
+        self.assertIsNotNone(cache.load(self.source_path, (20, 10)))
+
+    def test_source_change_invalidates(self):
+        """Test che modificare il PNG sorgente invalidi la cache"""
+        self._new_manager().load_sprite("test", (20, 10))
+
+        image = pygame.Surface((200, 100), pygame.SRCALPHA)
+        image.fill((255, 0, 0, 255))
+        pygame.image.save(image, self.source_path)
+        os.utime(self.source_path, (1, 1))
+
+        sprite = self._new_manager().load_sprite("test", (20, 10))
+        self.assertEqual(sprite.get_at((5, 5))[:3], (255, 0, 0))
+
+
+class TestSpritePreload(unittest.TestCase):
+    """Test per il preload in background degli sprite"""
+
+    def setUp(self):
+        """Setup per ogni test"""
+        pygame.display.init()
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+
+        self.sprite_dir = tempfile.mkdtemp()
+        for name in ("uno", "due", "tre"):
+            image = pygame.Surface((60, 40), pygame.SRCALPHA)
+            image.fill((0, 255, 0, 255))
+            pygame.image.save(image, os.path.join(self.sprite_dir, f"{name}.png"))
+
+        self.manager = SpriteManager()
+        self.manager.sprite_path = self.sprite_dir
+        self.manager.disk_cache = None
+        self.sprites = [("uno", (30, 20)), ("due", (30, 20)), ("tre", None)]
+
+    def tearDown(self):
+        """Cleanup dopo ogni test"""
+        shutil.rmtree(self.sprite_dir)
+        pygame.display.quit()
+
+    def test_threaded_preload_fills_cache(self):
+        """Test che dopo il preload gli sprite non vengano più decodificati"""
+        job = self.manager.preload(self.sprites, max_workers=2)
+        job.wait()
+
+        self.assertTrue(job.done)
+        self.assertEqual(job.progress, 1.0)
+        with patch('pygame.image.load') as mock_load:
+            sprite = self.manager.load_sprite("uno", (30, 20))
+            self.manager.load_sprite("tre")
+
+        mock_load.assert_not_called()
+        self.assertEqual(sprite.get_size(), (30, 20))
+
+    def test_cooperative_preload_one_sprite_per_poll(self):
+        """Test che in modalità cooperativa ogni poll decodifichi un solo sprite"""
+        job = self.manager.preload(self.sprites, max_workers=0)
+
+        self.assertEqual(job.progress, 0.0)
+        self.assertAlmostEqual(job.poll(), 1 / 3)
+        self.assertAlmostEqual(job.poll(), 2 / 3)
+        self.assertFalse(job.done)
+        self.assertEqual(job.poll(), 1.0)
+        self.assertTrue(job.done)
+
+    def test_cached_sprites_are_skipped(self):
+        """Test che gli sprite già in cache non vengano rimessi in coda"""
+        self.manager.load_sprite("uno", (30, 20))
+
+        job = self.manager.preload(self.sprites + [("due", (30, 20))], max_workers=0)
+
+        self.assertEqual(job.total, 2)
+
+    def test_missing_sprite_gets_fallback(self):
+        """Test che uno sprite mancante diventi il rettangolo magenta"""
+        job = self.manager.preload([("manca", (10, 10))], max_workers=1)
+        job.wait()
+
+        sprite = self.manager.load_sprite("manca", (10, 10))
+        self.assertEqual(sprite.get_at((0, 0))[:3], (255, 0, 255))
+
+    def test_unexpected_decode_error_falls_back_to_sync_load(self):
+        """Test che un errore imprevisto nel thread ricarichi lo sprite in modo sincrono"""
+        decode = self.manager._decode_sprite
+        with patch.object(self.manager, '_decode_sprite',
+                          side_effect=[RuntimeError("thread"), decode("uno", (30, 20))]):
+            job = self.manager.preload([("uno", (30, 20))], max_workers=1)
+            job.wait()
+
+        self.assertTrue(job.done)
+        sprite = self.manager.load_sprite("uno", (30, 20))
+        self.assertEqual(sprite.get_size(), (30, 20))
+        self.assertEqual(sprite.get_at((0, 0))[:3], (0, 255, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
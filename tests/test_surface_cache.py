@@ -0,0 +1,99 @@
+"""
+Test unitari per la cache delle superfici con budget di memoria
+"""
+import unittest
+import pygame
+from src.surface_cache import SurfaceCache, get_surface_bytes
+
+
+def make_surface(width: int = 10, height: int = 10) -> pygame.Surface:
+    """Crea una superficie a 32 bit (4 byte per pixel)"""
+    return pygame.Surface((width, height), pygame.SRCALPHA, 32)
+
+
+class TestSurfaceCache(unittest.TestCase):
+    """Test per la classe SurfaceCache"""
+
+    def setUp(self):
+        """Setup per ogni test: budget per esattamente due superfici 10x10"""
+        self.cache = SurfaceCache(budget_bytes=800)
+
+    def test_surface_bytes(self):
+        """Test stima della memoria di una superficie"""
+        self.assertEqual(get_surface_bytes(make_surface(20, 10)), 800)
+
+    def test_lru_eviction_over_budget(self):
+        """Test che oltre il budget venga rimossa la superficie meno usata"""
+        self.cache.put("a", make_surface())
+        self.cache.put("b", make_surface())
+        self.cache.get("a")
+        self.cache.put("c", make_surface())
+
+        self.assertIn("a", self.cache)
+        self.assertNotIn("b", self.cache)
+        self.assertIn("c", self.cache)
+        self.assertEqual(self.cache.evictions, 1)
+        self.assertEqual(self.cache.get_resident_bytes(), 800)
+
+    def test_pinned_group_is_not_evicted(self):
+        """Test che i gruppi fissati sopravvivano anche oltre il budget"""
+        self.cache.put("base", make_surface())
+        self.cache.put("base_flip", make_surface(), group="base")
+        self.cache.pin(["base"])
+        self.cache.put("altro", make_surface())
+
+        self.assertIn("base", self.cache)
+        self.assertIn("base_flip", self.cache)
+        self.assertIn("altro", self.cache)
+        self.assertEqual(self.cache.get_resident_bytes(), 1200)
+
+    def test_unpinned_groups_released_when_pin_changes(self):
+        """Test che cambiando i gruppi fissati il vecchio livello venga rimosso"""
+        self.cache.pin(["vecchio"])
+        self.cache.put("vecchio", make_surface())
+
+        self.cache.pin(["nuovo1", "nuovo2"])
+        self.cache.put("nuovo1", make_surface())
+        self.cache.put("nuovo2", make_surface())
+
+        self.assertNotIn("vecchio", self.cache)
+        self.assertEqual(len(self.cache), 2)
+
+    def test_trim_removes_unpinned(self):
+        """Test che trim() lasci solo le superfici fissate"""
+        self.cache.put("a", make_surface())
+        self.cache.put("b", make_surface())
+        self.cache.pin(["a"])
+
+        self.assertEqual(self.cache.trim(), 1)
+        self.assertEqual(list(self.cache.surfaces), ["a"])
+
+    def test_stats(self):
+        """Test delle statistiche di hit rate"""
+        self.cache.put("a", make_surface())
+        self.cache.get("a")
+        self.cache.get("manca")
+
+        stats = self.cache.get_stats()
+        self.assertEqual(stats['entries'], 1)
+        self.assertEqual(stats['resident_bytes'], 400)
+        self.assertEqual(stats['hit_rate'], 0.5)
+
+    def test_unrecorded_get_skips_stats(self):
+        """Test che le ricerche interne non cambino hit e miss"""
+        self.cache.put("a", make_surface())
+        self.cache.get("a", record=False)
+        self.cache.get("manca", record=False)
+
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 0))
+
+    def test_replacing_key_updates_bytes(self):
+        """Test che reinserire una chiave non conti due volte i byte"""
+        self.cache.put("a", make_surface())
+        self.cache.put("a", make_surface(5, 10))
+
+        self.assertEqual(self.cache.get_resident_bytes(), 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
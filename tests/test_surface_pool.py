@@ -0,0 +1,43 @@
+"""
+Test unitari per il pool delle superfici di overlay
+"""
+import unittest
+from src.surface_pool import OverlayPool
+
+
+class TestOverlayPool(unittest.TestCase):
+    """Test per la classe OverlayPool"""
+
+    def setUp(self):
+        """Setup per ogni test"""
+        self.pool = OverlayPool()
+
+    def test_same_key_reuses_surface(self):
+        """Test che a regime non vengano allocate nuove superfici"""
+        first = self.pool.get((40, 20), (255, 255, 0), 100)
+        for _ in range(10):
+            surface = self.pool.get((40, 20), (255, 255, 0), 100)
+
+        self.assertIs(first, surface)
+        self.assertEqual(self.pool.allocations, 1)
+        self.assertEqual(self.pool.hits, 10)
+
+    def test_surface_properties(self):
+        """Test dimensione, colore e trasparenza della superficie"""
+        surface = self.pool.get((35, 25), (255, 100, 0), 120)
+
+        self.assertEqual(surface.get_size(), (35, 25))
+        self.assertEqual(surface.get_alpha(), 120)
+        self.assertEqual(surface.get_at((0, 0))[:3], (255, 100, 0))
+
+    def test_different_keys_allocate(self):
+        """Test che chiavi diverse producano superfici diverse"""
+        self.pool.get((40, 20), (255, 255, 0), 100)
+        self.pool.get((40, 20), (255, 0, 0), 100)
+        self.pool.get((40, 20), (255, 255, 0), 120)
+
+        self.assertEqual(self.pool.allocations, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+"""
+Test unitari per la mappa del terreno
+"""
+import unittest
+from src.config import GROUND_Y
+from src.platform import Ramp
+from src.terrain import TerrainMap
+
+
+class TestTerrainMap(unittest.TestCase):
+    """Test per la classe TerrainMap"""
+
+    def test_flat_ground(self):
+        """Test che senza geometria il terreno sia il suolo ovunque"""
+        terrain = TerrainMap()
+
+        self.assertEqual(terrain.ground_height(0), GROUND_Y)
+        self.assertEqual(terrain.ground_height(500.7), GROUND_Y)
+
+    def test_ramp_matches_interpolation(self):
+        """Test che il terreno sulla rampa coincida con get_height_at_x"""
+        ramp = Ramp(100, GROUND_Y, 200, 50, slope_up=True)
+        terrain = TerrainMap(ramps=[ramp])
+
+        for x in range(100, 301, 10):
+            self.assertEqual(terrain.ground_height(x), int(ramp.get_height_at_x(x)))
+        self.assertEqual(terrain.ground_height(50), GROUND_Y)
+
+    def test_columns_are_clamped(self):
+        """Test che le x fuori dal livello usino le colonne ai bordi"""
+        ramp = Ramp(0, GROUND_Y, 100, 50, slope_up=False)
+        terrain = TerrainMap(ramps=[ramp], width=100)
+
+        self.assertEqual(terrain.ground_height(-50), terrain.ground_height(0))
+        self.assertEqual(terrain.ground_height(500), terrain.ground_height(99))
+        self.assertLess(terrain.ground_height(-50), terrain.ground_height(500))
+
+    def test_is_built_from(self):
+        """Test che la mappa riconosca rampe sostituite o modificate"""
+        ramps = [Ramp(200, GROUND_Y, 100, 20)]
+        terrain = TerrainMap(ramps)
+
+        self.assertTrue(terrain.is_built_from(ramps))
+        self.assertFalse(terrain.is_built_from(list(ramps)))
+        ramps.append(Ramp(0, GROUND_Y, 100, 20))
+        self.assertFalse(terrain.is_built_from(ramps))
+
+
+if __name__ == '__main__':
+    unittest.main()
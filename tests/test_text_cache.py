@@ -0,0 +1,65 @@
+"""
+Test unitari per la cache del testo
+"""
+import unittest
+from unittest.mock import Mock
+import pygame
+from src.text_cache import TextCache
+
+
+class TestTextCache(unittest.TestCase):
+    """Test per la classe TextCache"""
+
+    def setUp(self):
+        """Setup per ogni test"""
+        self.cache = TextCache(max_entries=2)
+        self.font = Mock()
+        self.font.render.side_effect = lambda text, antialias, color: Mock(name=text)
+
+    def test_repeated_text_renders_once(self):
+        """Test che lo stesso testo venga rasterizzato una sola volta"""
+        first = self.cache.render(self.font, "Salute: 100/100", (255, 255, 255))
+        second = self.cache.render(self.font, "Salute: 100/100", (255, 255, 255))
+
+        self.assertIs(first, second)
+        self.assertEqual(self.font.render.call_count, 1)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_color_is_part_of_key(self):
+        """Test che colori diversi producano superfici diverse"""
+        self.cache.render(self.font, "Tempo", (255, 255, 255))
+        self.cache.render(self.font, "Tempo", (255, 0, 0))
+
+        self.assertEqual(self.font.render.call_count, 2)
+
+    def test_lru_eviction(self):
+        """Test che venga scartata la voce usata meno di recente"""
+        self.cache.render(self.font, "a", (0, 0, 0))
+        self.cache.render(self.font, "b", (0, 0, 0))
+        self.cache.render(self.font, "a", (0, 0, 0))
+        self.cache.render(self.font, "c", (0, 0, 0))
+
+        self.assertEqual(len(self.cache.surfaces), 2)
+        self.cache.render(self.font, "a", (0, 0, 0))
+        self.assertEqual(self.font.render.call_count, 3)
+
+    def test_hit_rate(self):
+        """Test calcolo dell'hit rate"""
+        self.assertEqual(self.cache.get_hit_rate(), 0.0)
+        self.cache.render(self.font, "a", (0, 0, 0))
+        self.cache.render(self.font, "a", (0, 0, 0))
+        self.assertEqual(self.cache.get_hit_rate(), 0.5)
+
+    def test_cache_is_cleared_by_every_pygame_quit(self):
+        """Test che la cache venga svuotata a ogni pygame.quit(), anche dopo un riavvio"""
+        for _ in range(2):
+            pygame.init()
+            self.cache.render(self.font, "a", (0, 0, 0))
+            self.assertEqual(len(self.cache.surfaces), 1)
+            pygame.quit()
+            self.assertEqual(len(self.cache.surfaces), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Test unitari per il tracing degli span
+"""
+import json
+import os
+import tempfile
+import unittest
+from src.tracing import Tracer, _NULL_SPAN
+
+
+class TestTracer(unittest.TestCase):
+    """Test per la classe Tracer"""
+
+    def setUp(self):
+        """Setup per ogni test"""
+        self.tracer = Tracer(capacity=4, enabled=True)
+
+    def test_disabled_tracer_is_noop(self):
+        """Test che da spento non vengano registrati span né creati wrapper"""
+        tracer = Tracer(capacity=4)
+
+        def function():
+            return 42
+
+        self.assertIs(tracer.span("update"), _NULL_SPAN)
+        self.assertIs(tracer.traced()(function), function)
+        with tracer.span("update"):
+            pass
+        self.assertEqual(tracer.get_span_count(), 0)
+        self.assertIsNone(tracer.dump())
+
+    def test_span_and_decorator_record(self):
+        """Test che span e funzioni decorate finiscano nella traccia"""
+        @self.tracer.traced("load")
+        def load():
+            return "sprite"
+
+        with self.tracer.span("update"):
+            self.assertEqual(load(), "sprite")
+
+        events = self.tracer.to_chrome_trace()['traceEvents']
+        self.assertEqual([event['name'] for event in events], ["update", "load"])
+        update, inner = events
+        self.assertEqual(update['ph'], 'X')
+        self.assertLessEqual(update['ts'], inner['ts'])
+        self.assertGreaterEqual(update['ts'] + update['dur'], inner['ts'] + inner['dur'])
+
+    def test_ring_buffer_keeps_latest_spans(self):
+        """Test che a buffer pieno vengano sovrascritti gli span più vecchi"""
+        for i in range(6):
+            with self.tracer.span(f"span{i}"):
+                pass
+
+        events = self.tracer.to_chrome_trace()['traceEvents']
+        self.assertEqual(self.tracer.recorded, 6)
+        self.assertEqual([event['name'] for event in events],
+                         ["span2", "span3", "span4", "span5"])
+
+    def test_dump_writes_trace_event_json(self):
+        """Test che la traccia venga scritta in JSON leggibile da chrome://tracing"""
+        with self.tracer.span("draw"):
+            pass
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "trace.json")
+            self.assertEqual(self.tracer.dump(path), path)
+            with open(path, "r", encoding="utf-8") as trace_file:
+                trace = json.load(trace_file)
+
+        self.assertEqual(trace['traceEvents'][0]['name'], "draw")
+        self.assertEqual(trace['displayTimeUnit'], 'ms')
+
+
+if __name__ == '__main__':
+    unittest.main()